@@ -0,0 +1,264 @@
+"""
+Parser benchmarks over saved pages of every scraped source.
+
+Parses the listing and detail pages in tests/fixtures with the real parsing
+code (no network) and reports per source and stage the median parse time, peak
+memory allocated while parsing and items parsed per second. Results can be
+saved as JSON and compared against a run from another commit.
+
+The fixtures are small synthetic pages mirroring each source's markup, not
+recordings of the live sites, so the numbers only compare code revisions
+against each other and do not predict parse times on real pages.
+
+Usage:
+    python benchmark.py --rounds 50 --json before.json
+    python benchmark.py --backend lxml --compare before.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from scrapers import korean_news_scraper, parsing, tesla_extra_scraper
+from scrapers.news_sources import get_news_source
+
+FIXTURES = Path(__file__).parent / "tests" / "fixtures"
+
+SUBSIDY_URL = "https://tago.kr/subsidy/index.htm?model=Model%20Y&year=2025"
+
+# Fixture name -> news source name; listing and detail pages share the fixture name
+NEWS_FIXTURES = {
+    "naver": "Naver",
+    "motorgraph": "Motorgraph",
+    "auto_danawa": "AUTO.DANAWA",
+    "etnews": "ET News",
+    "heraldcorp": "Herald Economy",
+    "donga": "Donga.com",
+    "edaily": "Edaily",
+    "chosunbiz": "ChosunBiz",
+    "autodaily": "AutoDaily",
+    "itchosun": "IT Chosun",
+}
+
+
+def count_items(result) -> int:
+    """Number of items a parser produced (lists count per entry, text counts once if not empty)"""
+    if isinstance(result, tuple):
+        return len(result[1])
+    if isinstance(result, list):
+        return len(result)
+    return 1 if result else 0
+
+
+def build_cases() -> List[Dict[str, Any]]:
+    """
+    Collect the benchmark cases for all sources.
+
+    Returns:
+        List of dictionaries with source, stage ("listing" or "detail"), parse callable and fixture path
+    """
+    cases = []
+    for fixture, name in NEWS_FIXTURES.items():
+        source = get_news_source(name)
+        cases.append(
+            {
+                "source": name,
+                "stage": "listing",
+                "parse": partial(korean_news_scraper.parse_news_listing, source),
+                "path": FIXTURES / "listing" / f"{fixture}.html",
+            }
+        )
+        cases.append(
+            {
+                "source": name,
+                "stage": "detail",
+                "parse": korean_news_scraper.get_detail_parser(source),
+                "path": FIXTURES / "detail" / f"{fixture}.html",
+            }
+        )
+    cases += [
+        {
+            "source": "Naver Blog",
+            "stage": "listing",
+            "parse": tesla_extra_scraper.parse_naver_blog_page,
+            "path": FIXTURES / "listing" / "naver_blog.json",
+        },
+        {
+            "source": "Clien",
+            "stage": "listing",
+            "parse": tesla_extra_scraper.parse_clien_listing,
+            "path": FIXTURES / "listing" / "clien.html",
+        },
+        {
+            "source": "Clien",
+            "stage": "detail",
+            "parse": tesla_extra_scraper.parse_clien_detail,
+            "path": FIXTURES / "detail" / "clien.html",
+        },
+        {
+            "source": "DCinside",
+            "stage": "listing",
+            "parse": tesla_extra_scraper.parse_dcinside_listing,
+            "path": FIXTURES / "listing" / "dcinside.html",
+        },
+        {
+            "source": "DCinside",
+            "stage": "detail",
+            "parse": tesla_extra_scraper.parse_dcinside_detail,
+            "path": FIXTURES / "detail" / "dcinside.html",
+        },
+        {
+            "source": "Subsidy",
+            "stage": "listing",
+            "parse": tesla_extra_scraper.parse_subsidy_index,
+            "path": FIXTURES / "listing" / "subsidy.html",
+        },
+        {
+            "source": "Subsidy",
+            "stage": "detail",
+            "parse": partial(
+                tesla_extra_scraper.parse_subsidy_table,
+                year="2025",
+                model_text="테슬라 Model Y RWD",
+                url=SUBSIDY_URL,
+            ),
+            "path": FIXTURES / "detail" / "subsidy.html",
+        },
+    ]
+    return cases
+
+
+def measure(parse: Callable[[str], Any], text: str, rounds: int = 20, warmup: int = 2) -> Dict[str, Any]:
+    """
+    Time a parser on one page and measure its allocations.
+
+    Timing and allocation tracking are separate runs, since tracemalloc slows
+    allocation-heavy code down considerably.
+
+    Args:
+        parse: Parser taking the page text
+        text: Page text
+        rounds: Number of timed runs
+        warmup: Number of untimed runs before timing
+
+    Returns:
+        Dictionary with items, median_ms, min_ms, peak_kib and items_per_second
+    """
+    for _ in range(warmup):
+        parse(text)
+
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = parse(text)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        parse(text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    items = count_items(result)
+    median = statistics.median(timings)
+    return {
+        "items": items,
+        "median_ms": round(median * 1000, 3),
+        "min_ms": round(min(timings) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+        "items_per_second": round(items / median, 1) if median else None,
+    }
+
+
+def run_benchmarks(rounds: int = 20, backend: Optional[str] = None, sources: Optional[List[str]] = None):
+    """
+    Benchmark every source's listing and detail parsing.
+
+    Args:
+        rounds: Number of timed runs per case
+        backend: Parser backend for detail pages (default: PARSER_BACKEND)
+        sources: Only benchmark these source names (default: all)
+
+    Returns:
+        List of result dictionaries (source, stage, bytes and the fields of measure())
+    """
+    if backend:
+        # Fail loudly instead of silently benchmarking the html.parser fallback
+        parsing.create_parser_backend(backend)
+        parsing.PARSER_BACKEND = backend
+
+    results = []
+    for case in build_cases():
+        if sources and case["source"] not in sources:
+            continue
+        text = case["path"].read_text(encoding="utf-8")
+        result = {"source": case["source"], "stage": case["stage"], "bytes": len(text.encode("utf-8"))}
+        result.update(measure(case["parse"], text, rounds))
+        results.append(result)
+    return results
+
+
+def format_results(results: List[Dict[str, Any]], baseline: Optional[List[Dict[str, Any]]] = None) -> str:
+    """
+    Format benchmark results as a text table.
+
+    Args:
+        results: Results of run_benchmarks()
+        baseline: Earlier results to show the median time change against
+
+    Returns:
+        Table as string
+    """
+    previous = {(r["source"], r["stage"]): r for r in baseline or []}
+    lines = [f"{'source':<16}{'stage':<9}{'items':>6}{'median ms':>11}{'peak KiB':>10}{'items/s':>11}{'change':>9}"]
+    for r in results:
+        change = ""
+        before = previous.get((r["source"], r["stage"]))
+        if before and before["median_ms"]:
+            change = f"{(r['median_ms'] / before['median_ms'] - 1) * 100:+.1f}%"
+        lines.append(
+            f"{r['source']:<16}{r['stage']:<9}{r['items']:>6}{r['median_ms']:>11.3f}{r['peak_kib']:>10.1f}"
+            f"{r['items_per_second'] or 0:>11.1f}{change:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """
+    Command line entry point.
+
+    Runs the benchmarks, prints a table and optionally saves or compares JSON results.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark scraper parsing on saved pages of every source")
+    parser.add_argument("--rounds", type=int, default=20, help="timed runs per case")
+    parser.add_argument("--backend", help="parser backend for detail pages (html.parser, lxml, selectolax)")
+    parser.add_argument("--source", action="append", help="only benchmark this source (repeatable)")
+    parser.add_argument("--json", help="save results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.rounds, args.backend, args.source)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print(format_results(results, baseline))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {"backend": args.backend or "default", "rounds": args.rounds, "results": results},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
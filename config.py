@@ -22,6 +22,17 @@ REDIS_URL = os.getenv("REDIS_URL")
 REDIS_NEWS_EXPIRE_SECONDS = int(os.getenv("REDIS_NEWS_EXPIRE_SECONDS", 86400))  # default 1 day
 REDIS_CHANNEL_MESSAGES_KEY = os.getenv("REDIS_CHANNEL_MESSAGES_KEY", "channel:messages")
 REDIS_MAX_MESSAGES = int(os.getenv("REDIS_MAX_MESSAGES", 300))
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 20))  # connection pool size per client
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 5))  # seconds per command / connection attempt
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))  # ping idle connections before reuse
+REDIS_RETRIES = int(os.getenv("REDIS_RETRIES", 3))  # reconnect attempts of a command after a connection error
+NEWS_DEDUP_MODE = os.getenv("NEWS_DEDUP_MODE", "exact")  # "exact" (one key per item) or "bloom" (daily filters)
+NEWS_BLOOM_CAPACITY = int(os.getenv("NEWS_BLOOM_CAPACITY", 50000))  # items per day a Bloom filter is sized for
+NEWS_BLOOM_ERROR_RATE = float(os.getenv("NEWS_BLOOM_ERROR_RATE", 0.001))  # Bloom false positive rate
+LOCAL_SEEN_CACHE_SIZE = int(os.getenv("LOCAL_SEEN_CACHE_SIZE", 20000))  # seen keys kept in memory (0 disables)
+LOCAL_SEEN_CACHE_TTL = int(os.getenv("LOCAL_SEEN_CACHE_TTL", 7200))  # seconds a seen key is answered from memory
+FALLBACK_CACHE_MAX_ENTRIES = int(os.getenv("FALLBACK_CACHE_MAX_ENTRIES", 100000))  # keys held without Redis
+FALLBACK_CACHE_MAX_LIST_LENGTH = int(os.getenv("FALLBACK_CACHE_MAX_LIST_LENGTH", 1000))  # values per list without Redis
 
 # Database settings
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -30,10 +41,24 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 DEFAULT_LANGUAGE = os.getenv("DEFAULT_LANGUAGE", "ko")  # "ko" or "en"
 SCRAPE_INTERVAL = int(os.getenv("SCRAPE_INTERVAL", 1800))  # default 1800 seconds (30 minutes)
 FIRST_SCRAPE_DELAY = int(os.getenv("FIRST_SCRAPE_DELAY", 10))  # delay before first scrape (seconds)
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", 32))  # chunks buffered between pipeline stages
+PIPELINE_FLUSH_SECONDS = float(os.getenv("PIPELINE_FLUSH_SECONDS", 5))  # idle time before a partial batch is analyzed
 
 # Search keywords
 SEARCH_KEYWORDS = os.getenv("SEARCH_KEYWORDS", "테슬라,tesla").split(",")
 
+# Scraping engine settings
+SCRAPE_DEADLINE = int(os.getenv("SCRAPE_DEADLINE", 300))  # overall deadline for one collection cycle (seconds)
+SCRAPE_MAX_WORKERS = int(os.getenv("SCRAPE_MAX_WORKERS", 16))  # worker threads running blocking scrapers
+SCRAPE_SOURCE_CONCURRENCY = int(os.getenv("SCRAPE_SOURCE_CONCURRENCY", 2))  # concurrent keyword runs per source
+DETAIL_FETCH_CONCURRENCY = int(os.getenv("DETAIL_FETCH_CONCURRENCY", 8))  # concurrent article detail requests
+SKIP_SEEN_URLS = os.getenv("SKIP_SEEN_URLS", "true").lower() == "true"  # skip detail pages collected before
+INCREMENTAL_LISTING = os.getenv("INCREMENTAL_LISTING", "true").lower() == "true"  # page until known content
+LISTING_MAX_PAGES = int(os.getenv("LISTING_MAX_PAGES", 5))  # listing pages read per source and keyword
+PARSE_PROCESSES = int(os.getenv("PARSE_PROCESSES", 0))  # HTML parser worker processes (0 = parse in scraper threads)
+PARSER_BACKEND = os.getenv("PARSER_BACKEND", "html.parser")  # "html.parser", "lxml" or "selectolax"
+PARSE_BODY_ONLY = os.getenv("PARSE_BODY_ONLY", "true").lower() == "true"  # build only the article body subtree
+
 # Webhook settings (example: https://yourdomain.com/<bot_token>)
 WEBHOOK_URL = os.getenv("WEBHOOK_URL")  # must be an externally accessible HTTPS URL
 WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", 8080))
@@ -46,6 +71,25 @@ HTTP_TIMEOUT_SOCK_CONNECT = int(os.getenv("HTTP_TIMEOUT_SOCK_CONNECT", 10))
 HTTP_TIMEOUT_SOCK_READ = int(os.getenv("HTTP_TIMEOUT_SOCK_READ", 20))
 HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", 2))
 HTTP_MAX_CONCURRENCY = int(os.getenv("HTTP_MAX_CONCURRENCY", 10))
+HTTP_RETRY_BASE_DELAY = float(os.getenv("HTTP_RETRY_BASE_DELAY", 0.5))  # first retry's backoff cap, doubled per retry
+HTTP_RETRY_MAX_DELAY = float(os.getenv("HTTP_RETRY_MAX_DELAY", 8))  # longest wait before a retry (incl. Retry-After)
+HTTP_RETRY_BUDGET = int(os.getenv("HTTP_RETRY_BUDGET", 20))  # retries shared by all scraper batch requests of one cycle
+HTTP_POOL_MAX_HANDLES = int(os.getenv("HTTP_POOL_MAX_HANDLES", 16))  # idle pycurl handles kept for reuse
+HTTP_CONDITIONAL_GET = os.getenv("HTTP_CONDITIONAL_GET", "true").lower() == "true"  # revalidate listing pages
+HTTP_VALIDATOR_EXPIRE_SECONDS = int(os.getenv("HTTP_VALIDATOR_EXPIRE_SECONDS", 604800))  # default 7 days
+HTTP_COMPRESSION = os.getenv("HTTP_COMPRESSION", "true").lower() == "true"  # request gzip/deflate/brotli bodies
+DNS_CACHE_TTL = int(os.getenv("DNS_CACHE_TTL", 300))  # seconds resolved scraper host addresses are reused
+HAPPY_EYEBALLS_DELAY = float(os.getenv("HAPPY_EYEBALLS_DELAY", 0.25))  # seconds before racing the other IP family
+HTML_ARCHIVE_DIR = os.getenv("HTML_ARCHIVE_DIR", "")  # archive every fetched body here (empty = disabled)
+HTML_ARCHIVE_ZSTD_LEVEL = int(os.getenv("HTML_ARCHIVE_ZSTD_LEVEL", 10))  # zstd compression level of archived bodies
+
+# Per-host rate limiting and circuit breaker settings for scrapers
+HOST_RATE_LIMIT = float(os.getenv("HOST_RATE_LIMIT", 5))  # requests per second per host
+HOST_RATE_BURST = float(os.getenv("HOST_RATE_BURST", 10))  # burst size per host
+HOST_RATE_MIN = float(os.getenv("HOST_RATE_MIN", 0.5))  # lowest rate after repeated 429/503 responses
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", 5))  # consecutive failures before opening
+BREAKER_COOLDOWN = int(os.getenv("BREAKER_COOLDOWN", 300))  # seconds before a half-open probe is allowed
+BREAKER_MAX_RETRY_AFTER = int(os.getenv("BREAKER_MAX_RETRY_AFTER", 3600))  # longest Retry-After the breaker honours
 
 # Similarity check settings
 SIMILARITY_THRESHOLD = float(os.getenv("SIMILARITY_THRESHOLD", 0.8))
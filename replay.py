@@ -0,0 +1,323 @@
+"""
+Offline replay of the news processing pipeline.
+
+Records scraper output once, then runs run.process_news end to end against it
+with OpenAI, Telegram and Redis replaced by local stubs, so dedup, batching,
+formatting and similarity handling can be measured without any network access.
+
+Usage:
+    python replay.py record items.json
+    python replay.py replay items.json --scale 10 --analysis-latency 2 --send-latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import time
+from contextlib import ExitStack
+from typing import Any, AsyncGenerator, Dict, List, Optional
+from unittest import mock
+
+import analyzers.similarity_checker
+import analyzers.trust_evaluator
+import run
+import scrapers.http_client
+import scrapers.korean_news_scraper
+import scrapers.tesla_extra_scraper
+import telegram_bot.message_sender
+from config import LOCAL_SEEN_CACHE_SIZE, LOCAL_SEEN_CACHE_TTL
+from scrapers.data_fetcher import close_scrape_executor, collect_info_sources_async, collect_news_sources_async
+from scrapers.http_client import close_http_client
+from utils import cache
+from utils.local_cache import LocalCache
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+# Fields of one item in the text built by run.create_news_text
+NEWS_TEXT_ITEM = re.compile(
+    r"Title: (?P<title>.*?)\nContent: (?P<content>.*?)\nPublished: (?P<published>.*?)\n"
+    r"Source: (?P<source>.*?)\nURL: (?P<url>.*?)\n---",
+    re.DOTALL,
+)
+
+
+def isolate_cache(stack: ExitStack) -> None:
+    """
+    Replace Redis with a fresh in-memory cache for the rest of the stack's lifetime.
+
+    Nothing is read from or written to the configured REDIS_URL, and nothing is
+    deduplicated against earlier runs.
+
+    Args:
+        stack: ExitStack undoing the replacement on exit
+    """
+    fallback = cache.FallbackCache()
+    stack.enter_context(mock.patch.object(cache, "_redis_client", fallback))
+    stack.enter_context(mock.patch.object(cache, "_async_redis_client", cache.AsyncFallbackCache(fallback)))
+    stack.enter_context(
+        mock.patch.object(cache, "_seen_cache", LocalCache(LOCAL_SEEN_CACHE_SIZE, LOCAL_SEEN_CACHE_TTL))
+    )
+
+
+async def record(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Scrape all sources once and save the collected items for replay.
+
+    Scraping runs against an isolated in-memory cache with seen-URL skipping,
+    incremental listings and conditional GET turned off, so the recording holds
+    every item currently listed and production Redis is left untouched.
+
+    Args:
+        path: JSON file to write
+
+    Returns:
+        Dictionary with "news" and "info" item lists
+    """
+    with ExitStack() as stack:
+        isolate_cache(stack)
+        stack.enter_context(mock.patch.object(scrapers.korean_news_scraper, "SKIP_SEEN_URLS", False))
+        stack.enter_context(mock.patch.object(scrapers.korean_news_scraper, "INCREMENTAL_LISTING", False))
+        stack.enter_context(mock.patch.object(scrapers.tesla_extra_scraper, "INCREMENTAL_LISTING", False))
+        stack.enter_context(mock.patch.object(scrapers.http_client, "HTTP_CONDITIONAL_GET", False))
+        news_items, info_items = await asyncio.gather(collect_news_sources_async(), collect_info_sources_async())
+    recording = {"news": news_items, "info": info_items}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(recording, f, ensure_ascii=False, indent=2)
+    logger.info(f"Recorded {len(news_items)} news and {len(info_items)} info items to {path}")
+    return recording
+
+
+def load_recording(path: str, scale: int = 1) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load recorded items, multiplying them to simulate a higher volume.
+
+    Copies get a distinct URL and title so they are not removed as duplicates.
+
+    Args:
+        path: JSON file written by record()
+        scale: Number of copies of every item
+
+    Returns:
+        Dictionary with "news" and "info" item lists
+    """
+    with open(path, encoding="utf-8") as f:
+        recording = json.load(f)
+    scaled = {}
+    for source_type in ("news", "info"):
+        items = []
+        for copy in range(scale):
+            for item in recording.get(source_type, []):
+                item = dict(item)
+                if copy:
+                    item["url"] = f"{item.get('url', '')}#replay-{copy}"
+                    item["title"] = f"{item.get('title', '')} ({copy})"
+                items.append(item)
+        scaled[source_type] = items
+    return scaled
+
+
+async def replay_stream(
+    items: List[Dict[str, Any]], scrape_delay: float = 0.0
+) -> AsyncGenerator[List[Dict[str, Any]], None]:
+    """
+    Yield recorded items grouped by source, like scrapers.data_fetcher.stream_sources.
+
+    Args:
+        items: Recorded items
+        scrape_delay: Seconds to wait before each source's chunk, simulating scrape time
+    """
+    chunks: Dict[str, List[Dict[str, Any]]] = {}
+    for item in items:
+        chunks.setdefault(item.get("source", ""), []).append(item)
+    for chunk in chunks.values():
+        await asyncio.sleep(scrape_delay)
+        yield chunk
+
+
+class ReplayStubs:
+    """
+    Local stand-ins for OpenAI analysis, similarity checks and Telegram sends.
+
+    Each stub waits for the configured latency and records timing, so the
+    replay report shows where pipeline time goes.
+    """
+
+    def __init__(self, analysis_latency: float = 0.0, similarity_latency: float = 0.0, send_latency: float = 0.0):
+        self.analysis_latency = analysis_latency
+        self.similarity_latency = similarity_latency
+        self.send_latency = send_latency
+        self.analysis_calls = 0
+        self.analyzed_items = 0
+        self.similarity_calls = 0
+        self.sent: List[str] = []
+        self.send_times: List[float] = []
+
+    async def analyze_and_extract_fields(self, consolidated_text: str, language: str = "ko", source_type: str = "news"):
+        """Turn every item of the batch text into one analyzed entry"""
+        await asyncio.sleep(self.analysis_latency)
+        entries = [
+            {
+                "title": match.group("title").strip(),
+                "published": match.group("published").strip(),
+                "details": match.group("content").strip()[:200],
+                "trust": 0.9,
+                "trust_reason": "replay",
+                "urls": [match.group("url").strip()],
+            }
+            for match in NEWS_TEXT_ITEM.finditer(consolidated_text)
+        ]
+        self.analysis_calls += 1
+        self.analyzed_items += len(entries)
+        return {"useful_info": entries}
+
+    async def check_similarity(self, new_messages: list, stored_messages: list, language: str = "ko") -> list:
+        """Treat exact repeats of stored messages as already sent"""
+        await asyncio.sleep(self.similarity_latency)
+        self.similarity_calls += 1
+        stored = set(stored_messages)
+        return [
+            {"already_sent": message in stored, "max_similarity": 1.0 if message in stored else 0.0}
+            for message in new_messages
+        ]
+
+    async def send_message_to_channel(self, message: str):
+        """Record the message instead of sending it to Telegram"""
+        await asyncio.sleep(self.send_latency)
+        self.sent.append(message)
+        self.send_times.append(time.monotonic())
+
+
+def offline_batch_size(items: List[Dict[str, Any]]) -> int:
+    """
+    Estimate the analysis batch size, without tiktoken if its encoding cannot be loaded offline.
+
+    Args:
+        items: Items to batch
+
+    Returns:
+        Number of items per batch
+    """
+    try:
+        return analyzers.trust_evaluator.estimate_optimal_batch_size(items)
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable offline ({e.__class__.__name__}), estimating tokens from length")
+        # Korean text averages roughly one token per two characters
+        average_tokens = sum(len(json.dumps(item, ensure_ascii=False)) for item in items) / max(1, len(items)) / 2
+        available_tokens = analyzers.trust_evaluator.OPENAI_MAX_TOKENS - 5000
+        return max(1, int(available_tokens / max(1.0, average_tokens)))
+
+
+async def replay(
+    path: str,
+    scale: int = 1,
+    scrape_delay: float = 0.0,
+    analysis_latency: float = 0.0,
+    similarity_latency: float = 0.0,
+    send_latency: float = 0.0,
+    batch_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Run run.process_news against recorded items with all external services stubbed.
+
+    Args:
+        path: JSON file written by record()
+        scale: Number of copies of every recorded item
+        scrape_delay: Seconds before each source's items are released
+        analysis_latency: Simulated OpenAI analysis latency per batch in seconds
+        similarity_latency: Simulated similarity check latency per call in seconds
+        send_latency: Simulated Telegram latency per message in seconds
+        batch_size: Fixed analysis batch size (default: estimated like in production)
+
+    Returns:
+        Report with item and message counts, wall time, time to first send and throughput
+    """
+    recording = load_recording(path, scale)
+    stubs = ReplayStubs(analysis_latency, similarity_latency, send_latency)
+    items_total = len(recording["news"]) + len(recording["info"])
+
+    with ExitStack() as stack:
+        isolate_cache(stack)
+        stack.enter_context(
+            mock.patch.object(run, "stream_news_sources", lambda: replay_stream(recording["news"], scrape_delay))
+        )
+        stack.enter_context(
+            mock.patch.object(run, "stream_info_sources", lambda: replay_stream(recording["info"], scrape_delay))
+        )
+        stack.enter_context(
+            mock.patch.object(
+                run, "estimate_optimal_batch_size", (lambda items: batch_size) if batch_size else offline_batch_size
+            )
+        )
+        stack.enter_context(
+            mock.patch.object(analyzers.trust_evaluator, "analyze_and_extract_fields", stubs.analyze_and_extract_fields)
+        )
+        stack.enter_context(mock.patch.object(analyzers.similarity_checker, "check_similarity", stubs.check_similarity))
+        stack.enter_context(
+            mock.patch.object(telegram_bot.message_sender, "send_message_to_channel", stubs.send_message_to_channel)
+        )
+
+        started = time.monotonic()
+        await run.process_news()
+        elapsed = time.monotonic() - started
+
+    report = {
+        "items": items_total,
+        "analysis_calls": stubs.analysis_calls,
+        "analyzed_items": stubs.analyzed_items,
+        "similarity_calls": stubs.similarity_calls,
+        "messages_sent": len(stubs.sent),
+        "elapsed_seconds": round(elapsed, 3),
+        "first_send_seconds": round(stubs.send_times[0] - started, 3) if stubs.send_times else None,
+        "items_per_second": round(items_total / elapsed, 1) if elapsed else None,
+    }
+    logger.info(f"Replay report: {report}")
+    return report
+
+
+def main():
+    """
+    Command line entry point.
+
+    Parses arguments and records or replays scraper output.
+    """
+    parser = argparse.ArgumentParser(description="Record scraper output and replay it through process_news offline")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="scrape all sources once and save the items")
+    record_parser.add_argument("path", help="JSON file to write")
+
+    replay_parser = commands.add_parser("replay", help="run process_news against recorded items")
+    replay_parser.add_argument("path", help="JSON file written by the record command")
+    replay_parser.add_argument("--scale", type=int, default=1, help="copies of every recorded item")
+    replay_parser.add_argument("--scrape-delay", type=float, default=0.0, help="seconds before each source's items")
+    replay_parser.add_argument("--analysis-latency", type=float, default=0.0, help="seconds per analysis batch")
+    replay_parser.add_argument("--similarity-latency", type=float, default=0.0, help="seconds per similarity check")
+    replay_parser.add_argument("--send-latency", type=float, default=0.0, help="seconds per Telegram message")
+    replay_parser.add_argument("--batch-size", type=int, default=None, help="fixed analysis batch size")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        try:
+            asyncio.run(record(args.path))
+        finally:
+            close_scrape_executor()
+            close_http_client()
+    else:
+        report = asyncio.run(
+            replay(
+                args.path,
+                scale=args.scale,
+                scrape_delay=args.scrape_delay,
+                analysis_latency=args.analysis_latency,
+                similarity_latency=args.similarity_latency,
+                send_latency=args.send_latency,
+                batch_size=args.batch_size,
+            )
+        )
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
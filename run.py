@@ -1,14 +1,36 @@
 import asyncio
 import signal
-from typing import Any, Dict, List
+from typing import Any, AsyncGenerator, Awaitable, Dict, List
 
 from analyzers.trust_evaluator import estimate_optimal_batch_size
-from config import DEFAULT_LANGUAGE, FIRST_SCRAPE_DELAY, SCRAPE_INTERVAL, SIMILARITY_THRESHOLD
-from scrapers.data_fetcher import collect_info_sources, collect_news_sources
+from config import (
+    DEFAULT_LANGUAGE,
+    FIRST_SCRAPE_DELAY,
+    PIPELINE_FLUSH_SECONDS,
+    PIPELINE_QUEUE_SIZE,
+    SCRAPE_INTERVAL,
+    SIMILARITY_THRESHOLD,
+)
+from scrapers.archive import close_archive
+from scrapers.data_fetcher import (
+    close_scrape_executor,
+    get_scrape_executor,
+    preresolve_scraper_hosts,
+    stream_info_sources,
+    stream_news_sources,
+)
+from scrapers.http_client import close_http_client, log_transfer_stats, reset_retry_budget
+from scrapers.parsing import close_parse_pool
 from telegram_bot.bot import create_application, run_webhook
 from telegram_bot.message_formatter import format_detailed_message
 from utils.async_utils import close_session
-from utils.cache import get_channel_messages, is_duplicate, store_channel_message
+from utils.cache import (
+    close_async_redis_client,
+    filter_new_items_async,
+    get_channel_messages_async,
+    log_cache_stats,
+    store_channel_message_async,
+)
 from utils.logger import setup_logger
 
 logger = setup_logger()
@@ -105,91 +127,142 @@ async def process_news_batch(
     return format_detailed_message(batch_result, source_type, language=DEFAULT_LANGUAGE, url_mapping=url_mapping)
 
 
-async def process_content_type(items: List[Dict[str, Any]], source_type: str) -> List[str]:
+async def feed_queue(stream: AsyncGenerator[List[Dict[str, Any]], None], queue: asyncio.Queue) -> None:
     """
-    Process a specific type of content (news or info).
+    Scrape stage: move item chunks from a source stream into a bounded queue.
 
-    Args:
-        items: List of items to process
-        source_type: Type of content ('news' or 'info')
+    The queue applies backpressure: scraping pauses when analysis falls behind.
+    A None sentinel is queued once the stream is exhausted. The stream is closed
+    however the stage ends, which abandons its unfinished scrape tasks.
 
-    Returns:
-        List of formatted messages ready to send
+    Args:
+        stream: Async generator of item lists (see scrapers.data_fetcher.stream_news_sources)
+        queue: Queue read by analyze_stream
     """
-    if not items:
-        logger.info(f"No {source_type} items to process")
-        return []
-
-    # Remove duplicates
-    clean_items = [n for n in items if not is_duplicate(n)]
-    logger.info(f"{source_type.capitalize()} after deduplication: {len(clean_items)}/{len(items)} items")
-
-    if not clean_items:
-        return []
-
-    # Create URL mapping for all items
-    url_mapping = build_url_mapping(clean_items)
+    try:
+        async for items in stream:
+            await queue.put(items)
+    finally:
+        await stream.aclose()
+    await queue.put(None)
 
-    # Calculate optimal batch size based on the actual data
-    optimal_batch_size = estimate_optimal_batch_size(clean_items)
-    logger.info(f"Using optimal batch size of {optimal_batch_size} items for {source_type}")
 
-    # Split items into batches
-    item_batches = batch_news_items(clean_items, batch_size=optimal_batch_size)
-    logger.info(f"Split {len(clean_items)} {source_type} items into {len(item_batches)} batches")
+async def run_stages(*stages: Awaitable[Any]) -> List[Any]:
+    """
+    Run pipeline stages concurrently, cancelling the others as soon as one fails.
 
-    # Process each batch and collect all messages
-    all_messages = []
-    for i, batch in enumerate(item_batches):
-        logger.info(f"Processing {source_type} batch {i+1}/{len(item_batches)} with {len(batch)} items")
-        batch_messages = await process_news_batch(batch, url_mapping, source_type)
-        all_messages.extend(batch_messages)
+    Unlike asyncio.gather, a failed stage never leaves its siblings blocked on a
+    queue nobody reads; the stages are also cancelled if the caller is.
 
-    logger.info(f"Generated {len(all_messages)} messages from {source_type} content")
-    return all_messages
+    Args:
+        *stages: Coroutines of the stages
 
+    Returns:
+        Result of each stage, in argument order
 
-async def process_news():
+    Raises:
+        Exception: The first exception raised by a stage
     """
-    Main news processing function.
+    tasks = [asyncio.ensure_future(stage) for stage in stages]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+    return [task.result() for task in tasks]
 
-    Collects, analyzes, filters, and sends Tesla news and information alerts.
-    Processes news and information content separately to apply appropriate filtering.
-    Runs periodically based on SCRAPE_INTERVAL setting.
+
+async def analyze_stream(
+    queue: asyncio.Queue, source_type: str, messages: asyncio.Queue, flush_after: float = PIPELINE_FLUSH_SECONDS
+) -> int:
     """
-    logger.info("Starting news processing")
+    Analysis stage: deduplicate queued items and analyze them in batches as they arrive.
 
-    # Collect news and information content separately
-    news_items = collect_news_sources()
-    info_items = collect_info_sources()
+    A batch is analyzed as soon as enough items for a full batch are buffered, when no
+    new items arrived for flush_after seconds, or when the scrape stage is finished,
+    so early sources are analyzed while slower sources are still being scraped.
 
-    logger.info(f"Total collected - News: {len(news_items)}, Info: {len(info_items)}")
+    Args:
+        queue: Queue of item chunks filled by feed_queue
+        source_type: Type of content ('news' or 'info')
+        messages: Queue receiving the formatted messages
+        flush_after: Idle time in seconds after which a partial batch is analyzed
 
-    # Process each content type separately
-    news_messages = await process_content_type(news_items, "news")
-    info_messages = await process_content_type(info_items, "info")
+    Returns:
+        Number of new items analyzed
+    """
+    pending: List[Dict[str, Any]] = []
+    collected = analyzed = 0
+    finished = False
+    while not finished:
+        flush = False
+        try:
+            chunk = await asyncio.wait_for(queue.get(), timeout=flush_after if pending else None)
+        except asyncio.TimeoutError:
+            chunk, flush = [], True
+        if chunk is None:
+            finished = flush = True
+        else:
+            # Remove duplicates (one Redis round trip per chunk)
+            clean_items = await filter_new_items_async(chunk)
+            collected += len(chunk)
+            pending.extend(clean_items)
+
+        if not pending:
+            continue
 
-    # Combine all messages for similarity checking and sending
-    all_messages = news_messages + info_messages
+        # Calculate optimal batch size based on the buffered data
+        optimal_batch_size = estimate_optimal_batch_size(pending)
+        item_batches = batch_news_items(pending, batch_size=optimal_batch_size)
+        if not flush and len(item_batches[-1]) < optimal_batch_size:
+            # Keep the incomplete last batch buffered for more items
+            pending = item_batches.pop()
+        else:
+            pending = []
+
+        for batch in item_batches:
+            logger.info(f"Processing {source_type} batch with {len(batch)} items")
+            try:
+                batch_messages = await process_news_batch(batch, build_url_mapping(batch), source_type)
+            except Exception as e:
+                logger.error(f"Error analyzing {source_type} batch: {e}")
+                continue
+            analyzed += len(batch)
+            for message in batch_messages:
+                await messages.put(message)
+
+    logger.info(f"{source_type.capitalize()} after deduplication: {analyzed}/{collected} items analyzed")
+    return analyzed
+
+
+async def send_messages(messages: List[str]) -> int:
+    """
+    Send messages to the channel, skipping ones similar to messages already sent.
 
-    if not all_messages:
-        logger.info("No messages to send after processing")
-        return
+    Args:
+        messages: Formatted messages ready to send
 
+    Returns:
+        Number of messages sent
+    """
     # Get previously sent messages from Redis
-    stored_msgs = get_channel_messages()
+    stored_msgs = await get_channel_messages_async()
 
     from analyzers.similarity_checker import check_similarity
     from telegram_bot.message_sender import send_message_to_channel
 
     # Check similarity only if there are stored messages
     if len(stored_msgs) > 0:
-        similarity_results = await check_similarity(all_messages, stored_msgs, language=DEFAULT_LANGUAGE)
+        similarity_results = await check_similarity(messages, stored_msgs, language=DEFAULT_LANGUAGE)
     else:
-        similarity_results = [{"already_sent": False, "max_similarity": 0.0} for _ in all_messages]
+        similarity_results = [{"already_sent": False, "max_similarity": 0.0} for _ in messages]
 
     messages_sent = 0
-    for idx, msg in enumerate(all_messages):
+    for idx, msg in enumerate(messages):
         result = (
             similarity_results[idx] if idx < len(similarity_results) else {"already_sent": False, "max_similarity": 0.0}
         )
@@ -199,12 +272,79 @@ async def process_news():
         try:
             await send_message_to_channel(msg)
             logger.info("Message sent successfully")
-            store_channel_message(msg)
+            await store_channel_message_async(msg)
             messages_sent += 1
         except Exception as e:
             logger.error(f"Error sending channel message: {e}")
+    return messages_sent
+
+
+async def send_stream(messages: asyncio.Queue) -> int:
+    """
+    Send stage: send queued messages until a None sentinel arrives.
+
+    Messages that queued up while the previous send was in progress are checked
+    for similarity and sent together.
+
+    Args:
+        messages: Queue of formatted messages filled by analyze_stream
+
+    Returns:
+        Number of messages sent
+    """
+    messages_sent = 0
+    finished = False
+    while not finished:
+        batch = [await messages.get()]
+        while not messages.empty():
+            batch.append(messages.get_nowait())
+        if None in batch:
+            finished = True
+            batch = [message for message in batch if message is not None]
+        if not batch:
+            continue
+        try:
+            messages_sent += await send_messages(batch)
+        except Exception as e:
+            # Keep draining the queue so the analysis stage never blocks on a dead sender
+            logger.error(f"Error sending {len(batch)} messages: {e}")
+    return messages_sent
+
+
+async def process_news():
+    """
+    Main news processing function.
+
+    Collects, analyzes, filters, and sends Tesla news and information alerts.
+    Processes news and information content separately to apply appropriate filtering.
+    Runs periodically based on SCRAPE_INTERVAL setting.
+
+    The stages form a streaming pipeline connected by bounded queues: items of each
+    source are deduplicated and analyzed as soon as the source finishes, and the
+    resulting messages are sent while slower sources are still being scraped.
+    """
+    logger.info("Starting news processing")
+    reset_retry_budget()
+
+    news_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    info_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    messages: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+    async def scrape_and_analyze() -> None:
+        # News and information content are scraped and analyzed separately to apply appropriate filtering
+        await run_stages(
+            feed_queue(stream_news_sources(), news_queue),
+            feed_queue(stream_info_sources(), info_queue),
+            analyze_stream(news_queue, "news", messages),
+            analyze_stream(info_queue, "info", messages),
+        )
+        await messages.put(None)
+
+    _, messages_sent = await run_stages(scrape_and_analyze(), send_stream(messages))
 
     logger.info(f"News processing completed - sent {messages_sent} messages")
+    log_transfer_stats()
+    log_cache_stats()
 
 
 async def shutdown(signal, loop):
@@ -224,8 +364,13 @@ async def shutdown(signal, loop):
 
     await asyncio.gather(*tasks, return_exceptions=True)
 
-    # Close async session
+    # Close async session, Redis pool, scraper threads, parser processes, pooled scraper connections and HTML archive
     await close_session()
+    await close_async_redis_client()
+    close_scrape_executor()
+    close_parse_pool()
+    close_http_client()
+    close_archive()
 
     # Stop event loop
     loop.stop()
@@ -239,6 +384,8 @@ def main():
     Sets up the Telegram bot, job queue, and signal handlers.
     """
     app = create_application()
+    # Warm the DNS cache for all scraped hosts in the background before the first cycle
+    get_scrape_executor().submit(preresolve_scraper_hosts)
     # Run process_news on SCRAPE_INTERVAL with initial delay
     app.job_queue.run_repeating(
         lambda context: asyncio.create_task(process_news()), interval=SCRAPE_INTERVAL, first=FIRST_SCRAPE_DELAY
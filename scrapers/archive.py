@@ -0,0 +1,253 @@
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config import HTML_ARCHIVE_DIR, HTML_ARCHIVE_ZSTD_LEVEL
+from utils.logger import setup_logger
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency; bodies are gzip-compressed without it
+    zstandard = None
+
+logger = setup_logger()
+
+
+class HtmlArchive:
+    """
+    Content-addressed archive of raw HTTP response bodies.
+
+    Bodies are stored once per SHA-256 content hash under objects/<hash[:2]>/<hash>,
+    zstd-compressed (".zst") when the zstandard package is installed and gzip-compressed
+    (".gz") otherwise. A SQLite index records every fetch (URL, final URL, fetch time,
+    status, headers and content hash), so identical pages fetched many times share one
+    stored copy while each fetch stays traceable by URL and time.
+    """
+
+    def __init__(self, root: str, level: int = HTML_ARCHIVE_ZSTD_LEVEL):
+        self.root = root
+        self.level = level
+        if zstandard is None:
+            logger.warning("zstandard is not installed (the 'archive' extra); archiving response bodies with gzip")
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(root, "index.sqlite3"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS fetches ("
+            "url TEXT NOT NULL, final_url TEXT, fetched_at REAL NOT NULL, status INTEGER, "
+            "headers TEXT, content_hash TEXT NOT NULL, size INTEGER)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS fetches_url_time ON fetches (url, fetched_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS fetches_time ON fetches (fetched_at)")
+        self._db.commit()
+
+    def _object_path(self, content_hash: str, extension: str) -> str:
+        return os.path.join(self.root, "objects", content_hash[:2], content_hash + extension)
+
+    def _find_object(self, content_hash: str) -> Optional[str]:
+        for extension in (".zst", ".gz"):
+            path = self._object_path(content_hash, extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _compress(self, body: bytes):
+        if zstandard is not None:
+            return ".zst", zstandard.ZstdCompressor(level=self.level).compress(body)
+        return ".gz", gzip.compress(body)
+
+    def store(
+        self,
+        url: str,
+        body: bytes,
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        final_url: Optional[str] = None,
+        fetched_at: Optional[float] = None,
+    ) -> str:
+        """
+        Store a fetched body and record the fetch in the index.
+
+        Args:
+            url: Requested URL
+            body: Raw response body
+            status: HTTP status code
+            headers: Response headers
+            final_url: URL after redirects (defaults to url)
+            fetched_at: Fetch time as UNIX timestamp (defaults to now)
+
+        Returns:
+            SHA-256 content hash of the body
+        """
+        content_hash = hashlib.sha256(body).hexdigest()
+        if self._find_object(content_hash) is None:
+            extension, data = self._compress(body)
+            path = self._object_path(content_hash, extension)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so readers never see a partial object
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO fetches (url, final_url, fetched_at, status, headers, content_hash, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    final_url or url,
+                    fetched_at if fetched_at is not None else time.time(),
+                    status,
+                    json.dumps(headers or {}, ensure_ascii=False),
+                    content_hash,
+                    len(body),
+                ),
+            )
+            self._db.commit()
+        return content_hash
+
+    def load(self, content_hash: str) -> bytes:
+        """
+        Load a stored body by content hash.
+
+        Raises:
+            KeyError: If no body with that hash is stored
+        """
+        path = self._find_object(content_hash)
+        if path is None:
+            raise KeyError(content_hash)
+        with open(path, "rb") as f:
+            data = f.read()
+        if path.endswith(".gz"):
+            return gzip.decompress(data)
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .zst archive objects")
+        return zstandard.ZstdDecompressor().decompress(data)
+
+    def snapshots(
+        self, url: Optional[str] = None, since: Optional[float] = None, until: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List recorded fetches, oldest first.
+
+        Args:
+            url: Only fetches of this requested URL
+            since: Only fetches at or after this UNIX timestamp
+            until: Only fetches before this UNIX timestamp
+
+        Returns:
+            List of dictionaries with url, final_url, fetched_at, status, headers, content_hash and size
+        """
+        query = "SELECT url, final_url, fetched_at, status, headers, content_hash, size FROM fetches WHERE 1=1"
+        params: List[Any] = []
+        if url is not None:
+            query += " AND url = ?"
+            params.append(url)
+        if since is not None:
+            query += " AND fetched_at >= ?"
+            params.append(since)
+        if until is not None:
+            query += " AND fetched_at < ?"
+            params.append(until)
+        query += " ORDER BY fetched_at, rowid"
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [
+            {
+                "url": row[0],
+                "final_url": row[1],
+                "fetched_at": row[2],
+                "status": row[3],
+                "headers": json.loads(row[4] or "{}"),
+                "content_hash": row[5],
+                "size": row[6],
+            }
+            for row in rows
+        ]
+
+    def latest(self, url: str, before: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Most recent recorded fetch of a URL.
+
+        Args:
+            url: Requested URL
+            before: Only consider fetches before this UNIX timestamp
+
+        Returns:
+            Fetch record (see snapshots), or None if the URL was never archived
+        """
+        records = self.snapshots(url, until=before)
+        return records[-1] if records else None
+
+    def close(self) -> None:
+        """Close the index database"""
+        with self._lock:
+            self._db.close()
+
+
+# Singleton archive shared by all scrapers (None while archiving is disabled)
+_archive: Optional[HtmlArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> Optional[HtmlArchive]:
+    """
+    Get or open the shared HTML archive.
+
+    Returns:
+        HtmlArchive rooted at HTML_ARCHIVE_DIR, or None if HTML_ARCHIVE_DIR is not set
+    """
+    global _archive
+    if not HTML_ARCHIVE_DIR:
+        return None
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                _archive = HtmlArchive(HTML_ARCHIVE_DIR)
+    return _archive
+
+
+def close_archive() -> None:
+    """
+    Close the shared HTML archive.
+
+    This should be called when shutting down the application.
+    """
+    global _archive
+    with _archive_lock:
+        if _archive is not None:
+            _archive.close()
+            _archive = None
+
+
+def archive_response(url: str, response) -> None:
+    """
+    Archive the body of a scraper response if archiving is enabled.
+
+    Bodiless responses (e.g. 304 Not Modified) are skipped. Archive errors are
+    logged and never fail the request.
+
+    Args:
+        url: Requested URL
+        response: utils.http_response.Response
+    """
+    if not response.body:
+        return
+    try:
+        archive = get_archive()
+        if archive is not None:
+            archive.store(
+                url,
+                response.body,
+                status=response.status,
+                headers=response.headers,
+                final_url=response.url,
+            )
+    except Exception as e:
+        logger.warning(f"HTML archive store failed ({url}): {e}")
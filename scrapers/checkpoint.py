@@ -0,0 +1,143 @@
+import threading
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.cache import mark_urls_seen, set_high_water_mark, store_http_validators
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class Checkpoint:
+    """
+    Cache writes recording how far a scraper got, applied once its items have been used.
+
+    Scrapers run in worker threads that the collection deadline may abandon. Their
+    progress (article URLs collected, listing high-water marks and the HTTP
+    validators of fetched listings) is only written once the pipeline has taken
+    the items, so an abandoned task's articles are collected again next cycle.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seen_urls: List[str] = []
+        self.high_water_marks: Dict[Tuple[str, str], str] = {}
+        self.validators: Dict[str, Dict[str, str]] = {}
+
+    def add_seen_urls(self, urls: List[str]) -> None:
+        """Record article URLs whose detail pages have been fetched"""
+        with self._lock:
+            self.seen_urls.extend(urls)
+
+    def set_high_water_mark(self, source: str, keyword: str, url: str) -> None:
+        """Record the newest listing URL of a source and keyword"""
+        with self._lock:
+            self.high_water_marks[(source, keyword)] = url
+
+    def set_validators(self, url: str, validators: Dict[str, str]) -> None:
+        """Record the ETag / Last-Modified validators of a fetched URL"""
+        with self._lock:
+            self.validators[url] = validators
+
+    def commit(self) -> None:
+        """Write the recorded progress to the cache; failures are logged and never raised"""
+        with self._lock:
+            seen_urls, self.seen_urls = self.seen_urls, []
+            high_water_marks, self.high_water_marks = self.high_water_marks, {}
+            validators, self.validators = self.validators, {}
+        if seen_urls:
+            try:
+                mark_urls_seen(seen_urls)
+            except Exception as e:
+                logger.warning(f"Seen-URL update failed: {e}")
+        for (source, keyword), url in high_water_marks.items():
+            try:
+                set_high_water_mark(source, keyword, url)
+            except Exception as e:
+                logger.warning(f"{source} high-water mark update failed: {e}")
+        for url, url_validators in validators.items():
+            try:
+                store_http_validators(url, url_validators)
+            except Exception as e:
+                logger.warning(f"HTTP validator store failed ({url}): {e}")
+
+
+# Checkpoint of the scraper task running in the current thread (None outside scraper tasks)
+_current: ContextVar[Optional[Checkpoint]] = ContextVar("scrape_checkpoint", default=None)
+
+
+def _checkpoint() -> Tuple[Checkpoint, bool]:
+    """The current task's checkpoint, or a new one to commit at once (and whether it is new)"""
+    checkpoint = _current.get()
+    if checkpoint is None:
+        return Checkpoint(), True
+    return checkpoint, False
+
+
+def record_seen_urls(urls: List[str]) -> None:
+    """
+    Mark article URLs as collected once the running scraper task's items are used.
+
+    Outside a scraper task (scripts, tests) the URLs are marked immediately.
+
+    Args:
+        urls: Article URLs whose detail pages have been fetched
+    """
+    checkpoint, immediate = _checkpoint()
+    checkpoint.add_seen_urls(urls)
+    if immediate:
+        checkpoint.commit()
+
+
+def record_high_water_mark(source: str, keyword: str, url: str) -> None:
+    """
+    Advance a listing's high-water mark once the running scraper task's items are used.
+
+    Outside a scraper task the mark is written immediately.
+
+    Args:
+        source: Source name (e.g. "Clien")
+        keyword: Search keyword of the listing
+        url: URL of the newest listing item
+    """
+    checkpoint, immediate = _checkpoint()
+    checkpoint.set_high_water_mark(source, keyword, url)
+    if immediate:
+        checkpoint.commit()
+
+
+def record_validators(url: str, validators: Dict[str, str]) -> None:
+    """
+    Store the HTTP validators of a URL once the running scraper task's items are used.
+
+    Until then a conditional request for the URL still revalidates against the
+    previous validators, so an abandoned task's page is fetched in full again.
+    Outside a scraper task the validators are stored immediately.
+
+    Args:
+        url: Requested URL
+        validators: Dictionary with optional "etag" and "last_modified" entries
+    """
+    checkpoint, immediate = _checkpoint()
+    checkpoint.set_validators(url, validators)
+    if immediate:
+        checkpoint.commit()
+
+
+def run_with_checkpoint(fetch: Callable[..., Any], *args) -> Tuple[Any, Checkpoint]:
+    """
+    Run a scraper, collecting its progress writes instead of applying them.
+
+    Args:
+        fetch: Scraper function
+        *args: Positional arguments of the scraper
+
+    Returns:
+        Tuple of the scraper's result and its uncommitted Checkpoint
+    """
+    checkpoint = Checkpoint()
+    token = _current.set(checkpoint)
+    try:
+        return fetch(*args), checkpoint
+    finally:
+        _current.reset(token)
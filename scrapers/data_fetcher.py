@@ -1,33 +1,37 @@
-from config import SEARCH_KEYWORDS
-from scrapers.korean_news_scraper import (
-    fetch_auto_danawa_news,
-    fetch_autodaily_news,
-    fetch_chosunbiz_news,
-    fetch_donga_news,
-    fetch_edaily_news,
-    fetch_etnews_news,
-    fetch_heraldcorp_news,
-    fetch_itchosun_news,
-    fetch_motorgraph_news,
-    fetch_naver_news,
-)
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from config import SCRAPE_DEADLINE, SCRAPE_MAX_WORKERS, SCRAPE_SOURCE_CONCURRENCY, SEARCH_KEYWORDS
+from scrapers.checkpoint import Checkpoint, run_with_checkpoint
+from scrapers.korean_news_scraper import fetch_news_source
+from scrapers.news_sources import NEWS_SOURCES
 from scrapers.tesla_extra_scraper import (
+    INFO_SOURCE_URLS,
     fetch_subsidy_info,
     fetch_tesla_clien,
     fetch_tesla_dcincide,
     fetch_tesla_naver_blog,
 )
+from scrapers.throttling import get_breaker_states
+from utils.dns_cache import get_dns_cache
 from utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Thread pool shared by all scraper runs
+_executor: Optional[ThreadPoolExecutor] = None
+
 
-def deduplicate_items(items):
+def deduplicate_items(items, seen_urls: Optional[Set[str]] = None, seen_titles: Optional[Set[str]] = None):
     """
     Remove duplicates from a list of news items based on URL or title.
 
     Args:
         items: List of news item dictionaries
+        seen_urls: URLs already emitted earlier in a stream (updated in place)
+        seen_titles: Titles already emitted earlier in a stream (updated in place)
 
     Returns:
         List of unique news items
@@ -36,8 +40,8 @@ def deduplicate_items(items):
         return []
 
     unique_items = []
-    seen_urls = set()
-    seen_titles = set()
+    seen_urls = set() if seen_urls is None else seen_urls
+    seen_titles = set() if seen_titles is None else seen_titles
 
     for item in items:
         url = item.get("url", "").strip()
@@ -63,69 +67,339 @@ def deduplicate_items(items):
     return unique_items
 
 
-def collect_news_sources():
+def get_scrape_executor() -> ThreadPoolExecutor:
+    """
+    Get or create the shared thread pool used to run blocking scrapers.
+
+    Scrapers perform blocking pycurl requests, so they are run in worker threads
+    to keep the event loop (and the Telegram webhook it serves) responsive.
+
+    Returns:
+        Shared ThreadPoolExecutor instance
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=SCRAPE_MAX_WORKERS, thread_name_prefix="scraper")
+    return _executor
+
+
+def close_scrape_executor() -> None:
+    """
+    Shut down the shared scraper thread pool.
+
+    Pending scraper runs are cancelled; runs already in progress are not waited for.
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def get_scraper_hosts() -> List[Tuple[str, int]]:
+    """
+    Return the (host, port) pairs of every scraped site.
+
+    Returns:
+        Unique (host, port) pairs of the news source listings and the information sources
+    """
+    urls = [source["listing_url"] for source in NEWS_SOURCES] + [source["base_url"] for source in NEWS_SOURCES]
+    hosts = []
+    for url in urls + INFO_SOURCE_URLS:
+        parsed = urlparse(url)
+        host = (parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80))
+        if host not in hosts:
+            hosts.append(host)
+    return hosts
+
+
+def preresolve_scraper_hosts() -> int:
+    """
+    Resolve all scraped hosts into the shared DNS cache.
+
+    Called at startup so the first collection cycle does not wait for the resolver.
+
+    Returns:
+        Number of hosts resolved
+    """
+    hosts = get_scraper_hosts()
+    resolved = get_dns_cache().preresolve(hosts)
+    logger.info(f"Preresolved {resolved}/{len(hosts)} scraper hosts")
+    return resolved
+
+
+def get_search_keywords() -> List[str]:
+    """
+    Return the configured search keywords with blanks removed.
+
+    Returns:
+        List of stripped, non-empty keywords from SEARCH_KEYWORDS
+    """
+    return [keyword.strip() for keyword in SEARCH_KEYWORDS if keyword.strip()]
+
+
+def build_news_tasks(keywords: List[str]) -> List[Tuple[str, Callable, tuple]]:
+    """
+    Build the (source, fetch function, args) tasks for professional news sources.
+
+    Every source configured in scrapers.news_sources is run by the same engine.
+    The fetch function is looked up at call time so it can be replaced in tests.
+
+    Args:
+        keywords: Search keywords to fan out over
+
+    Returns:
+        List of (source name, fetch function, positional args) tuples
+    """
+    return [(source["name"], fetch_news_source, (source, keyword)) for keyword in keywords for source in NEWS_SOURCES]
+
+
+def build_info_tasks(keywords: List[str]) -> List[Tuple[str, Callable, tuple]]:
+    """
+    Build the (source, fetch function, args) tasks for community and information sources.
+
+    Subsidy information does not depend on the keyword, so it is fetched once per
+    cycle when any Tesla keyword is configured.
+
+    Args:
+        keywords: Search keywords to fan out over
+
+    Returns:
+        List of (source name, fetch function, positional args) tuples
+    """
+    tasks = []
+    if any(keyword.lower() in ("테슬라", "tesla") for keyword in keywords):
+        tasks.append(("Subsidy", fetch_subsidy_info, ()))
+    sources = [
+        ("Naver Blog", fetch_tesla_naver_blog),
+        ("Clien", fetch_tesla_clien),
+        ("DCinside", fetch_tesla_dcincide),
+    ]
+    tasks.extend((name, fetch, (keyword,)) for keyword in keywords for name, fetch in sources)
+    return tasks
+
+
+def start_scrape_tasks(
+    tasks: List[Tuple[str, Callable, tuple]], source_concurrency: int = SCRAPE_SOURCE_CONCURRENCY
+) -> List[asyncio.Future]:
+    """
+    Start scraper tasks in worker threads, limiting concurrent tasks per source.
+
+    Must be called from a running event loop. A failing task logs its error and
+    resolves to an empty list. The progress writes of each task (seen URLs, ...)
+    are held in its Checkpoint, to be committed once its items have been used.
+
+    Args:
+        tasks: List of (source name, fetch function, positional args) tuples
+        source_concurrency: Maximum concurrent tasks per source
+
+    Returns:
+        One future per task, in task order, resolving to the task's (items, checkpoint)
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_scrape_executor()
+    semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def run_task(source: str, fetch: Callable, args: tuple) -> Tuple[List[Dict[str, Any]], Checkpoint]:
+        """Run one blocking scraper in the thread pool, limited per source"""
+        semaphore = semaphores.setdefault(source, asyncio.Semaphore(source_concurrency))
+        async with semaphore:
+            try:
+                items, checkpoint = await loop.run_in_executor(executor, run_with_checkpoint, fetch, *args)
+                return items or [], checkpoint
+            except Exception as e:
+                logger.error(f"{source} collection error for {args}: {e}")
+                return [], Checkpoint()
+
+    return [asyncio.ensure_future(run_task(*task)) for task in tasks]
+
+
+async def commit_checkpoints(checkpoints: List[Checkpoint]) -> None:
+    """
+    Apply the progress writes of finished scraper tasks without blocking the event loop.
+
+    Args:
+        checkpoints: Checkpoints of tasks whose items have been used
+    """
+
+    def commit_all():
+        for checkpoint in checkpoints:
+            checkpoint.commit()
+
+    if checkpoints:
+        await asyncio.get_running_loop().run_in_executor(None, commit_all)
+
+
+def abandon_scrape_tasks(
+    futures: List[asyncio.Future], tasks: List[Tuple[str, Callable, tuple]], deadline: float
+) -> None:
+    """
+    Cancel tasks that missed the deadline and report hosts with open circuit breakers.
+
+    Args:
+        futures: Futures returned by start_scrape_tasks
+        tasks: The tasks the futures were started for
+        deadline: Deadline that was applied, for logging
+    """
+    for future, (source, _, args) in zip(futures, tasks):
+        if not future.done():
+            logger.warning(f"{source} collection for {args} exceeded the {deadline}s deadline; skipping")
+            future.cancel()
+
+    # Report degraded hosts so skipped sources are visible in monitoring
+    degraded = {host: state for host, state in get_breaker_states().items() if state["state"] != "closed"}
+    if degraded:
+        logger.warning(f"Scraper circuit breakers not closed: {degraded}")
+
+
+async def run_scrape_tasks(
+    tasks: List[Tuple[str, Callable, tuple]],
+    deadline: float = SCRAPE_DEADLINE,
+    source_concurrency: int = SCRAPE_SOURCE_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """
+    Run scraper tasks concurrently in worker threads under a single deadline.
+
+    All (source, keyword) pairs are started at once. A per-source semaphore limits
+    how many requests hit the same site at the same time. Tasks still running when
+    the deadline expires are abandoned and their results discarded.
+
+    Args:
+        tasks: List of (source name, fetch function, positional args) tuples
+        deadline: Overall time limit in seconds for the whole batch
+        source_concurrency: Maximum concurrent tasks per source
+
+    Returns:
+        Items from all tasks that finished in time, in task order
+    """
+    if not tasks:
+        return []
+
+    futures = start_scrape_tasks(tasks, source_concurrency)
+    done, _ = await asyncio.wait(futures, timeout=deadline)
+    abandon_scrape_tasks(futures, tasks, deadline)
+
+    items = []
+    checkpoints = []
+    for future in futures:
+        if future in done:
+            task_items, checkpoint = future.result()
+            items.extend(task_items)
+            checkpoints.append(checkpoint)
+    # Abandoned tasks keep their progress unwritten so their articles are collected again
+    await commit_checkpoints(checkpoints)
+    return items
+
+
+async def stream_scrape_tasks(
+    tasks: List[Tuple[str, Callable, tuple]],
+    deadline: float = SCRAPE_DEADLINE,
+    source_concurrency: int = SCRAPE_SOURCE_CONCURRENCY,
+) -> AsyncGenerator[List[Dict[str, Any]], None]:
+    """
+    Run scraper tasks like run_scrape_tasks, yielding each task's items as soon as it finishes.
+
+    Items of fast sources reach the consumer while slow sources are still scraping.
+    Tasks still running at the deadline (or when the consumer stops early) are abandoned.
+    A task's progress writes are committed only after the consumer has taken its
+    items, so articles of abandoned tasks or of items never taken are collected again.
+
+    Args:
+        tasks: List of (source name, fetch function, positional args) tuples
+        deadline: Overall time limit in seconds for the whole batch
+        source_concurrency: Maximum concurrent tasks per source
+
+    Yields:
+        Non-empty item lists, in order of task completion
+    """
+    if not tasks:
+        return
+
+    loop = asyncio.get_running_loop()
+    ends_at = loop.time() + deadline
+    futures = start_scrape_tasks(tasks, source_concurrency)
+    pending = set(futures)
+    try:
+        while pending:
+            remaining = ends_at - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for future in futures:
+                if future in done:
+                    items, checkpoint = future.result()
+                    if items:
+                        yield items
+                    await commit_checkpoints([checkpoint])
+    finally:
+        abandon_scrape_tasks(futures, tasks, deadline)
+
+
+async def stream_sources(
+    tasks: List[Tuple[str, Callable, tuple]], source_type: str
+) -> AsyncGenerator[List[Dict[str, Any]], None]:
+    """
+    Stream deduplicated items of scraper tasks tagged with their source type.
+
+    Args:
+        tasks: List of (source name, fetch function, positional args) tuples
+        source_type: Type of source ('news' or 'info')
+
+    Yields:
+        Non-empty lists of items not yielded before in this stream
+    """
+    seen_urls: Set[str] = set()
+    seen_titles: Set[str] = set()
+    scrape_stream = stream_scrape_tasks(tasks)
+    try:
+        async for items in scrape_stream:
+            items = deduplicate_items(items, seen_urls, seen_titles)
+            for item in items:
+                item["source_type"] = source_type
+            if items:
+                yield items
+    finally:
+        # Closing this stream early must abandon the scrape tasks right away, not when garbage collected
+        await scrape_stream.aclose()
+
+
+def stream_news_sources() -> AsyncGenerator[List[Dict[str, Any]], None]:
+    """
+    Stream Tesla-related news from professional Korean news sources as each source finishes.
+
+    Returns:
+        Async generator of news item lists (see collect_news_sources_async)
+    """
+    keywords = get_search_keywords()
+    logger.info(f"Streaming news with keywords: {', '.join(keywords)}")
+    return stream_sources(build_news_tasks(keywords), "news")
+
+
+def stream_info_sources() -> AsyncGenerator[List[Dict[str, Any]], None]:
+    """
+    Stream Tesla-related information from community and information sources as each source finishes.
+
+    Returns:
+        Async generator of informational item lists (see collect_info_sources_async)
+    """
+    keywords = get_search_keywords()
+    logger.info(f"Streaming info with keywords: {', '.join(keywords)}")
+    return stream_sources(build_info_tasks(keywords), "info")
+
+
+async def collect_news_sources_async() -> List[Dict[str, Any]]:
     """
     Collect Tesla-related news from professional Korean news sources.
 
     These are considered more reliable news sources with journalistic standards.
-    Searches for all keywords in SEARCH_KEYWORDS.
+    Searches for all keywords in SEARCH_KEYWORDS, running every (source, keyword)
+    pair concurrently.
 
     Returns:
         List of news item dictionaries from professional news outlets
     """
-    all_news = []
-
-    # Use all search keywords
-    for search_keyword in SEARCH_KEYWORDS:
-        keyword = search_keyword.strip()
-        if not keyword:
-            continue
-
-        logger.info(f"Collecting news with keyword: {keyword}")
-        news = []
-        try:
-            news += fetch_naver_news(keyword)
-        except Exception as e:
-            logger.error(f"Naver news collection error for '{keyword}': {e}")
-        try:
-            news += fetch_motorgraph_news(keyword)
-        except Exception as e:
-            logger.error(f"Motorgraph news collection error for '{keyword}': {e}")
-        try:
-            news += fetch_auto_danawa_news(keyword)
-        except Exception as e:
-            logger.error(f"AUTO.DANAWA news collection error for '{keyword}': {e}")
-        try:
-            news += fetch_etnews_news(keyword)
-        except Exception as e:
-            logger.error(f"ET News collection error for '{keyword}': {e}")
-        try:
-            news += fetch_heraldcorp_news(keyword)
-        except Exception as e:
-            logger.error(f"Herald Economy news collection error for '{keyword}': {e}")
-        try:
-            news += fetch_donga_news(keyword)
-        except Exception as e:
-            logger.error(f"Donga.com news collection error for '{keyword}': {e}")
-        try:
-            news += fetch_edaily_news(keyword)
-        except Exception as e:
-            logger.error(f"Edaily news collection error for '{keyword}': {e}")
-        try:
-            news += fetch_chosunbiz_news(keyword)
-        except Exception as e:
-            logger.error(f"ChosunBiz news collection error for '{keyword}': {e}")
-        try:
-            news += fetch_autodaily_news(keyword)
-        except Exception as e:
-            logger.error(f"AutoDaily news collection error for '{keyword}': {e}")
-        try:
-            news += fetch_itchosun_news(keyword)
-        except Exception as e:
-            logger.error(f"IT Chosun news collection error for '{keyword}': {e}")
-
-        # Add to all news items
-        all_news.extend(news)
+    keywords = get_search_keywords()
+    logger.info(f"Collecting news with keywords: {', '.join(keywords)}")
+    all_news = await run_scrape_tasks(build_news_tasks(keywords))
 
     # Remove duplicates from multiple keyword searches
     all_news = deduplicate_items(all_news)
@@ -137,48 +411,21 @@ def collect_news_sources():
     return all_news
 
 
-def collect_info_sources():
+async def collect_info_sources_async() -> List[Dict[str, Any]]:
     """
     Collect Tesla-related information from community and information sources.
 
     These include subsidy information, community posts, blogs, and other non-news sources
     that provide useful Tesla-related information.
-    Searches for all keywords in SEARCH_KEYWORDS.
+    Searches for all keywords in SEARCH_KEYWORDS, running every (source, keyword)
+    pair concurrently.
 
     Returns:
         List of informational item dictionaries from non-news sources
     """
-    all_info = []
-
-    # Use all search keywords
-    for search_keyword in SEARCH_KEYWORDS:
-        keyword = search_keyword.strip()
-        if not keyword:
-            continue
-
-        logger.info(f"Collecting info with keyword: {keyword}")
-        info = []
-        try:
-            # Subsidy info is always included for Tesla-related keywords
-            if keyword.lower() == "테슬라" or keyword.lower() == "tesla":
-                info += fetch_subsidy_info()
-        except Exception as e:
-            logger.error(f"Subsidy information collection error: {e}")
-        try:
-            info += fetch_tesla_naver_blog(keyword)
-        except Exception as e:
-            logger.error(f"Tesla Naver Blog collection error for '{keyword}': {e}")
-        try:
-            info += fetch_tesla_clien(keyword)
-        except Exception as e:
-            logger.error(f"Tesla Clien news collection error for '{keyword}': {e}")
-        try:
-            info += fetch_tesla_dcincide(keyword)
-        except Exception as e:
-            logger.error(f"Tesla DCinside news collection error for '{keyword}': {e}")
-
-        # Add to all info items
-        all_info.extend(info)
+    keywords = get_search_keywords()
+    logger.info(f"Collecting info with keywords: {', '.join(keywords)}")
+    all_info = await run_scrape_tasks(build_info_tasks(keywords))
 
     # Remove duplicates from multiple keyword searches
     all_info = deduplicate_items(all_info)
@@ -190,6 +437,26 @@ def collect_info_sources():
     return all_info
 
 
+def collect_news_sources():
+    """
+    Synchronous wrapper around collect_news_sources_async for scripts and tests.
+
+    Returns:
+        List of news item dictionaries from professional news outlets
+    """
+    return asyncio.run(collect_news_sources_async())
+
+
+def collect_info_sources():
+    """
+    Synchronous wrapper around collect_info_sources_async for scripts and tests.
+
+    Returns:
+        List of informational item dictionaries from non-news sources
+    """
+    return asyncio.run(collect_info_sources_async())
+
+
 def collect_domestic_news():
     """
     Collect Tesla-related news from various Korean news sources.
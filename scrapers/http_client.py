@@ -0,0 +1,582 @@
+import contextvars
+import ipaddress
+import random
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import pycurl
+
+from config import (
+    DETAIL_FETCH_CONCURRENCY,
+    HAPPY_EYEBALLS_DELAY,
+    HTTP_COMPRESSION,
+    HTTP_CONDITIONAL_GET,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_MAX_HANDLES,
+    HTTP_RETRY_BASE_DELAY,
+    HTTP_RETRY_BUDGET,
+    HTTP_RETRY_MAX_DELAY,
+)
+from scrapers.archive import archive_response
+from scrapers.checkpoint import record_validators
+from scrapers.throttling import CircuitOpenError, RateLimitTimeout, get_host_throttle
+from utils.cache import get_http_validators
+from utils.dns_cache import get_dns_cache
+from utils.http_response import Response
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+# Statuses worth retrying: timeouts, rate limiting and transient server errors
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# libcurl option for the delay before racing the other IP family (not exported by every pycurl release)
+HAPPY_EYEBALLS_TIMEOUT_MS = getattr(pycurl, "HAPPY_EYEBALLS_TIMEOUT_MS", 271)
+
+
+class CurlPool:
+    """
+    Thread-safe pool of reusable pycurl handles.
+
+    A libcurl easy handle keeps its connections open between transfers, so reusing
+    handles avoids a new TCP and TLS handshake for every request to the same host.
+    Idle handles are remembered per host and a request prefers a handle that last
+    talked to the same host. All handles share one DNS and TLS session cache.
+    """
+
+    def __init__(self, max_handles: int = HTTP_POOL_MAX_HANDLES):
+        self.max_handles = max_handles
+        self._lock = threading.Lock()
+        self._idle: Dict[str, List[pycurl.Curl]] = {}
+        self._idle_count = 0
+        self._share = pycurl.CurlShare()
+        self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
+        self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
+
+    def acquire(self, host: str) -> pycurl.Curl:
+        """Check out a handle, preferring one with an open connection to host"""
+        with self._lock:
+            handles = self._idle.get(host)
+            if not handles:
+                # Otherwise take any idle handle (from the host with the most spare handles)
+                handles = max(self._idle.values(), key=len, default=None)
+            if handles:
+                self._idle_count -= 1
+                return handles.pop()
+        handle = pycurl.Curl()
+        # Shares survive reset(), so they are attached once per handle
+        handle.setopt(pycurl.SHARE, self._share)
+        return handle
+
+    def release(self, host: str, handle: pycurl.Curl) -> None:
+        """Return a handle to the pool, closing it if the pool is full"""
+        with self._lock:
+            if self._idle_count < self.max_handles:
+                self._idle.setdefault(host, []).append(handle)
+                self._idle_count += 1
+                return
+        handle.close()
+
+    def configure(self, handle: pycurl.Curl) -> None:
+        """Reset a handle and apply the options shared by every request"""
+        handle.reset()
+        handle.setopt(pycurl.NOSIGNAL, 1)
+        handle.setopt(pycurl.TCP_KEEPALIVE, 1)
+        # Negotiate HTTP/2 over TLS where the server supports it, HTTP/1.1 otherwise
+        handle.setopt(pycurl.HTTP_VERSION, pycurl.CURL_HTTP_VERSION_2TLS)
+        # Disable SSL verification
+        handle.setopt(pycurl.SSL_VERIFYPEER, 0)
+        handle.setopt(pycurl.SSL_VERIFYHOST, 0)
+        handle.setopt(HAPPY_EYEBALLS_TIMEOUT_MS, int(HAPPY_EYEBALLS_DELAY * 1000))
+        if HTTP_COMPRESSION:
+            # An empty value offers every encoding libcurl can decode (deflate, gzip and br
+            # when built with brotli) and decompresses the body transparently
+            handle.setopt(pycurl.ACCEPT_ENCODING, "")
+
+    def close(self) -> None:
+        """Close all idle handles"""
+        with self._lock:
+            for handles in self._idle.values():
+                for handle in handles:
+                    handle.close()
+            self._idle = {}
+            self._idle_count = 0
+
+
+class TransferStats:
+    """
+    Thread-safe per-host counters of response body bytes.
+
+    Wire bytes are what was actually transferred, body bytes what remained after
+    decompression; the difference is the bandwidth saved by compressed transfers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, List[int]] = {}
+
+    def record(self, host: str, wire_bytes: int, body_bytes: int) -> None:
+        """Count one response"""
+        with self._lock:
+            counters = self._hosts.setdefault(host, [0, 0, 0])
+            counters[0] += 1
+            counters[1] += wire_bytes
+            counters[2] += body_bytes
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Current counters per host.
+
+        Args:
+            reset: Start counting from zero afterwards
+
+        Returns:
+            Dictionary mapping host to requests, wire_bytes, body_bytes and bytes_saved
+        """
+        with self._lock:
+            hosts = self._hosts
+            if reset:
+                self._hosts = {}
+            return {
+                host: {
+                    "requests": requests,
+                    "wire_bytes": wire_bytes,
+                    "body_bytes": body_bytes,
+                    "bytes_saved": body_bytes - wire_bytes,
+                }
+                for host, (requests, wire_bytes, body_bytes) in hosts.items()
+            }
+
+
+# Transfer statistics of all scraper requests
+_transfer_stats = TransferStats()
+
+
+def get_transfer_stats(reset: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the per-host transfer statistics for monitoring.
+
+    Args:
+        reset: Start counting from zero afterwards (e.g. once per collection cycle)
+
+    Returns:
+        Dictionary mapping host to requests, wire_bytes, body_bytes and bytes_saved
+    """
+    return _transfer_stats.snapshot(reset)
+
+
+def log_transfer_stats() -> None:
+    """Log the bytes received and saved by compression since the last call, then reset the counters"""
+    stats = get_transfer_stats(reset=True)
+    if not stats:
+        return
+    wire_bytes = sum(host["wire_bytes"] for host in stats.values())
+    body_bytes = sum(host["body_bytes"] for host in stats.values())
+    logger.info(
+        f"Scraper transfer: {wire_bytes} bytes received for {body_bytes} body bytes "
+        f"({body_bytes - wire_bytes} saved by compression)"
+    )
+    for host, host_stats in sorted(stats.items(), key=lambda item: -item[1]["bytes_saved"]):
+        logger.debug(f"Scraper transfer {host}: {host_stats}")
+
+
+# Singleton handle pool shared by all scrapers
+_pool: Optional[CurlPool] = None
+_pool_lock = threading.Lock()
+
+# Thread pool running the requests of fetch_all batches from all scrapers
+_fetch_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_pool() -> CurlPool:
+    """
+    Get or create the shared pycurl handle pool.
+
+    Returns:
+        Shared CurlPool instance
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = CurlPool()
+    return _pool
+
+
+def close_http_client() -> None:
+    """
+    Close the shared pycurl handle pool and batch request threads.
+
+    This should be called when shutting down the application to
+    properly clean up open connections.
+    """
+    global _pool, _fetch_executor
+    with _pool_lock:
+        if _fetch_executor is not None:
+            _fetch_executor.shutdown(wait=False, cancel_futures=True)
+            _fetch_executor = None
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+def get_fetch_executor() -> ThreadPoolExecutor:
+    """
+    Get or create the bounded thread pool running batch requests.
+
+    All scrapers share it, so DETAIL_FETCH_CONCURRENCY caps the batch requests
+    in flight across every source.
+
+    Returns:
+        Shared ThreadPoolExecutor instance limited to DETAIL_FETCH_CONCURRENCY workers
+    """
+    global _fetch_executor
+    if _fetch_executor is None:
+        with _pool_lock:
+            if _fetch_executor is None:
+                _fetch_executor = ThreadPoolExecutor(max_workers=DETAIL_FETCH_CONCURRENCY, thread_name_prefix="fetch")
+    return _fetch_executor
+
+
+def resolve_option(url: str) -> Optional[List[str]]:
+    """
+    Build a pycurl RESOLVE entry pinning a URL's host to its cached addresses.
+
+    libcurl then connects without a resolver round trip, racing the addresses
+    happy-eyeballs style. Hosts that are IP literals or cannot be resolved are
+    left to libcurl.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        RESOLVE option value, or None
+    """
+    parsed = urlparse(url)
+    host = parsed.hostname
+    if not host:
+        return None
+    try:
+        ipaddress.ip_address(host)
+        return None
+    except ValueError:
+        pass
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        addresses = get_dns_cache().resolve(host, port)
+    except OSError:
+        return None
+    if not addresses:
+        return None
+    formatted = ",".join(f"[{address}]" if family == socket.AF_INET6 else address for family, address in addresses)
+    return [f"{host}:{port}:{formatted}"]
+
+
+def conditional_headers(url: str, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """
+    Add If-None-Match / If-Modified-Since headers from the stored validators of a URL.
+
+    Args:
+        url: URL about to be requested
+        headers: Request headers (not modified)
+
+    Returns:
+        New header dict including any conditional request headers
+    """
+    headers = dict(headers or {})
+    try:
+        validators = get_http_validators(url)
+    except Exception as e:
+        logger.warning(f"HTTP validator lookup failed ({url}): {e}")
+        return headers
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def remember_validators(url: str, response: "Response") -> None:
+    """
+    Store the ETag / Last-Modified validators of a successful response.
+
+    Inside a scraper task they are stored once the task's items have been used
+    (see scrapers.checkpoint).
+
+    Args:
+        url: Requested URL
+        response: Response with status 200
+    """
+    validators = {}
+    if response.headers.get("etag"):
+        validators["etag"] = response.headers["etag"]
+    if response.headers.get("last-modified"):
+        validators["last_modified"] = response.headers["last-modified"]
+    if validators:
+        record_validators(url, validators)
+
+
+class RetryBudget:
+    """
+    Number of retries all requests may spend together during one collection cycle.
+
+    When a host goes down, every request to it would otherwise retry on its own
+    and hold its batch thread through all backoff waits; once the budget is
+    spent requests fail after their first attempt until the next cycle.
+    """
+
+    def __init__(self, limit: int = HTTP_RETRY_BUDGET):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, returning False if it is exhausted"""
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+    def reset(self) -> None:
+        """Refill the budget for a new cycle"""
+        with self._lock:
+            self.used = 0
+
+
+# Retry budget shared by all batch requests, refilled at the start of each cycle
+_retry_budget = RetryBudget()
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get the shared retry budget"""
+    return _retry_budget
+
+
+def reset_retry_budget() -> None:
+    """Refill the shared retry budget at the start of a collection cycle"""
+    _retry_budget.reset()
+
+
+def backoff_delay(retry: int, retry_after: Optional[float] = None) -> float:
+    """
+    Time to wait before a retry, using full-jitter exponential backoff.
+
+    Waiting a random time between zero and the exponential cap spreads the
+    retries of concurrent requests instead of sending them to the host together.
+
+    Args:
+        retry: Number of the retry (1 for the first)
+        retry_after: Delay requested by the server's Retry-After header
+
+    Returns:
+        Seconds to wait
+    """
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(HTTP_RETRY_MAX_DELAY, HTTP_RETRY_BASE_DELAY * 2 ** (retry - 1)))
+
+
+def get(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 10, conditional: bool = False) -> Response:
+    """
+    Perform an HTTP GET request with a pooled pycurl handle.
+
+    With conditional=True the request is revalidated against the ETag /
+    Last-Modified validators stored from the previous fetch of the same URL, and
+    an unchanged page comes back as a bodiless 304 response.
+
+    Every request first passes the per-host rate limiter and circuit breaker, so a
+    degraded host fails fast instead of consuming the timeout on every call.
+
+    Args:
+        url: Target URL to request
+        headers: Optional dict of HTTP headers
+        timeout: Request timeout in seconds
+        conditional: Send a conditional request using stored validators
+
+    Returns:
+        Response object with status, headers, body and timing
+
+    Raises:
+        CircuitOpenError: If the host's circuit breaker is open
+        RateLimitTimeout: If the host's rate limit does not allow a request within timeout
+        Exception: On pycurl errors
+    """
+    conditional = conditional and HTTP_CONDITIONAL_GET
+    if conditional:
+        headers = conditional_headers(url, headers)
+
+    host = urlparse(url).netloc
+    throttle = get_host_throttle(host)
+    throttle.before_request(timeout)
+    pool = get_pool()
+    handle = None
+    buffer = BytesIO()
+    response_headers: Dict[str, str] = {}
+
+    def collect_header(line: bytes) -> None:
+        header = line.decode("iso-8859-1").strip()
+        if header.startswith("HTTP/"):
+            # New status line (e.g. after 100 Continue): drop headers of the previous response
+            response_headers.clear()
+        elif ":" in header:
+            name, value = header.split(":", 1)
+            response_headers[name.strip().lower()] = value.strip()
+
+    transfer_failed = False
+    reusable = False
+    try:
+        handle = pool.acquire(host)
+        pool.configure(handle)
+        handle.setopt(pycurl.URL, url)
+        resolve = resolve_option(url)
+        if resolve:
+            handle.setopt(pycurl.RESOLVE, resolve)
+        if headers:
+            handle.setopt(pycurl.HTTPHEADER, [f"{key}: {value}" for key, value in headers.items()])
+        handle.setopt(pycurl.WRITEDATA, buffer)
+        handle.setopt(pycurl.HEADERFUNCTION, collect_header)
+        handle.setopt(pycurl.TIMEOUT, timeout)
+
+        started = time.monotonic()
+        try:
+            handle.perform()
+        except pycurl.error as e:
+            transfer_failed = True
+            throttle.record_failure()
+            raise Exception(e)
+
+        response = Response(
+            requested_url=url,
+            url=handle.getinfo(pycurl.EFFECTIVE_URL),
+            status=handle.getinfo(pycurl.RESPONSE_CODE),
+            headers=response_headers,
+            body=buffer.getvalue(),
+            elapsed=time.monotonic() - started,
+            # Counts the bytes before transparent decompression
+            wire_size=int(handle.getinfo(pycurl.SIZE_DOWNLOAD_T)),
+        )
+        reusable = True
+    except Exception:
+        if not transfer_failed:
+            # The host was never judged, so a half-open probe slot is handed back
+            throttle.breaker.release_probe()
+        raise
+    finally:
+        if handle is not None:
+            if reusable:
+                pool.release(host, handle)
+            else:
+                # A failed request may leave the connection in an unknown state
+                handle.close()
+
+    _transfer_stats.record(host, response.wire_size, len(response.body))
+    throttle.record_response(response.status, response.retry_after())
+
+    if conditional and response.status == 200:
+        remember_validators(url, response)
+    # Keep a copy of the raw body for replay and benchmarks when archiving is enabled
+    archive_response(url, response)
+    return response
+
+
+def fetch_all(
+    urls: List[str],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 10,
+    conditional: bool = False,
+    retries: int = HTTP_MAX_RETRIES,
+) -> List[Response]:
+    """
+    Fetch several URLs concurrently on the shared batch request threads.
+
+    Transport errors and RETRYABLE_STATUSES are retried after a full-jitter
+    backoff (or the server's Retry-After delay) while the shared retry budget
+    lasts. Other HTTP error statuses, a refused circuit breaker or rate limit and
+    a Retry-After longer than HTTP_RETRY_MAX_DELAY end the request at once, so
+    one URL takes at most (retries + 1) * timeout + retries * HTTP_RETRY_MAX_DELAY
+    seconds.
+
+    Failures never raise: a transport error, refused circuit breaker or rate
+    limit gives a Response with status 0 and the error, and an HTTP error status
+    a Response with that status and an error message.
+
+    Args:
+        urls: URLs to fetch
+        headers: Optional dict of HTTP headers for every request
+        timeout: Timeout of each request attempt in seconds
+        conditional: Revalidate with stored ETag / Last-Modified
+        retries: Maximum number of retries per URL
+
+    Returns:
+        Response for each URL in input order
+    """
+
+    def fetch(url: str) -> Response:
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            retry_after = None
+            try:
+                response = get(url, headers=headers, timeout=timeout, conditional=conditional)
+            except (CircuitOpenError, RateLimitTimeout) as e:
+                # The host is being spared, so retrying now would only be refused again
+                return Response.failed(url, e, time.monotonic() - started)
+            except Exception as e:
+                logger.warning(f"Request failed ({attempt}/{retries + 1}): {url} - {str(e)}")
+                response = Response.failed(url, e, time.monotonic() - started)
+            else:
+                if response.status < 400:
+                    return response
+                response.error = f"HTTP status {response.status}"
+                if response.status not in RETRYABLE_STATUSES:
+                    return response
+                retry_after = response.retry_after()
+                if retry_after is not None and retry_after > HTTP_RETRY_MAX_DELAY:
+                    logger.warning(f"Not retrying {url}: server asked to wait {retry_after:.0f}s")
+                    return response
+
+            if attempt > retries:
+                return response
+            if not get_retry_budget().try_spend():
+                logger.warning(f"Retry budget exhausted, not retrying: {url}")
+                return response
+            time.sleep(backoff_delay(attempt, retry_after))
+
+    if not urls:
+        return []
+    # Each request runs in a copy of the caller's context, so it records progress on the caller's checkpoint
+    executor = get_fetch_executor()
+    futures = [executor.submit(contextvars.copy_context().run, fetch, url) for url in urls]
+    return [future.result() for future in futures]
+
+
+def pycurl_get(url, headers=None, timeout=10, conditional=False):
+    """
+    Helper function to perform HTTP GET requests using the shared pycurl pool.
+
+    Uses a pooled pycurl handle (with keep-alive and HTTP/2 where supported),
+    SSL verification disabled and custom timeout.
+    Returns response status code and body text, decoded with the charset from the
+    Content-Type header or <meta> tag (UTF-8 if undeclared).
+
+    Args:
+        url: Target URL to request
+        headers: Optional dict of HTTP headers
+        timeout: Request timeout in seconds
+        conditional: Revalidate with stored ETag / Last-Modified (status 304 when unchanged)
+
+    Returns:
+        Tuple of (status_code, response_text)
+
+    Raises:
+        Exception: On pycurl errors
+    """
+    response = get(url, headers=headers, timeout=timeout, conditional=conditional)
+    return response.status, response.text
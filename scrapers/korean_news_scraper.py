@@ -1,9 +1,12 @@
-from io import BytesIO
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import quote, urljoin
 
-import pycurl
-from bs4 import BeautifulSoup
-
+from config import INCREMENTAL_LISTING, LISTING_MAX_PAGES, SKIP_SEEN_URLS
+from scrapers.checkpoint import record_high_water_mark, record_seen_urls
+from scrapers.http_client import fetch_all
+from scrapers.parsing import Markup, get_parser_backend, make_soup, run_parser
+from utils.cache import filter_unseen_urls, get_high_water_mark
 from utils.logger import setup_logger
 
 logger = setup_logger()
@@ -13,849 +16,341 @@ HEADERS = {
 }
 
 
-def pycurl_get(url, headers=None, timeout=10):
-    """
-    Helper function to perform HTTP GET requests using pycurl.
-
-    Uses pycurl with SSL verification disabled and custom timeout.
-    Returns response status code and body text.
-
-    Args:
-        url: Target URL to request
-        headers: Optional dict of HTTP headers
-        timeout: Request timeout in seconds
-
-    Returns:
-        Tuple of (status_code, response_text)
-
-    Raises:
-        Exception: On pycurl errors
-    """
-    buffer = BytesIO()
-    c = pycurl.Curl()
-    c.setopt(c.URL, url)
-    if headers:
-        header_list = [f"{key}: {value}" for key, value in headers.items()]
-        c.setopt(c.HTTPHEADER, header_list)
-    c.setopt(c.WRITEDATA, buffer)
-    c.setopt(c.TIMEOUT, timeout)
-    # Disable SSL verification
-    c.setopt(c.SSL_VERIFYPEER, 0)
-    c.setopt(c.SSL_VERIFYHOST, 0)
-    try:
-        c.perform()
-        status_code = c.getinfo(c.RESPONSE_CODE)
-        c.close()
-        body = buffer.getvalue()
-        return status_code, body.decode("utf-8", errors="replace")
-    except pycurl.error as e:
-        c.close()
-        raise Exception(e)
-
-
 def extract_article_content(html):
     """
     Extract main content text from HTML.
 
-    Parse HTML and extracts text from all paragraph and line break tags,
-    preserving paragraph structure.
+    Parse HTML (with the configured PARSER_BACKEND) and extracts text from all
+    paragraph and line break tags, preserving paragraph structure.
 
     Args:
-        html: HTML content as string
+        html: HTML content as string or UTF-8 bytes
 
     Returns:
         Extracted article text with paragraphs separated by newlines
     """
-    soup = BeautifulSoup(html, "html.parser")
-    content_parts = []
-    # Iterate through all <p> and <br> tags in sequence (collecting from anywhere in the document)
-    for tag in soup.find_all(["p", "br"]):
-        if tag.name == "br":
-            # <br> tags represent line breaks
-            content_parts.append("\n")
-        else:
-            text = tag.get_text(strip=True)
-            if text:
-                content_parts.append(text)
-    return "\n".join(content_parts)
-
-
-def fetch_naver_news(search_keyword="테슬라"):
-    """
-    Fetch Tesla-related news from Naver.
+    # All <p> and <br> tags in sequence (collecting from anywhere in the document)
+    return get_parser_backend().paragraph_text(html)
 
-    Scrapes Naver News search results for search_keyword, extracting:
-    - News titles and links
-    - Source publication
-    - Publication date/time
-    - Full article content by visiting each link
 
-    Args:
-        search_keyword: Keyword to search for (default: "테슬라")
-
-    Returns:
-        List of news item dictionaries
+def extract_selector_text(html, selectors, separator=" "):
     """
-    try:
-        # URL encode the search query
-        encoded_query = quote(search_keyword)
-        url = f"https://search.naver.com/search.naver?where=news&query={encoded_query}"
-        status, res_text = pycurl_get(url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception("HTTP error: " + str(status))
-
-        soup = BeautifulSoup(res_text, "html.parser")
-        news_items = []
-        # Naver news list is in <li class="bx"> elements within <ul class="list_news"> inside <div class="group_news">
-        for li in soup.select("div.group_news ul.list_news li.bx"):
-            # News title and link in <a class="news_tit">
-            title_tag = li.find("a", class_="news_tit")
-            if not title_tag:
-                continue
-            title = title_tag.get_text(strip=True)
-            link = title_tag["href"]
-
-            # Source publication info: <a class="info press">
-            source_tag = li.find("a", class_="info press")
-            source = source_tag.get_text(strip=True) if source_tag else "N/A"
-
-            # Publication time: first <span class="info"> tag that doesn't contain "네이버뉴스"
-            pub_time = ""
-            for span in li.find_all("span", class_="info"):
-                if "네이버뉴스" not in span.get_text():
-                    pub_time = span.get_text(strip=True)
-                    break
-
-            # Extract article content by visiting each news link
-            try:
-                status2, article_html = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status2 != 200:
-                    raise Exception("Article HTTP error: " + str(status2))
-                # Generally extract text from all <p> and <br> tags
-                content = extract_article_content(article_html)
-            except Exception:
-                # On error, fallback to using the title as content
-                content = title
-
-            news_items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": source,
-                    "published": pub_time,
-                    "content": content,
-                    "news_type": "domestic",  # Modify as needed
-                }
-            )
-        return news_items
-    except Exception as e:
-        logger.error(f"Naver news collection error: {e}")
-        return []
-
-
-def fetch_motorgraph_news(search_keyword="테슬라"):
-    """
-    Fetch Tesla-related news from Motorgraph.
+    Extract text from the first element matching one of the given CSS selectors.
 
-    Scrapes Motorgraph articles about search_keyword, extracting:
-    - News titles and URLs
-    - Article summaries and detailed content
-    - Publication dates
+    The HTML is parsed with the configured PARSER_BACKEND.
 
     Args:
-        search_keyword: Keyword to search for (default: "테슬라")
+        html: HTML content as string or UTF-8 bytes
+        selectors: CSS selectors tried in order
+        separator: Separator placed between text fragments
 
     Returns:
-        List of news item dictionaries
+        Text of the first matching element, or an empty string if none match
     """
-    try:
-        base_url = "https://www.motorgraph.com"
-        # URL encode the search query
-        encoded_query = quote(search_keyword)
-        url = urljoin(base_url, f"/news/articleList.html?sc_area=A&view_type=sm&sc_word={encoded_query}")
-        status, res_text = pycurl_get(url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-        soup = BeautifulSoup(res_text, "html.parser")
-        items = []
-        for li in soup.select("section#section-list ul.type li.item"):
-            title_tag = li.select_one("div.view-cont h2.titles a")
-            if not title_tag:
-                continue
-            title = title_tag.get_text().strip()
-            relative_link = title_tag["href"]
-            link = urljoin(base_url, relative_link)
-
-            # Get summary content from the listing page
-            summary_tag = li.select_one("div.view-cont p.lead a.read")
-            summary = summary_tag.get_text().strip() if summary_tag else ""
-            published_tag = li.select_one("div.view-cont em.replace-date")
-            published = published_tag.get_text().strip() if published_tag else ""
-
-            # Fetch detailed article content: extract text from "div.article-body" in the article detail page
-            detail_content = ""
-            try:
-                status_detail, detail_text = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status_detail == 200:
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    article_body = detail_soup.select_one("div.article-body")
-                    if article_body:
-                        detail_content = article_body.get_text(separator=" ", strip=True)
-            except Exception as e:
-                logger.error(f"Motorgraph article detail fetch error: {e}")
-
-            # Use detailed content if available, otherwise fall back to summary
-            content = detail_content if detail_content else summary
-
-            items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": "Motorgraph",
-                    "content": content,
-                    "published": published,
-                    "news_type": "domestic",
-                }
-            )
-        return items
-    except Exception as e:
-        logger.error(f"Motorgraph news collection error: {e}")
-        return []
+    return get_parser_backend().select_text(html, selectors, separator) or ""
 
 
-def fetch_auto_danawa_news(search_keyword="테슬라"):
+def fetch_detail_contents(urls: List[str], parse_detail: Callable[[str], str], label: str, timeout=10) -> List[str]:
     """
-    Fetch Tesla-related news from AUTO.DANAWA.
+    Fetch and parse article detail pages concurrently.
 
-    Scrapes news articles from AUTO.DANAWA containing search_keyword, extracting:
-    - Article titles and URLs
-    - Content text (from detail pages when possible)
-    - Publication dates and source information
+    Second phase of every scraper: once the listing page has been parsed, all detail
+    pages are requested together as one fetch_all batch (sharing the bounded request
+    threads of all scrapers) instead of one round trip at a time. Pages are parsed as
+    the batch completes; parsing holds the GIL, so overlapping it with the requests
+    of the same batch would gain nothing.
 
     Args:
-        search_keyword: Keyword to search for (default: "테슬라")
+        urls: Article URLs to fetch
+        parse_detail: Module-level function extracting the article text from detail page HTML
+            (run in the parser process pool when enabled)
+        label: Source name used in log messages
+        timeout: Request timeout in seconds
 
     Returns:
-        List of news item dictionaries
+        Extracted article text for each URL in input order (empty string on failure)
     """
-    try:
-        base_url = "https://auto.danawa.com"
-        # News list page URL (adjust path as needed)
-        # URL encode the search query
-        encoded_query = quote(search_keyword)
-        list_url = (
-            base_url
-            + f"/news/?SearchKey=subj&SearchWord={encoded_query}&x=0&y=0&Tab=A&NewsGroup=&useOldData=&Work=list"
-        )
-        status, res_text = pycurl_get(list_url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-        soup = BeautifulSoup(res_text, "html.parser")
-        items = []
-        # News list is in <tr> tags within <table class="newsTable">
-        for tr in soup.select("table.newsTable tbody tr"):
-            # News link is in <a> tag within image area or title area
-            link_tag = tr.select_one("td.image a") or tr.select_one("div.title a")
-            if not link_tag:
-                continue
-            relative_link = link_tag.get("href")
-            # Danawa news links already have Work=detail parameters for the detail page
-            link = urljoin(base_url, relative_link)
-
-            # Extract title and summary from the list page
-            title_tag = tr.select_one("div.title a")
-            title = title_tag.get_text(strip=True) if title_tag else ""
-            summary_tag = tr.select_one("div.summary")
-            summary = summary_tag.get_text(strip=True) if summary_tag else ""
-
-            # Extract date from the last <span> in info area (e.g., "2025.03.28.")
-            info_spans = tr.select("td.contents .info span")
-            published = ""
-            if info_spans:
-                # Use the last span tag which typically contains the date
-                published = info_spans[-1].get_text(strip=True)
-
-            # Extract full content from the article detail page (content is in <div class="board_exp">)
-            detail_content = ""
-            try:
-                status_detail, detail_text = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status_detail == 200:
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    board_exp = detail_soup.select_one("div.board_exp")
-                    if board_exp:
-                        detail_content = board_exp.get_text(separator=" ", strip=True)
-            except Exception as e:
-                logger.error(f"Danawa article detail fetch error: {e}")
-
-            # Use detailed content if available, otherwise fall back to summary
-            content = detail_content if detail_content else summary
-
-            # Extract press info from <span class="press"> within info area
-            press_tag = tr.select_one("td.contents .info span.press a")
-            source = press_tag.get_text(strip=True) if press_tag else ""
-
-            items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": source,
-                    "content": content,
-                    "published": published,
-                    "news_type": "domestic",
-                }
+    contents = []
+    for response in fetch_all(urls, headers=HEADERS, timeout=timeout):
+        if response.status != 200:
+            logger.error(
+                f"{label} article detail fetch error ({response.requested_url}): "
+                f"{response.error or f'HTTP status {response.status}'}"
             )
-        return items
-    except Exception as e:
-        logger.error(f"AUTO.DANAWA news collection error: {e}")
-        return []
-
-
-def fetch_etnews_news(search_keyword="테슬라"):
+            contents.append("")
+            continue
+        try:
+            contents.append(run_parser(parse_detail, response.markup))
+        except Exception as e:
+            logger.error(f"{label} article detail parse error ({response.requested_url}): {e}")
+            contents.append("")
+    return contents
+
+
+def fetch_listing_pages(
+    source: str,
+    search_keyword: str,
+    page_url: Callable[[int], str],
+    parse_page: Callable[[str], List[Dict[str, Any]]],
+    headers=HEADERS,
+    max_pages: int = LISTING_MAX_PAGES,
+    incremental: bool = True,
+) -> Optional[List[Dict[str, Any]]]:
     """
-    Fetch Tesla-related news from Electronic Times (ET News).
+    Read a recency-sorted listing incrementally, up to the previous high-water mark.
 
-    Scrapes news articles from Electronic Times search results for search_keyword,
-    extracting titles, URLs, content, publication dates and source information.
+    The first page is revalidated with a conditional GET. In incremental mode the
+    newest URL of the previous run (the high-water mark) is looked up and pages are
+    read forward until that URL, or a page with nothing unseen, is reached, so bursts
+    of new posts are fully covered without re-reading stable pages. Without a mark
+    (first run, or incremental mode disabled) only the first page is read.
 
     Args:
-        search_keyword: Keyword to search for (default: "테슬라")
+        source: Source name used for the high-water mark and log messages
+        search_keyword: Keyword the listing was searched for
+        page_url: Function returning the listing URL of a zero-based page index
+        parse_page: Module-level function turning a listing page body into items (newest first)
+            (run in the parser process pool when enabled)
+        headers: HTTP headers for listing requests
+        max_pages: Maximum number of pages to read
+        incremental: Whether the listing is sorted newest first, so a high-water mark applies
 
     Returns:
-        List of news item dictionaries
+        New items from newest to oldest, or None if the first page is unchanged (HTTP 304)
+
+    Raises:
+        Exception: If the first page cannot be fetched
     """
-    try:
-        # URL encode the search query
-        encoded_query = quote(search_keyword)
-        url = (
-            f"https://www.etnews.com/etnews/search.html?"
-            f"kwd={encoded_query}&date=0&startDate=&endDate="
-            f"&detailSearch=true&category=CATEGORY1&pageSize=&search_source=&sort=1&preKwd%5B0%5D={encoded_query}"
-        )
-        status, res_text = pycurl_get(url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-        soup = BeautifulSoup(res_text, "html.parser")
-        items = []
-        for li in soup.select("ul.news_list li"):
-            title_tag = li.select_one("div.text strong a")
-            if not title_tag:
-                continue
-            title = title_tag.get_text(strip=True)
-            link = title_tag.get("href", "")
-            summary_tag = li.select_one("div.text p.summary")
-            summary = summary_tag.get_text(strip=True) if summary_tag else ""
-            date_tag = li.select_one("div.text div.flex span.date")
-            published = date_tag.get_text(strip=True) if date_tag else ""
-            source_tag = li.select_one("div.text span.press a")
-            source = source_tag.get_text(strip=True) if source_tag else "ETNEWS"
-
-            # Fetch full article content from detail page
-            detail_content = ""
+    incremental = incremental and INCREMENTAL_LISTING
+    high_water_mark = None
+    if incremental:
+        try:
+            high_water_mark = get_high_water_mark(source, search_keyword)
+        except Exception as e:
+            logger.warning(f"{source} high-water mark lookup failed, reading the first page only: {e}")
+
+    items = []
+    seen_on_listing = set()
+    for page in range(max_pages if high_water_mark else 1):
+        # Pages are requested one at a time (paging stops at the mark) on the shared batch request threads
+        (response,) = fetch_all([page_url(page)], headers=headers, timeout=10, conditional=page == 0)
+        if page == 0 and response.status == 304:
+            return None
+        if response.status != 200:
+            error = response.error or f"HTTP status {response.status}"
+            if page == 0:
+                raise Exception(error)
+            logger.warning(f"{source} listing page {page + 1} fetch error: {error}")
+            break
+
+        # Posts can shift down a page while we read, so drop repeats across pages
+        page_items = [item for item in run_parser(parse_page, response.markup) if item["url"] not in seen_on_listing]
+        seen_on_listing.update(item["url"] for item in page_items)
+        new_items = []
+        for item in page_items:
+            if item["url"] == high_water_mark:
+                break
+            new_items.append(item)
+        items.extend(new_items)
+
+        if not high_water_mark or len(new_items) < len(page_items) or not new_items:
+            break
+        if SKIP_SEEN_URLS:
             try:
-                status_detail, detail_text = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status_detail == 200:
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    article_body = detail_soup.select_one("div.article_body")
-                    if article_body:
-                        detail_content = article_body.get_text(separator=" ", strip=True)
+                unseen = filter_unseen_urls([item["url"] for item in new_items])
             except Exception as e:
-                logger.error(f"ET News article detail fetch error: {e}")
-
-            # Use detailed content if available, otherwise use summary from list
-            content = detail_content if detail_content else summary
-
-            items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": source,
-                    "content": content,
-                    "published": published,
-                    "news_type": "domestic",
-                }
-            )
-        return items
-    except Exception as e:
-        logger.error(f"ET News collection error: {e}")
-        return []
+                logger.warning(f"{source} seen URL lookup failed, stopping at page {page + 1}: {e}")
+                break
+            if not unseen:
+                # The mark itself is gone (e.g. deleted post) but this page holds only known content
+                break
 
+    if incremental and items:
+        record_high_water_mark(source, search_keyword, items[0]["url"])
+    return items
 
-def fetch_heraldcorp_news(search_keyword="테슬라"):
+
+def fill_detail_contents(items: List[Dict[str, Any]], parse_detail: Callable[[str], str], label: str) -> List[dict]:
     """
-    Fetch Tesla-related news from Herald Corporation.
+    Complete listing items with the content of their detail pages.
 
-    Scrapes news articles from Herald Corporation (Herald Economy) search results
-    for search_keyword, extracting titles, URLs, content, and publication dates.
+    Items whose URL was already collected in an earlier cycle are dropped before
+    anything is downloaded. The remaining detail pages are fetched together and
+    every item whose detail page yields text gets it as content; other items keep
+    the content taken from the listing. The returned URLs are marked as seen once
+    the pipeline has taken the items (see scrapers.checkpoint).
 
     Args:
-        search_keyword: Keyword to search for (default: "테슬라")
+        items: Items parsed from a listing page, each with "url" and fallback "content"
+        parse_detail: Function extracting the article text from detail page HTML
+        label: Source name used in log messages
 
     Returns:
-        List of news item dictionaries
+        Items not seen before, with detail content filled in
     """
-    try:
-        base_url = "https://biz.heraldcorp.com"
-        # Herald Corporation news list page URL (adjust as needed)
-        # URL encode the search query
-        encoded_query = quote(search_keyword)
-        list_url = base_url + f"/search?q={encoded_query}"
-        status, res_text = pycurl_get(list_url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-        soup = BeautifulSoup(res_text, "html.parser")
-        items = []
-        # News list is in <li> items within <ul class="news_list">
-        for li in soup.select("ul.news_list li"):
-            link_tag = li.find("a")
-            if not link_tag:
-                continue
-            relative_link = link_tag.get("href")
-            link = urljoin(base_url, relative_link)
-            # Title is in <p class="news_title"> text
-            title_tag = li.select_one("div.news_txt p.news_title")
-            title = title_tag.get_text(strip=True) if title_tag else ""
-            # Extract summary text from list page
-            summary_tag = li.select_one("div.news_txt p.news_text")
-            summary = summary_tag.get_text(strip=True) if summary_tag else ""
-            # Date is in <span class="date"> text
-            date_tag = li.select_one("div.news_txt span.date")
-            published = date_tag.get_text(strip=True) if date_tag else ""
-            # Set source as 'Herald Economy' when not explicitly provided
-            source = "Herald Economy"
-
-            # Fetch full content from article detail page
-            detail_content = ""
-            try:
-                status_detail, detail_text = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status_detail == 200:
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    article_body = detail_soup.select_one("article.article-view.article-body#articleText")
-                    if article_body:
-                        detail_content = article_body.get_text(separator=" ", strip=True)
-            except Exception as e:
-                logger.error(f"Herald Economy article detail fetch error: {e}")
-
-            # Use detailed content if available, otherwise use summary from list
-            content = detail_content if detail_content else summary
-
-            items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": source,
-                    "content": content,
-                    "published": published,
-                    "news_type": "domestic",
-                }
-            )
-        return items
-    except Exception as e:
-        logger.error(f"Herald Economy news collection error: {e}")
-        return []
-
-
-def fetch_donga_news(search_keyword="테슬라"):
+    if SKIP_SEEN_URLS and items:
+        try:
+            unseen = set(filter_unseen_urls([item["url"] for item in items]))
+        except Exception as e:
+            logger.warning(f"{label} seen-URL lookup failed, fetching all detail pages: {e}")
+            unseen = {item["url"] for item in items}
+        if len(unseen) < len(items):
+            logger.info(f"{label}: skipping {len(items) - len(unseen)}/{len(items)} already seen articles")
+        items = [item for item in items if item["url"] in unseen]
+
+    contents = fetch_detail_contents([item["url"] for item in items], parse_detail, label)
+    for item, content in zip(items, contents):
+        if content:
+            item["content"] = content
+
+    if SKIP_SEEN_URLS and items:
+        record_seen_urls([item["url"] for item in items])
+    return items
+
+
+def select_field(element, spec) -> str:
     """
-    Fetch Tesla-related news from Donga.com.
-
-    Scrapes news articles from Donga.com search results for search_keyword, extracting:
-    - Article titles and URLs
-    - Content text from detail pages
-    - Publication dates and source information
+    Extract the text of a listing field described by a field spec.
 
     Args:
-        search_keyword: Keyword to search for (default: "테슬라")
+        element: BeautifulSoup element of one search result
+        spec: CSS selector, tuple of selectors tried in order, or dict with "selector",
+            "default", "pick" and "exclude" (see scrapers.news_sources)
 
     Returns:
-        List of news item dictionaries
+        Stripped text of the matching element, or the spec's default ("" if none)
     """
-    try:
-        base_url = "https://www.donga.com"
-        # URL encode the search query
-        encoded_query = quote(search_keyword)
-        # Donga.com news list page
-        list_url = base_url + f"/search?query={encoded_query}&writer=&sort=1&search_date=1&p=1"
-        status, res_text = pycurl_get(list_url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-        soup = BeautifulSoup(res_text, "html.parser")
-        items = []
-        # News items in search results are in <div class="articleList"> > <div class="searchResult">
-        for result in soup.select("div.articleList div.searchResult"):
-            link_tag = result.select_one("a.tit")
-            if not link_tag:
-                continue
-            title = link_tag.get_text(strip=True)
-            relative_link = link_tag.get("href")
-            # Handle URLs based on whether they are absolute or relative
-            if relative_link.startswith("http"):
-                link = relative_link
-            else:
-                link = urljoin(base_url, relative_link)
-            # Extract summary from search result
-            summary_tag = result.select_one("div.articleTxt")
-            summary = summary_tag.get_text(strip=True) if summary_tag else ""
-            # Extract date from <span class="date"> within the article info area
-            date_tag = result.select_one("span.date")
-            published = date_tag.get_text(strip=True) if date_tag else ""
-            # Extract source info (usually "동아일보" or another Donga.com publication)
-            source_tag = result.select_one("span.medium")
-            source = source_tag.get_text(strip=True) if source_tag else "동아일보"
-
-            # Fetch full content from detail page
-            detail_content = ""
-            try:
-                status_detail, detail_text = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status_detail == 200:
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    # Donga.com article content is typically in <div class="article_txt">
-                    article_div = detail_soup.select_one("div.article_txt")
-                    if article_div:
-                        detail_content = article_div.get_text(separator=" ", strip=True)
-            except Exception as e:
-                logger.error(f"Donga article detail fetch error: {e}")
-
-            # Use detailed content if available, otherwise fall back to summary
-            content = detail_content if detail_content else summary
-
-            items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": source,
-                    "content": content,
-                    "published": published,
-                    "news_type": "domestic",
-                }
-            )
-        return items
-    except Exception as e:
-        logger.error(f"Donga.com news collection error: {e}")
-        return []
-
-
-def fetch_edaily_news(search_keyword="테슬라"):
+    if spec is None:
+        return ""
+    if not isinstance(spec, dict):
+        spec = {"selector": spec}
+    selectors = spec.get("selector") or ()
+    if isinstance(selectors, str):
+        selectors = (selectors,)
+    for selector in selectors:
+        matches = element.select(selector)
+        if spec.get("exclude"):
+            matches = [match for match in matches if spec["exclude"] not in match.get_text()]
+        if matches:
+            match = matches[-1] if spec.get("pick") == "last" else matches[0]
+            return match.get_text(strip=True)
+    return spec.get("default", "")
+
+
+def select_first(element, selectors):
     """
-    Fetch Tesla-related news from Edaily (Economic Daily).
-
-    Scrapes news articles from Edaily search results for search_keyword, extracting:
-    - Article titles and URLs
-    - Content text from detail pages when possible
-    - Publication dates and source information
+    Return the first element matching one of the given CSS selectors.
 
     Args:
-        search_keyword: Keyword to search for (default: "테슬라")
+        element: BeautifulSoup element to search in
+        selectors: CSS selector or tuple of selectors tried in order
 
     Returns:
-        List of news item dictionaries
+        Matching element, or None
     """
-    try:
-        base_url = "https://www.edaily.co.kr"
-        # URL encode the search query
-        encoded_query = quote(search_keyword)
-        # Edaily search URL format
-        list_url = f"https://www.edaily.co.kr/search/news/?keyword={encoded_query}&page=1"
-        status, res_text = pycurl_get(list_url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-        soup = BeautifulSoup(res_text, "html.parser")
-        items = []
-        # News items are in <li> tags inside <ul class="news_list">
-        for li in soup.select("ul.news_list li"):
-            # Find the title and link in <a> tag (first one with class="tit")
-            link_tag = li.select_one("a.tit")
-            if not link_tag:
-                continue
-            title = link_tag.get_text(strip=True)
-            relative_link = link_tag.get("href")
-            # Handle relative vs absolute URLs
-            if relative_link.startswith("http"):
-                link = relative_link
-            else:
-                link = urljoin(base_url, relative_link)
-
-            # Extract source and date (typically near each other in the item metadata)
-            meta_div = li.select_one("div.news_info")
-            source = "이데일리"  # Default source name
-            published = ""
-            if meta_div:
-                # Extract date from span with explicit date formatting
-                date_span = meta_div.select_one("span.date")
-                if date_span:
-                    published = date_span.get_text(strip=True)
-
-            # Extract listing summary
-            summary_div = li.select_one("div.news_txt")
-            summary = summary_div.get_text(strip=True) if summary_div else ""
-
-            # Fetch detailed content from article page
-            detail_content = ""
-            try:
-                status_detail, detail_text = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status_detail == 200:
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    # Edaily content div may use various class names
-                    article_div = (
-                        detail_soup.select_one("div#news_body")
-                        or detail_soup.select_one("div.news_body")
-                        or detail_soup.select_one("div.news_content")
-                    )
-                    if article_div:
-                        detail_content = article_div.get_text(separator="\n", strip=True)
-            except Exception as e:
-                logger.error(f"Edaily article detail fetch error: {e}")
-
-            # Use detailed content if available, otherwise use summary
-            content = detail_content if detail_content else summary
-
-            items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": source,
-                    "content": content,
-                    "published": published,
-                    "news_type": "domestic",
-                }
-            )
-        return items
-    except Exception as e:
-        logger.error(f"Edaily news collection error: {e}")
-        return []
+    if isinstance(selectors, str):
+        selectors = (selectors,)
+    for selector in selectors:
+        match = element.select_one(selector)
+        if match:
+            return match
+    return None
 
 
-def fetch_chosunbiz_news(search_keyword="테슬라"):
+def parse_news_listing(source: Dict[str, Any], html: Markup) -> List[Dict[str, Any]]:
     """
-    Fetch Tesla-related news from ChosunBiz.
-
-    Scrapes news articles from ChosunBiz search results for search_keyword, extracting:
-    - Article titles and URLs
-    - Content text from detail pages
-    - Publication dates and source information
+    Parse a search results page of a configured news source.
 
     Args:
-        search_keyword: Keyword to search for (default: "테슬라")
+        source: Source configuration from scrapers.news_sources
+        html: Listing page HTML content as string or UTF-8 bytes
 
     Returns:
-        List of news item dictionaries
+        List of news item dictionaries with the listing summary (or title) as content
     """
-    try:
-        base_url = "https://biz.chosun.com"
-        # URL encode the search query
-        encoded_query = quote(search_keyword)
-        # ChosunBiz search URL format
-        list_url = base_url + f"/svc/search/searchAllList.html?query={encoded_query}"
-        status, res_text = pycurl_get(list_url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-        soup = BeautifulSoup(res_text, "html.parser")
-        items = []
-        # News items are in <li> tags inside <div class="find_news_list"> > <ul>
-        for li in soup.select("div.find_news_list ul li"):
-            # Find the article title and link (typically within <dt> tag)
-            title_tag = li.select_one("dt a") or li.select_one("a")
-            if not title_tag:
-                continue
-            title = title_tag.get_text(strip=True)
-            relative_link = title_tag.get("href")
-            # Handle relative vs absolute URLs
-            if relative_link.startswith("http"):
-                link = relative_link
-            else:
-                link = urljoin(base_url, relative_link)
-
-            # Extract summary from <dd class="desc">
-            summary_tag = li.select_one("dd.desc")
-            summary = summary_tag.get_text(strip=True) if summary_tag else ""
-
-            # Extract publication date and source info
-            source = "조선비즈"  # Default source name
-            published = ""
-            date_tag = li.select_one("dd.date")
-            if date_tag:
-                published = date_tag.get_text(strip=True)
-
-            # Fetch detailed content from article page
-            detail_content = ""
-            try:
-                status_detail, detail_text = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status_detail == 200:
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    # ChosunBiz article content is typically in <div class="article">
-                    article_div = detail_soup.select_one("div.article")
-                    if article_div:
-                        detail_content = article_div.get_text(separator=" ", strip=True)
-            except Exception as e:
-                logger.error(f"ChosunBiz article detail fetch error: {e}")
-
-            # Use detailed content if available, otherwise use summary
-            content = detail_content if detail_content else summary
-
-            items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": source,
-                    "content": content,
-                    "published": published,
-                    "news_type": "domestic",
-                }
-            )
-        return items
-    except Exception as e:
-        logger.error(f"ChosunBiz news collection error: {e}")
-        return []
+    soup = make_soup(html)
+    items = []
+    for element in soup.select(source["item"]):
+        link_tag = select_first(element, source["link"])
+        if not link_tag or not link_tag.get("href"):
+            continue
+        # Relative links are resolved, absolute ones are kept as they are
+        link = urljoin(source["base_url"], link_tag["href"])
+        title = select_field(element, source["title"]) if "title" in source else link_tag.get_text(strip=True)
+        summary = select_field(element, source["summary"]) if source.get("summary") else title
+
+        items.append(
+            {
+                "title": title,
+                "url": link,
+                "source": select_field(element, source.get("source")),
+                "content": summary,
+                "published": select_field(element, source.get("published")),
+                "news_type": "domestic",
+            }
+        )
+    return items
 
 
-def fetch_autodaily_news(search_keyword="테슬라"):
+def get_detail_parser(source: Dict[str, Any]) -> Callable[[str], str]:
     """
-    Fetch Tesla-related news from AutoDaily.
+    Build the detail page parser of a configured news source.
 
-    Scrapes news articles from AutoDaily search results for search_keyword, extracting:
-    - Article titles and URLs
-    - Content text from detail pages
-    - Publication dates and source information
+    The parser is a partial of a module-level function, so it can be sent to the
+    parser process pool.
 
     Args:
-        search_keyword: Keyword to search for (default: "테슬라")
+        source: Source configuration from scrapers.news_sources
 
     Returns:
-        List of news item dictionaries
+        Function extracting the article text from detail page HTML
     """
-    try:
-        base_url = "http://www.autodaily.co.kr"
-        # URL encode the search query
-        encoded_query = quote(search_keyword)
-        list_url = base_url + f"/news/newsList.doj?searchKeyWord={encoded_query}"
-        status, res_text = pycurl_get(list_url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-        soup = BeautifulSoup(res_text, "html.parser")
-        items = []
-        # News items are in <ul class="news_list"> > <li> tags
-        for li in soup.select("ul.news_list li"):
-            # Find title and link (typically in <a> tag)
-            title_tag = li.select_one("a")
-            if not title_tag:
-                continue
-            title = title_tag.get_text(strip=True)
-            relative_link = title_tag.get("href")
-            # Handle relative URLs
-            link = urljoin(base_url, relative_link)
-
-            # Extract source (always AutoDaily) and date (if available)
-            source = "AutoDaily"
-            published = ""
-            date_tag = li.select_one("span.date")
-            if date_tag:
-                published = date_tag.get_text(strip=True)
-
-            # Fetch detailed content from the article page
-            detail_content = ""
-            try:
-                status_detail, detail_text = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status_detail == 200:
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    # AutoDaily article content is typically in <div id="news_body_area">
-                    article_div = detail_soup.select_one("div#news_body_area")
-                    if article_div:
-                        detail_content = article_div.get_text(separator=" ", strip=True)
-            except Exception as e:
-                logger.error(f"AutoDaily article detail fetch error: {e}")
-
-            # Set content to detail_content or title if detail fetch failed
-            content = detail_content if detail_content else title
-
-            items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": source,
-                    "content": content,
-                    "published": published,
-                    "news_type": "domestic",
-                }
-            )
-        return items
-    except Exception as e:
-        logger.error(f"AutoDaily news collection error: {e}")
-        return []
+    if not source.get("body"):
+        # Generally text from all <p> and <br> tags
+        return extract_article_content
+    return partial(extract_selector_text, selectors=source["body"], separator=source.get("body_separator", " "))
 
 
-def fetch_itchosun_news(search_keyword="테슬라"):
+def fetch_news_source(source: Dict[str, Any], search_keyword="테슬라"):
     """
-    Fetch Tesla-related news from IT Chosun.
+    Fetch Tesla-related news from a configured news source.
 
-    Scrapes news articles from IT Chosun search results for search_keyword, extracting:
-    - Article titles and URLs
-    - Content text from detail pages
+    Scrapes the source's search results for search_keyword, extracting:
+    - News titles and URLs
+    - Article summaries (used as content when the detail page cannot be fetched)
     - Publication dates and source information
+    - Full article content by visiting each link
+
+    The listing is revalidated with a conditional GET, incremental sources are read
+    up to the newest article of the previous run, articles seen in earlier cycles are
+    skipped and the remaining detail pages are fetched together.
 
     Args:
+        source: Source configuration from scrapers.news_sources
         search_keyword: Keyword to search for (default: "테슬라")
 
     Returns:
         List of news item dictionaries
     """
+    name = source["name"]
     try:
-        base_url = "https://it.chosun.com"
         # URL encode the search query
         encoded_query = quote(search_keyword)
-        list_url = base_url + f"/it/search/?query={encoded_query}"
-        status, res_text = pycurl_get(list_url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-        soup = BeautifulSoup(res_text, "html.parser")
-        items = []
-        # News items are in <li> tags inside <div class="search_news_box"> > <ul class="list">
-        for li in soup.select("div.search_news_box ul.list li"):
-            # Find title and link (usually in <a> tag inside <strong> or <div>)
-            title_tag = li.select_one("strong a") or li.select_one("div.tit a")
-            if not title_tag:
-                continue
-            title = title_tag.get_text(strip=True)
-            relative_link = title_tag.get("href")
-            # Handle relative URLs
-            link = urljoin(base_url, relative_link)
-
-            # Extract source and date info
-            source = "IT조선"  # Default source name
-            published = ""
-            date_tag = li.select_one("span.date") or li.select_one("div.date")
-            if date_tag:
-                published = date_tag.get_text(strip=True)
-
-            # Extract summary from the search result
-            summary_tag = li.select_one("p.txt") or li.select_one("div.txt")
-            summary = summary_tag.get_text(strip=True) if summary_tag else ""
-
-            # Fetch detailed content from article page
-            detail_content = ""
-            try:
-                status_detail, detail_text = pycurl_get(link, headers=HEADERS, timeout=10)
-                if status_detail == 200:
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    # IT Chosun article content is typically in <div id="news_body_id">
-                    article_div = detail_soup.select_one("div#news_body_id")
-                    if article_div:
-                        detail_content = article_div.get_text(separator=" ", strip=True)
-            except Exception as e:
-                logger.error(f"IT Chosun article detail fetch error: {e}")
-
-            # Use detailed content if available, otherwise use summary
-            content = detail_content if detail_content else summary
-
-            items.append(
-                {
-                    "title": title,
-                    "url": link,
-                    "source": source,
-                    "content": content,
-                    "published": published,
-                    "news_type": "domestic",
-                }
-            )
-        return items
+        incremental = source.get("incremental", False)
+        items = fetch_listing_pages(
+            name,
+            search_keyword,
+            lambda page: source["listing_url"].format(query=encoded_query, page=page + 1),
+            partial(parse_news_listing, source),
+            max_pages=LISTING_MAX_PAGES if incremental else 1,
+            incremental=incremental,
+        )
+        if items is None:
+            logger.info(f"{name} search results unchanged for '{search_keyword}', skipping")
+            return []
+
+        # Keeping the listing summary where the detail fetch failed
+        return fill_detail_contents(items, get_detail_parser(source), name)
     except Exception as e:
-        logger.error(f"IT Chosun news collection error: {e}")
+        logger.error(f"{name} news collection error: {e}")
         return []
@@ -0,0 +1,180 @@
+"""
+Declarative configuration of the Korean news sources.
+
+Every source is scraped by the same engine (scrapers.korean_news_scraper.fetch_news_source),
+so adding a source only needs an entry here. Keys of a source entry:
+
+- name: Source name used for tasks, high-water marks and log messages
+- listing_url: Search results URL template; {query} is the URL-encoded keyword and
+  {page} the 1-based page number
+- base_url: Base URL relative article links are resolved against
+- incremental: The listing is sorted newest first, so it is read page by page up to
+  the newest article of the previous run (default: False, first page only)
+- item: CSS selector of one search result on the listing page
+- link: Field spec of the element whose href is the article URL; results without it are skipped
+- title: Field spec of the title (default: text of the link element)
+- summary: Field spec of the listing summary used as content until the detail page is
+  fetched (default: the title)
+- published: Field spec of the publication date
+- source: Field spec of the publisher name
+- body: CSS selectors of the article body on the detail page, tried in order
+  (default: text of all <p> / <br> tags, see extract_article_content)
+- body_separator: Separator between text fragments of the body (default: " ")
+
+A field spec is a CSS selector, a tuple of selectors tried in order, or a dict with
+"selector" (selector or tuple), "default" (value when nothing matches), "pick"
+("first" or "last" match) and "exclude" (skip matches whose text contains it).
+"""
+
+NEWS_SOURCES = [
+    {
+        "name": "Naver",
+        "listing_url": "https://search.naver.com/search.naver?where=news&query={query}",
+        "base_url": "https://search.naver.com",
+        # Naver news list is in <li class="bx"> elements within <ul class="list_news"> inside <div class="group_news">
+        "item": "div.group_news ul.list_news li.bx",
+        "link": "a.news_tit",
+        "summary": None,
+        # Publication time: first <span class="info"> tag that doesn't contain "네이버뉴스"
+        "published": {"selector": "span.info", "exclude": "네이버뉴스"},
+        "source": {"selector": "a.info.press", "default": "N/A"},
+    },
+    {
+        "name": "Motorgraph",
+        "listing_url": (
+            "https://www.motorgraph.com/news/articleList.html?page={page}&sc_area=A&view_type=sm&sc_word={query}"
+        ),
+        "base_url": "https://www.motorgraph.com",
+        "incremental": True,
+        "item": "section#section-list ul.type li.item",
+        "link": "div.view-cont h2.titles a",
+        "summary": "div.view-cont p.lead a.read",
+        "published": "div.view-cont em.replace-date",
+        "source": {"default": "Motorgraph"},
+        "body": ("div.article-body",),
+    },
+    {
+        "name": "AUTO.DANAWA",
+        "listing_url": (
+            "https://auto.danawa.com/news/?SearchKey=subj&SearchWord={query}"
+            "&x=0&y=0&Tab=A&NewsGroup=&useOldData=&Work=list"
+        ),
+        "base_url": "https://auto.danawa.com",
+        # News list is in <tr> tags within <table class="newsTable">
+        "item": "table.newsTable tbody tr",
+        # Danawa news links already have Work=detail parameters for the detail page
+        "link": ("td.image a", "div.title a"),
+        "title": "div.title a",
+        "summary": "div.summary",
+        # The last span of the info area typically contains the date (e.g., "2025.03.28.")
+        "published": {"selector": "td.contents .info span", "pick": "last"},
+        "source": "td.contents .info span.press a",
+        "body": ("div.board_exp",),
+    },
+    {
+        "name": "ET News",
+        "listing_url": (
+            "https://www.etnews.com/etnews/search.html?kwd={query}&date=0&startDate=&endDate="
+            "&detailSearch=true&category=CATEGORY1&pageSize=&search_source=&sort=1&preKwd%5B0%5D={query}"
+        ),
+        "base_url": "https://www.etnews.com",
+        "item": "ul.news_list li",
+        "link": "div.text strong a",
+        "summary": "div.text p.summary",
+        "published": "div.text div.flex span.date",
+        "source": {"selector": "div.text span.press a", "default": "ETNEWS"},
+        "body": ("div.article_body",),
+    },
+    {
+        "name": "Herald Economy",
+        "listing_url": "https://biz.heraldcorp.com/search?q={query}",
+        "base_url": "https://biz.heraldcorp.com",
+        "item": "ul.news_list li",
+        "link": "a",
+        "title": "div.news_txt p.news_title",
+        "summary": "div.news_txt p.news_text",
+        "published": "div.news_txt span.date",
+        "source": {"default": "Herald Economy"},
+        "body": ("article.article-view.article-body#articleText",),
+    },
+    {
+        "name": "Donga.com",
+        "listing_url": "https://www.donga.com/search?query={query}&writer=&sort=1&search_date=1&p={page}",
+        "base_url": "https://www.donga.com",
+        # News items in search results are in <div class="articleList"> > <div class="searchResult">
+        "item": "div.articleList div.searchResult",
+        "link": "a.tit",
+        "summary": "div.articleTxt",
+        "published": "span.date",
+        # Usually "동아일보" or another Donga.com publication
+        "source": {"selector": "span.medium", "default": "동아일보"},
+        "body": ("div.article_txt",),
+    },
+    {
+        "name": "Edaily",
+        "listing_url": "https://www.edaily.co.kr/search/news/?keyword={query}&page={page}",
+        "base_url": "https://www.edaily.co.kr",
+        "item": "ul.news_list li",
+        "link": "a.tit",
+        "summary": "div.news_txt",
+        "published": "div.news_info span.date",
+        "source": {"default": "이데일리"},
+        # Edaily content div may use various class names
+        "body": ("div#news_body", "div.news_body", "div.news_content"),
+        "body_separator": "\n",
+    },
+    {
+        "name": "ChosunBiz",
+        "listing_url": "https://biz.chosun.com/svc/search/searchAllList.html?query={query}",
+        "base_url": "https://biz.chosun.com",
+        # News items are in <li> tags inside <div class="find_news_list"> > <ul>
+        "item": "div.find_news_list ul li",
+        "link": ("dt a", "a"),
+        "summary": "dd.desc",
+        "published": "dd.date",
+        "source": {"default": "조선비즈"},
+        "body": ("div.article",),
+    },
+    {
+        "name": "AutoDaily",
+        "listing_url": "http://www.autodaily.co.kr/news/newsList.doj?searchKeyWord={query}",
+        "base_url": "http://www.autodaily.co.kr",
+        "item": "ul.news_list li",
+        "link": "a",
+        "summary": None,
+        "published": "span.date",
+        "source": {"default": "AutoDaily"},
+        "body": ("div#news_body_area",),
+    },
+    {
+        "name": "IT Chosun",
+        "listing_url": "https://it.chosun.com/it/search/?query={query}",
+        "base_url": "https://it.chosun.com",
+        # News items are in <li> tags inside <div class="search_news_box"> > <ul class="list">
+        "item": "div.search_news_box ul.list li",
+        "link": ("strong a", "div.tit a"),
+        "summary": ("p.txt", "div.txt"),
+        "published": ("span.date", "div.date"),
+        "source": {"default": "IT조선"},
+        "body": ("div#news_body_id",),
+    },
+]
+
+
+def get_news_source(name):
+    """
+    Look up a news source configuration by name.
+
+    Args:
+        name: Source name (e.g. "Motorgraph")
+
+    Returns:
+        Source configuration dict
+
+    Raises:
+        KeyError: If no source has that name
+    """
+    for source in NEWS_SOURCES:
+        if source["name"] == name:
+            return source
+    raise KeyError(name)
@@ -0,0 +1,358 @@
+import multiprocessing
+import pickle
+import re
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional, Sequence, TypeVar, Union
+
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+from config import PARSE_BODY_ONLY, PARSE_PROCESSES, PARSER_BACKEND
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+T = TypeVar("T")
+
+# Page markup as decoded text or as UTF-8 encoded bytes (see utils.http_response.Response.markup)
+Markup = Union[str, bytes]
+
+# Tags whose text BeautifulSoup leaves out of get_text()
+NON_TEXT_TAGS = ["script", "style", "template", "rt", "rp"]
+
+# Leading compound selector (tag, #id, .class) of a CSS selector, up to the first combinator
+COMPOUND_SELECTOR = re.compile(r"^(?P<name>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:[.#][\w-]+)*)(?=$|\s|>)")
+
+# Parser backends by name, created on first use
+_backends: Dict[str, "ParserBackend"] = {}
+_backends_lock = threading.Lock()
+
+# Process pool shared by all scrapers for CPU-bound HTML parsing
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get or create the process pool used for HTML parsing.
+
+    Worker processes are started with "spawn" so they never inherit the scraper
+    threads, locks or open pycurl connections of the parent process.
+
+    Returns:
+        Shared ProcessPoolExecutor instance, or None if PARSE_PROCESSES is 0
+    """
+    global _parse_pool
+    if PARSE_PROCESSES <= 0:
+        return None
+    if _parse_pool is None:
+        with _parse_pool_lock:
+            if _parse_pool is None:
+                _parse_pool = ProcessPoolExecutor(
+                    max_workers=PARSE_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+                )
+    return _parse_pool
+
+
+def close_parse_pool() -> None:
+    """
+    Shut down the HTML parser process pool.
+
+    This should be called when shutting down the application so worker
+    processes do not outlive it.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = None
+
+
+def make_soup(html: Markup, features: str = "html.parser", **kwargs) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup tree from text or UTF-8 bytes.
+
+    Bytes are declared UTF-8 instead of letting BeautifulSoup guess their encoding
+    (the HTTP client has already settled the charset).
+
+    Args:
+        html: Page HTML as string or UTF-8 bytes
+        features: Tree builder name
+        **kwargs: Further BeautifulSoup arguments (e.g. parse_only)
+
+    Returns:
+        Parsed BeautifulSoup tree
+    """
+    if isinstance(html, bytes):
+        kwargs["from_encoding"] = "utf-8"
+    return BeautifulSoup(html, features, **kwargs)
+
+
+def run_parser(parse: Callable[[Markup], T], html: Markup) -> T:
+    """
+    Run an HTML parsing function, in a worker process when the parse pool is enabled.
+
+    Raw HTML goes to the worker and only the compact extracted result (text or
+    item dicts) comes back, so parsing scales across cores without holding the
+    GIL of the process serving the webhook. The calling scraper thread blocks
+    until the result is ready. If the function cannot be sent to a worker (e.g.
+    a lambda) or the pool broke, the HTML is parsed in the calling thread.
+
+    Args:
+        parse: Module-level function turning HTML into extracted fields
+        html: Page HTML as string or UTF-8 bytes
+
+    Returns:
+        Result of parse(html)
+    """
+    global _parse_pool
+    pool = get_parse_pool()
+    if pool is None:
+        return parse(html)
+    try:
+        # Checked up front: errors raised by the parser itself must propagate, not trigger a fallback
+        pickle.dumps(parse)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        logger.warning(f"Parser {getattr(parse, '__name__', parse)} cannot run in a worker process: {e}")
+        return parse(html)
+    try:
+        return pool.submit(parse, html).result()
+    except BrokenProcessPool as e:
+        logger.error(f"HTML parser process pool broke, restarting it: {e}")
+        with _parse_pool_lock:
+            if _parse_pool is pool:
+                _parse_pool = None
+    return parse(html)
+
+
+class ParserBackend(ABC):
+    """
+    Text extraction primitives used by the article detail parsers.
+
+    Every backend produces the same text as BeautifulSoup with html.parser:
+    text fragments are stripped, empty ones dropped, and the contents of
+    script / style / template / ruby annotation tags are ignored.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def paragraph_text(self, html: Markup) -> str:
+        """Text of every <p> tag, with <br> tags as blank lines, in document order"""
+
+    @abstractmethod
+    def select_text(
+        self, html: Markup, selectors: Sequence[str], separator: str = " ", exclude: Sequence[str] = ()
+    ) -> Optional[str]:
+        """
+        Text of the first element matching one of the CSS selectors.
+
+        Args:
+            html: Page HTML as string or UTF-8 bytes
+            selectors: CSS selectors tried in order
+            separator: Separator placed between text fragments
+            exclude: Tag names removed from the element before extracting its text
+
+        Returns:
+            Element text, or None if no selector matches
+        """
+
+
+class ContainerFilter(ElementFilter):
+    """
+    Parse-time filter keeping only the subtrees that can contain a selector match.
+
+    Each selector is reduced to its leading compound selector (tag name, id and
+    classes). Top-level elements matching one of them are built with their whole
+    subtree; all other markup is tokenized but never turned into tree nodes, which
+    is where BeautifulSoup spends most of its time and memory on large pages.
+    Selector matches are unchanged, because any match of a descendant or child
+    selector lies inside an element matching its leading compound.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+
+    @classmethod
+    def for_selectors(cls, selectors: Sequence[str]) -> Optional["ContainerFilter"]:
+        """
+        Build a filter for CSS selectors, or None if one of them cannot be reduced.
+
+        Selectors with sibling combinators, attribute selectors or pseudo-classes
+        in their leading compound need the whole document.
+        """
+        rules = []
+        for selector in selectors:
+            if "+" in selector or "~" in selector:
+                return None
+            match = COMPOUND_SELECTOR.match(selector.strip())
+            if not match or not (match.group("name") or match.group("rest")):
+                return None
+            name = match.group("name")
+            rest = match.group("rest")
+            ids = re.findall(r"#([\w-]+)", rest)
+            rules.append(
+                (
+                    None if name in (None, "*") else name.lower(),
+                    ids[0] if ids else None,
+                    set(re.findall(r"\.([\w-]+)", rest)),
+                )
+            )
+        return cls(rules)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        classes = attrs.get("class") or ""
+        if not isinstance(classes, str):
+            classes = " ".join(classes)
+        classes = set(classes.split())
+        for rule_name, rule_id, rule_classes in self.rules:
+            if rule_name and rule_name != name:
+                continue
+            if rule_id and attrs.get("id") != rule_id:
+                continue
+            if rule_classes <= classes:
+                return True
+        return False
+
+    def allow_string_creation(self, string: str) -> bool:
+        # Strings inside kept elements are always created; top-level strings are never needed
+        return False
+
+
+class SoupBackend(ParserBackend):
+    """BeautifulSoup with the given tree builder ("html.parser" or "lxml")"""
+
+    def __init__(self, features: str):
+        self.name = features
+        self.features = features
+
+    def _soup(self, html: Markup, selectors: Sequence[str]) -> BeautifulSoup:
+        # With PARSE_BODY_ONLY only the subtrees the selectors can match are built
+        parse_only = ContainerFilter.for_selectors(selectors) if PARSE_BODY_ONLY else None
+        return make_soup(html, self.features, parse_only=parse_only)
+
+    def paragraph_text(self, html: Markup) -> str:
+        soup = self._soup(html, ("p", "br"))
+        content_parts = []
+        for tag in soup.find_all(["p", "br"]):
+            if tag.name == "br":
+                # <br> tags represent line breaks
+                content_parts.append("\n")
+            else:
+                text = tag.get_text(strip=True)
+                if text:
+                    content_parts.append(text)
+        return "\n".join(content_parts)
+
+    def select_text(
+        self, html: Markup, selectors: Sequence[str], separator: str = " ", exclude: Sequence[str] = ()
+    ) -> Optional[str]:
+        soup = self._soup(html, selectors)
+        for selector in selectors:
+            element = soup.select_one(selector)
+            if element:
+                for tag in element.find_all(list(exclude)) if exclude else []:
+                    tag.decompose()
+                return element.get_text(separator=separator, strip=True)
+        return None
+
+
+class SelectolaxBackend(ParserBackend):
+    """selectolax's lexbor bindings, a C HTML5 parser with CSS selector support"""
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser = LexborHTMLParser
+
+    def _tree(self, html: Markup):
+        tree = self._parser(html)
+        tree.strip_tags(NON_TEXT_TAGS)
+        return tree
+
+    @staticmethod
+    def _text(node, separator: str = "") -> str:
+        # Node.text(strip=True) keeps whitespace-only fragments, so join the stripped text nodes directly
+        parts = (child.text_content.strip() for child in node.traverse(include_text=True) if child.tag == "-text")
+        return separator.join(part for part in parts if part)
+
+    def paragraph_text(self, html: Markup) -> str:
+        content_parts = []
+        for node in self._tree(html).css("p, br"):
+            if node.tag == "br":
+                content_parts.append("\n")
+            else:
+                text = self._text(node)
+                if text:
+                    content_parts.append(text)
+        return "\n".join(content_parts)
+
+    def select_text(
+        self, html: Markup, selectors: Sequence[str], separator: str = " ", exclude: Sequence[str] = ()
+    ) -> Optional[str]:
+        tree = self._tree(html)
+        for selector in selectors:
+            node = tree.css_first(selector)
+            if node is not None:
+                if exclude:
+                    node.strip_tags(list(exclude))
+                return self._text(node, separator)
+        return None
+
+
+def create_parser_backend(name: str) -> ParserBackend:
+    """
+    Create a parser backend by name.
+
+    Args:
+        name: "html.parser", "lxml" or "selectolax"
+
+    Returns:
+        New ParserBackend instance
+
+    Raises:
+        ImportError: If the backend's library is not installed
+        ValueError: If the name is unknown
+    """
+    if name == "html.parser":
+        return SoupBackend("html.parser")
+    if name == "lxml":
+        import lxml  # noqa: F401
+
+        return SoupBackend("lxml")
+    if name == "selectolax":
+        return SelectolaxBackend()
+    raise ValueError(f"Unknown parser backend: {name}")
+
+
+def get_parser_backend(name: Optional[str] = None) -> ParserBackend:
+    """
+    Get the shared parser backend, falling back to html.parser if it is unavailable.
+
+    Args:
+        name: Backend name (defaults to PARSER_BACKEND)
+
+    Returns:
+        Shared ParserBackend instance
+    """
+    name = name or PARSER_BACKEND
+    backend = _backends.get(name)
+    if backend is None:
+        with _backends_lock:
+            backend = _backends.get(name)
+            if backend is None:
+                try:
+                    backend = create_parser_backend(name)
+                except (ImportError, ValueError) as e:
+                    logger.warning(
+                        f"Parser backend {name} unavailable (install the 'parsers' extra), using html.parser: {e}"
+                    )
+                    backend = SoupBackend("html.parser")
+                _backends[name] = backend
+    return backend
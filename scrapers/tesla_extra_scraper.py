@@ -1,14 +1,10 @@
 import json
-from io import BytesIO
 from urllib.parse import quote, urljoin
 
-import pycurl
-from bs4 import BeautifulSoup
-
-from config import (
-    X_NAVER_CLIENT_ID,
-    X_NAVER_CLIENT_SECRET,
-)
+from config import INCREMENTAL_LISTING, X_NAVER_CLIENT_ID, X_NAVER_CLIENT_SECRET
+from scrapers.http_client import fetch_all
+from scrapers.korean_news_scraper import fetch_listing_pages, fill_detail_contents
+from scrapers.parsing import get_parser_backend, make_soup
 from utils.logger import setup_logger
 
 logger = setup_logger()
@@ -17,6 +13,14 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
 }
 
+# Sites requested by the scrapers in this module (preresolved at startup)
+INFO_SOURCE_URLS = [
+    "https://tago.kr",
+    "https://openapi.naver.com",
+    "https://www.clien.net",
+    "https://gall.dcinside.com",
+]
+
 NAVER_BLOG_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -28,44 +32,107 @@ NAVER_BLOG_HEADERS = {
 }
 
 
-def pycurl_get(url, headers=None, timeout=10):
+def parse_subsidy_index(html):
     """
-    Helper function to perform HTTP GET requests using pycurl.
+    Parse the tago.kr subsidy main page.
 
-    Uses pycurl with SSL verification disabled and custom timeout.
-    Returns response status code and body text.
+    The year is the selected option of <select name="year"> (or its last option), and
+    the Tesla models are the options of <select name="model"> containing "테슬라".
 
     Args:
-        url: Target URL to request
-        headers: Optional dict of HTTP headers
-        timeout: Request timeout in seconds
+        html: Main page HTML content as string
 
     Returns:
-        Tuple of (status_code, response_text)
+        Tuple of (year, list of (model value, model name) tuples); year is "" if not found
+    """
+    soup = make_soup(html)
+
+    # Extract current year from <select name="year">
+    year_select = soup.find("select", {"name": "year"})
+    if year_select:
+        selected_option = year_select.find("option", selected=True)
+        if selected_option:
+            year = selected_option.get("value", "").strip()
+        else:
+            # If no option is selected, use the last option's value
+            options = year_select.find_all("option")
+            year = options[-1].get("value", "").strip() if options else ""
+    else:
+        year = ""
+
+    if not year:
+        logger.error("Could not find year information")
+        return "", []
+
+    # Extract model options from <select name="model">
+    model_select = soup.find("select", {"name": "model"})
+    if not model_select:
+        logger.error("Could not find model selection options")
+        return "", []
+
+    # Select only options containing "테슬라" string
+    tesla_models = []
+    for opt in model_select.find_all("option"):
+        model_value = opt.get("value", "").strip()
+        if "테슬라" in opt.get_text() and model_value:
+            tesla_models.append((model_value, opt.get_text(strip=True)))
+    return year, tesla_models
+
+
+def parse_subsidy_table(html, year, model_text, url):
+    """
+    Parse the regional subsidy table of a tago.kr model page.
+
+    Args:
+        html: Model page HTML content as string
+        year: Year of the subsidy program
+        model_text: Tesla model name
+        url: Model page URL
 
-    Raises:
-        Exception: On pycurl errors
+    Returns:
+        List of subsidy dictionaries, one per region (see fetch_subsidy_info)
     """
-    buffer = BytesIO()
-    c = pycurl.Curl()
-    c.setopt(c.URL, url)
-    if headers:
-        header_list = [f"{key}: {value}" for key, value in headers.items()]
-        c.setopt(c.HTTPHEADER, header_list)
-    c.setopt(c.WRITEDATA, buffer)
-    c.setopt(c.TIMEOUT, timeout)
-    # Disable SSL verification
-    c.setopt(c.SSL_VERIFYPEER, 0)
-    c.setopt(c.SSL_VERIFYHOST, 0)
-    try:
-        c.perform()
-        status_code = c.getinfo(c.RESPONSE_CODE)
-        c.close()
-        body = buffer.getvalue()
-        return status_code, body.decode("utf-8", errors="replace")
-    except pycurl.error as e:
-        c.close()
-        raise Exception(e)
+    soup = make_soup(html)
+    table_div = soup.find("div", class_="table-style line scroll")
+    if not table_div:
+        logger.error(f"Could not find subsidy table for model {model_text}")
+        return []
+    table = table_div.find("table")
+    if not table:
+        logger.error(f"Could not find table inside subsidy table div for model {model_text}")
+        return []
+
+    # Each tbody is one data row (regional subsidy information)
+    rows = []
+    for tbody in table.find_all("tbody"):
+        tr = tbody.find("tr")
+        if not tr:
+            continue
+        tds = tr.find_all("td")
+        if len(tds) < 8:
+            continue  # Need at least 8 columns
+        rows.append(
+            {
+                "title": year + "년 " + model_text + " 보조금 정보",
+                "content": {
+                    "area": tds[0].get_text(strip=True),
+                    "city": tds[1].get_text(strip=True),
+                    "price": tds[2].get_text(strip=True),
+                    "national_subsidy": tds[3].get_text(strip=True),
+                    "local_subsidy": tds[4].get_text(strip=True),
+                    "total_subsidy": tds[5].get_text(strip=True),
+                    "expected_price": tds[6].get_text(strip=True),
+                    "reference": tds[7].get_text(strip=True),
+                    "model": model_text,
+                    "year": year,
+                },
+                "url": url,
+                "source": "tago.kr",
+                "published": year + "년 01월 01일 00:00",
+                "news_type": "domestic",
+            }
+        )
+    return rows
 
 
 def fetch_subsidy_info():
@@ -76,7 +143,7 @@ def fetch_subsidy_info():
     1. Extract current year from <select name="year"> on the main page (selected or last option)
     2. Iterate through all options containing "테슬라" in <select name="model">, using each option's
        value to create subsidy lookup URLs
-    3. Parse subsidy table from each lookup page
+    3. Fetch the lookup pages together and parse the subsidy table from each
 
     Implementation Note: Instead of returning subsidy data for all regions for each Tesla model,
     we select the "Seoul" region data as representative for each model and year combination.
@@ -105,99 +172,28 @@ def fetch_subsidy_info():
         base_url = "https://tago.kr/subsidy/index.htm"
 
         # Fetch main page
-        try:
-            status, res_text = pycurl_get(base_url, headers=HEADERS, timeout=10)
-            if status != 200:
-                raise Exception(f"HTTP status {status}")
-        except Exception as e:
-            logger.error(f"Subsidy info main page fetch error: {e}")
+        (response,) = fetch_all([base_url], headers=HEADERS, timeout=10)
+        if response.status != 200:
+            logger.error(f"Subsidy info main page fetch error: {response.error or f'HTTP status {response.status}'}")
             return items
 
-        soup = BeautifulSoup(res_text, "html.parser")
-
-        # Extract current year from <select name="year">
-        year_select = soup.find("select", {"name": "year"})
-        if year_select:
-            selected_option = year_select.find("option", selected=True)
-            if selected_option:
-                year = selected_option.get("value", "").strip()
-            else:
-                # If no option is selected, use the last option's value
-                options = year_select.find_all("option")
-                year = options[-1].get("value", "").strip() if options else ""
-        else:
-            year = ""
-
+        year, tesla_models = parse_subsidy_index(response.text)
         if not year:
-            logger.error("Could not find year information")
-            return items
-
-        # Extract model options from <select name="model">
-        model_select = soup.find("select", {"name": "model"})
-        if not model_select:
-            logger.error("Could not find model selection options")
             return items
 
-        model_options = model_select.find_all("option")
-        # Select only options containing "테슬라" string (case insensitive)
-        tesla_options = [opt for opt in model_options if "테슬라" in opt.get_text()]
+        # Model pages are requested together (URL-encode the value)
+        urls = [f"{base_url}?model={quote(model_value)}&year={year}" for model_value, _ in tesla_models]
+        responses = fetch_all(urls, headers=HEADERS, timeout=10)
 
         # For each Tesla model, get representative "Seoul" region info from the subsidy table
-        for opt in tesla_options:
-            model_value = opt.get("value", "").strip()
-            model_text = opt.get_text(strip=True)
-            if not model_value:
+        for (_, model_text), url, response in zip(tesla_models, urls, responses):
+            if response.status != 200:
+                logger.error(
+                    f"Model {model_text} page fetch error: {response.error or f'HTTP status {response.status}'}"
+                )
                 continue
-            # Create URL (URL-encode the value)
-            url = f"{base_url}?model={quote(model_value)}&year={year}"
-            try:
-                status_model, res_model_text = pycurl_get(url, headers=HEADERS, timeout=10)
-                if status_model != 200:
-                    raise Exception(f"HTTP status {status_model}")
-            except Exception as e:
-                logger.error(f"Model {model_text} page fetch error: {e}")
-                continue
-
-            model_soup = BeautifulSoup(res_model_text, "html.parser")
-            table_div = model_soup.find("div", class_="table-style line scroll")
-            if not table_div:
-                logger.error(f"Could not find subsidy table for model {model_text}")
-                continue
-            table = table_div.find("table")
-            if not table:
-                logger.error(f"Could not find table inside subsidy table div for model {model_text}")
-                continue
-
-            # Each tbody is one data row (regional subsidy information)
-            model_rows = []
-            for tbody in table.find_all("tbody"):
-                tr = tbody.find("tr")
-                if not tr:
-                    continue
-                tds = tr.find_all("td")
-                if len(tds) < 8:
-                    continue  # Need at least 8 columns
-                row_item = {
-                    "title": year + "년 " + model_text + " 보조금 정보",
-                    "content": {
-                        "area": tds[0].get_text(strip=True),
-                        "city": tds[1].get_text(strip=True),
-                        "price": tds[2].get_text(strip=True),
-                        "national_subsidy": tds[3].get_text(strip=True),
-                        "local_subsidy": tds[4].get_text(strip=True),
-                        "total_subsidy": tds[5].get_text(strip=True),
-                        "expected_price": tds[6].get_text(strip=True),
-                        "reference": tds[7].get_text(strip=True),
-                        "model": model_text,
-                        "year": year,
-                    },
-                    "url": url,
-                    "source": "tago.kr",
-                    "published": year + "년 01월 01일 00:00",
-                    "news_type": "domestic",
-                }
-                model_rows.append(row_item)
 
+            model_rows = parse_subsidy_table(response.text, year, model_text, url)
             if not model_rows:
                 continue
 
@@ -210,6 +206,46 @@ def fetch_subsidy_info():
         return []
 
 
+def parse_naver_blog_page(res_text):
+    """
+    Parse a Naver Blog search API response.
+
+    Args:
+        res_text: JSON response body as string or UTF-8 bytes
+
+    Returns:
+        List of dictionaries containing blog post information
+    """
+    items = []
+    data = json.loads(res_text)
+    blog_items = data.get("items", [])
+    for blog_item in blog_items:
+        try:
+            # Clean title with BeautifulSoup (removes HTML tags like <b>)
+            title = blog_item.get("title", "")
+            post_url = blog_item.get("link", "")
+            description = blog_item.get("description", "")
+            postdate = blog_item.get("postdate", "")
+            # Format postdate from YYYYMMDD to YYYY.MM.DD if possible
+            if len(postdate) == 8:
+                formatted_date = f"{postdate[0:4]}.{postdate[4:6]}.{postdate[6:8]}"
+            else:
+                formatted_date = postdate
+
+            item = {
+                "title": title,
+                "url": post_url,
+                "published": formatted_date,
+                "content": description,
+                "source": "Naver Blog",
+                "news_type": "domestic",
+            }
+            items.append(item)
+        except Exception as e:
+            logger.error(f"Post processing error: {e}")
+    return items
+
+
 def fetch_tesla_naver_blog(search_keyword="테슬라"):
     """
     Fetch Tesla-related posts from Naver Blog search results.
@@ -219,6 +255,9 @@ def fetch_tesla_naver_blog(search_keyword="테슬라"):
     2. Extracts post link, title, author, date, etc. from the JSON response
     3. Processes each post's information into a dictionary
 
+    In incremental mode results are requested newest first (sort=date) and further
+    result pages are read until the newest post of the previous run is reached.
+
     Args:
         search_keyword: Keyword to search for (default: "테슬라")
 
@@ -232,59 +271,124 @@ def fetch_tesla_naver_blog(search_keyword="테슬라"):
         - news_type: "domestic"
     """
     try:
-        items = []
-        try:
-            # Call OpenAPI URL (URL-encode the search query)
-            search_query = quote(search_keyword)
-            url = f"https://openapi.naver.com/v1/search/blog?query={search_query}&display=30&start=1&sort=sim"
-            status, res_text = pycurl_get(url, headers=NAVER_BLOG_HEADERS, timeout=10)
-            if status != 200:
-                raise Exception(f"HTTP status {status}")
-        except Exception as e:
-            logger.error(f"Tesla Naver Blog search results fetch error: {e}")
-            return items
-
-        # Parse JSON response
-        data = json.loads(res_text)
-        blog_items = data.get("items", [])
-        for blog_item in blog_items:
-            try:
-                # Clean title with BeautifulSoup (removes HTML tags like <b>)
-                title = blog_item.get("title", "")
-                post_url = blog_item.get("link", "")
-                description = blog_item.get("description", "")
-                postdate = blog_item.get("postdate", "")
-                # Format postdate from YYYYMMDD to YYYY.MM.DD if possible
-                if len(postdate) == 8:
-                    formatted_date = f"{postdate[0:4]}.{postdate[4:6]}.{postdate[6:8]}"
-                else:
-                    formatted_date = postdate
-
-                item = {
-                    "title": title,
-                    "url": post_url,
-                    "published": formatted_date,
-                    "content": description,
-                    "source": "Naver Blog",
-                    "news_type": "domestic",
-                }
-                items.append(item)
-            except Exception as e:
-                logger.error(f"Post processing error: {e}")
+        # Call OpenAPI URL (URL-encode the search query)
+        search_query = quote(search_keyword)
+        sort = "date" if INCREMENTAL_LISTING else "sim"
+        items = fetch_listing_pages(
+            "Naver Blog",
+            search_keyword,
+            lambda page: (
+                f"https://openapi.naver.com/v1/search/blog?query={search_query}"
+                f"&display=30&start={page * 30 + 1}&sort={sort}"
+            ),
+            parse_naver_blog_page,
+            headers=NAVER_BLOG_HEADERS,
+        )
+        if items is None:
+            logger.info(f"Tesla Naver Blog search results unchanged for '{search_keyword}', skipping")
+            return []
         return items
     except Exception as e:
         logger.error(f"Tesla Naver Blog collection error: {e}")
         return []
 
 
+def parse_clien_detail(html):
+    """
+    Extract the post text from a Clien post page.
+
+    Args:
+        html: Post page HTML content as string or UTF-8 bytes
+
+    Returns:
+        Post text, or an empty string if the content container is missing
+    """
+    # Prefer the article body inside the content container
+    text = get_parser_backend().select_text(
+        html, ("div.post_content article div.post_article", "div.post_content"), separator="\n"
+    )
+    if text is None:
+        logger.error("Could not find Clien post content container")
+        return ""
+    return text
+
+
+def parse_clien_listing(html):
+    """
+    Parse a Clien search results page.
+
+    Args:
+        html: Listing page HTML content as string or UTF-8 bytes
+
+    Returns:
+        List of post dictionaries (content is filled in from the post pages later)
+    """
+    items = []
+    soup = make_soup(html)
+    container = soup.find("div", class_="contents_jirum total_search")
+    if not container:
+        logger.error("Could not find Clien search results container")
+        return items
+
+    post_divs = container.find_all("div", class_="list_item symph_row jirum")
+    for post in post_divs:
+        try:
+            # Extract title and post URL
+            title_div = post.find("div", class_="list_title")
+            if not title_div:
+                continue
+            subject_span = title_div.find("span", class_="list_subject")
+            if not subject_span:
+                continue
+            a_tag = subject_span.find("a", class_="subject_fixed")
+            if not a_tag:
+                continue
+            title = a_tag.get_text(strip=True)
+            relative_url = a_tag.get("href", "")
+            full_url = urljoin("https://www.clien.net", relative_url)
+
+            # Extract author
+            author = ""
+            author_div = post.find("div", class_="list_author")
+            if author_div:
+                nickname_span = author_div.find("span", class_="nickname")
+                if nickname_span:
+                    author = nickname_span.get_text(strip=True)
+
+            # Extract publication date (use <span class="timestamp"> value if available)
+            published = ""
+            time_div = post.find("div", class_="list_time")
+            if time_div:
+                timestamp_span = time_div.find("span", class_="timestamp")
+                if timestamp_span:
+                    published = timestamp_span.get_text(strip=True)
+                else:
+                    published = time_div.get_text(strip=True)
+
+            item = {
+                "title": title,
+                "url": full_url,
+                "author": author,
+                "published": published,
+                "content": "",
+                "source": "Clien",
+                "news_type": "domestic",
+            }
+            items.append(item)
+        except Exception as e:
+            logger.error(f"Clien post processing error: {e}")
+    return items
+
+
 def fetch_tesla_clien(search_keyword="테슬라"):
     """
     Fetch Tesla-related posts from Clien community website.
 
     Process:
-    1. Scrapes search results page for Tesla-related content
+    1. Scrapes search results pages for Tesla-related content (newest first, incrementally
+       up to the newest post of the previous run)
     2. Extracts post title, URL, author, and publication date
-    3. Visits each post URL to fetch full post content
+    3. Fetches the pages of posts not seen before together to get full post content
 
     Args:
         search_keyword: Keyword to search for (default: "테슬라")
@@ -300,107 +404,126 @@ def fetch_tesla_clien(search_keyword="테슬라"):
         - news_type: "domestic"
     """
     try:
-        items = []
         # URL encode the search query
         encoded_query = quote(search_keyword)
-        search_url = (
-            f"https://www.clien.net/service/search?q={encoded_query}&sort=recency&p=0&boardCd=cm_car&isBoard=true"
+        items = fetch_listing_pages(
+            "Clien",
+            search_keyword,
+            lambda page: (
+                f"https://www.clien.net/service/search?q={encoded_query}"
+                f"&sort=recency&p={page}&boardCd=cm_car&isBoard=true"
+            ),
+            parse_clien_listing,
+            headers=HEADERS,
         )
-        status, res_text = pycurl_get(search_url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-
-        soup = BeautifulSoup(res_text, "html.parser")
-        container = soup.find("div", class_="contents_jirum total_search")
-        if not container:
-            logger.error("Could not find Clien search results container")
-            return items
+        if items is None:
+            logger.info(f"Clien search results unchanged for '{search_keyword}', skipping")
+            return []
 
-        post_divs = container.find_all("div", class_="list_item symph_row jirum")
-        for post in post_divs:
-            try:
-                # Extract title and post URL
-                title_div = post.find("div", class_="list_title")
-                if not title_div:
-                    continue
-                subject_span = title_div.find("span", class_="list_subject")
-                if not subject_span:
-                    continue
-                a_tag = subject_span.find("a", class_="subject_fixed")
-                if not a_tag:
-                    continue
-                title = a_tag.get_text(strip=True)
-                relative_url = a_tag.get("href", "")
-                full_url = urljoin("https://www.clien.net", relative_url)
-
-                # Extract author
-                author = ""
-                author_div = post.find("div", class_="list_author")
-                if author_div:
-                    nickname_span = author_div.find("span", class_="nickname")
-                    if nickname_span:
-                        author = nickname_span.get_text(strip=True)
-
-                # Extract publication date (use <span class="timestamp"> value if available)
-                published = ""
-                time_div = post.find("div", class_="list_time")
-                if time_div:
-                    timestamp_span = time_div.find("span", class_="timestamp")
-                    if timestamp_span:
-                        published = timestamp_span.get_text(strip=True)
-                    else:
-                        published = time_div.get_text(strip=True)
-
-                # Extract post content from detail page (inline processing instead of separate function)
-                try:
-                    status_detail, detail_text = pycurl_get(full_url, headers=HEADERS, timeout=10)
-                    if status_detail != 200:
-                        raise Exception(f"HTTP status {status_detail}")
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    content_container = detail_soup.find("div", class_="post_content")
-                    if content_container:
-                        article = content_container.find("article")
-                        if article:
-                            post_article = article.find("div", class_="post_article")
-                            if post_article:
-                                content = post_article.get_text(separator="\n", strip=True)
-                            else:
-                                content = content_container.get_text(separator="\n", strip=True)
-                        else:
-                            content = content_container.get_text(separator="\n", strip=True)
-                    else:
-                        logger.error(f"Could not find Clien post content container ({full_url})")
-                        content = ""
-                except Exception as e:
-                    logger.error(f"Clien post detail content fetch error ({full_url}): {e}")
-                    content = ""
-
-                item = {
-                    "title": title,
-                    "url": full_url,
-                    "author": author,
-                    "published": published,
-                    "content": content,
-                    "source": "Clien",
-                    "news_type": "domestic",
-                }
-                items.append(item)
-            except Exception as e:
-                logger.error(f"Clien post processing error: {e}")
-        return items
+        # Skip posts seen in earlier cycles, then fetch the remaining post pages together
+        return fill_detail_contents(items, parse_clien_detail, "Clien")
     except Exception as e:
         logger.error(f"Clien news collection error: {e}")
         return []
 
 
+def parse_dcinside_detail(html):
+    """
+    Extract the post text from a DCinside post page.
+
+    Args:
+        html: Post page HTML content as string or UTF-8 bytes
+
+    Returns:
+        Post text, or an empty string if the content container is missing
+    """
+    # Clean content: remove script tags and style tags
+    text = get_parser_backend().select_text(html, ("div.write_div",), separator="\n", exclude=("script", "style"))
+    if text is None:
+        logger.error("Could not find DCinside post content container")
+        return ""
+    return text
+
+
+def parse_dcinside_listing(html):
+    """
+    Parse a DCinside gallery list page.
+
+    Args:
+        html: Listing page HTML content as string or UTF-8 bytes
+
+    Returns:
+        List of post dictionaries (content is filled in from the post pages later)
+    """
+    items = []
+    soup = make_soup(html)
+    post_list = soup.find("table", class_="gall_list")
+    if not post_list:
+        logger.error("Could not find DCinside gallery list")
+        return items
+
+    # Process each post row
+    post_rows = post_list.select("tr.ub-content")
+    for row in post_rows:
+        try:
+            # Skip notice or advertisement rows
+            if "notice" in row.get("class", []) or "ad" in row.get("class", []):
+                continue
+
+            # Extract post title and link
+            subject_cell = row.find("td", class_="gall_tit")
+            if not subject_cell:
+                continue
+
+            subject_link = subject_cell.find("a")
+            if not subject_link:
+                continue
+
+            title = subject_link.get_text(strip=True)
+            relative_url = subject_link.get("href", "")
+
+            # Handle href format and create absolute URL
+            if relative_url.startswith("http"):
+                full_url = relative_url
+            else:
+                full_url = urljoin("https://gall.dcinside.com", relative_url)
+
+            # Extract author name
+            nick_cell = row.find("td", class_="gall_writer")
+            author = ""
+            if nick_cell:
+                author_elem = nick_cell.find("span", {"class": ["nickname", "ip"]})
+                if author_elem:
+                    author = author_elem.get_text(strip=True)
+
+            # Extract date
+            date_cell = row.find("td", class_="gall_date")
+            published = date_cell.get_text(strip=True) if date_cell else ""
+
+            item = {
+                "title": title,
+                "url": full_url,
+                "author": author,
+                "published": published,
+                "content": "",
+                "source": "DCinside",
+                "news_type": "domestic",
+            }
+            items.append(item)
+        except Exception as e:
+            logger.error(f"DCinside post processing error: {e}")
+    return items
+
+
 def fetch_tesla_dcincide(search_keyword="테슬라"):
     """
     Fetch Tesla-related posts from DCinside gallery.
 
     Process:
-    1. Scrape the Tesla gallery listing page from DCinside
+    1. Scrape the Tesla gallery listing pages from DCinside (newest first, incrementally
+       up to the newest post of the previous run)
     2. Extract post titles, URLs, authors, and publication dates
-    3. Visit each post URL to fetch full post content from the detail page
+    3. Fetch the pages of posts not seen before together to get full post content
 
     Args:
         search_keyword: Keyword to search for (default: "테슬라")
@@ -416,99 +539,26 @@ def fetch_tesla_dcincide(search_keyword="테슬라"):
         - news_type: "domestic"
     """
     try:
-        items = []
         # URL encode the search query for DCinside search
         encoded_query = quote(search_keyword)
 
         # Use "전기차" gallery which contains Tesla content
-        gallery_url = (
-            f"https://gall.dcinside.com/board/lists/?id=electric&s_type=search_subject_memo&s_keyword={encoded_query}"
+        items = fetch_listing_pages(
+            "DCinside",
+            search_keyword,
+            lambda page: (
+                "https://gall.dcinside.com/board/lists/?id=electric"
+                f"&page={page + 1}&s_type=search_subject_memo&s_keyword={encoded_query}"
+            ),
+            parse_dcinside_listing,
+            headers=HEADERS,
         )
+        if items is None:
+            logger.info(f"DCinside search results unchanged for '{search_keyword}', skipping")
+            return []
 
-        status, res_text = pycurl_get(gallery_url, headers=HEADERS, timeout=10)
-        if status != 200:
-            raise Exception(f"HTTP status {status}")
-
-        soup = BeautifulSoup(res_text, "html.parser")
-        post_list = soup.find("table", class_="gall_list")
-        if not post_list:
-            logger.error("Could not find DCinside gallery list")
-            return items
-
-        # Process each post row
-        post_rows = post_list.select("tr.ub-content")
-        for row in post_rows:
-            try:
-                # Skip notice or advertisement rows
-                if "notice" in row.get("class", []) or "ad" in row.get("class", []):
-                    continue
-
-                # Extract post title and link
-                subject_cell = row.find("td", class_="gall_tit")
-                if not subject_cell:
-                    continue
-
-                subject_link = subject_cell.find("a")
-                if not subject_link:
-                    continue
-
-                title = subject_link.get_text(strip=True)
-                relative_url = subject_link.get("href", "")
-
-                # Handle href format and create absolute URL
-                if relative_url.startswith("http"):
-                    full_url = relative_url
-                else:
-                    full_url = urljoin("https://gall.dcinside.com", relative_url)
-
-                # Extract author name
-                nick_cell = row.find("td", class_="gall_writer")
-                author = ""
-                if nick_cell:
-                    author_elem = nick_cell.find("span", {"class": ["nickname", "ip"]})
-                    if author_elem:
-                        author = author_elem.get_text(strip=True)
-
-                # Extract date
-                date_cell = row.find("td", class_="gall_date")
-                published = date_cell.get_text(strip=True) if date_cell else ""
-
-                # Fetch full content from post detail page
-                try:
-                    status_detail, detail_text = pycurl_get(full_url, headers=HEADERS, timeout=10)
-                    if status_detail != 200:
-                        raise Exception(f"HTTP status {status_detail}")
-
-                    detail_soup = BeautifulSoup(detail_text, "html.parser")
-                    content_container = detail_soup.find("div", class_="write_div")
-
-                    if content_container:
-                        # Clean content: remove script tags and style tags
-                        for script in content_container.find_all(["script", "style"]):
-                            script.decompose()
-
-                        # Extract text
-                        content = content_container.get_text(separator="\n", strip=True)
-                    else:
-                        logger.error(f"Could not find DCinside post content container ({full_url})")
-                        content = ""
-                except Exception as e:
-                    logger.error(f"DCinside post detail content fetch error ({full_url}): {e}")
-                    content = ""
-
-                item = {
-                    "title": title,
-                    "url": full_url,
-                    "author": author,
-                    "published": published,
-                    "content": content,
-                    "source": "DCinside",
-                    "news_type": "domestic",
-                }
-                items.append(item)
-            except Exception as e:
-                logger.error(f"DCinside post processing error: {e}")
-        return items
+        # Skip posts seen in earlier cycles, then fetch the remaining post pages together
+        return fill_detail_contents(items, parse_dcinside_detail, "DCinside")
     except Exception as e:
         logger.error(f"DCinside news collection error: {e}")
         return []
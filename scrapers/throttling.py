@@ -0,0 +1,241 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from config import (
+    BREAKER_COOLDOWN,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_RETRY_AFTER,
+    HOST_RATE_BURST,
+    HOST_RATE_LIMIT,
+    HOST_RATE_MIN,
+)
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the host's circuit breaker is open"""
+
+
+class RateLimitTimeout(Exception):
+    """Raised when no request token for a host becomes available in time"""
+
+
+class TokenBucket:
+    """
+    Thread-safe adaptive token bucket.
+
+    Tokens refill at `rate` per second up to `capacity`. The rate is halved when the
+    host signals overload (429 / 503) and recovers additively on every success, never
+    going below `min_rate` or above the configured `max_rate`.
+    """
+
+    def __init__(
+        self,
+        rate: float = HOST_RATE_LIMIT,
+        capacity: float = HOST_RATE_BURST,
+        min_rate: float = HOST_RATE_MIN,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return the seconds until one is"""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self, timeout: float) -> bool:
+        """Block until a token is taken; False if that would take longer than timeout seconds"""
+        deadline = self._clock() + timeout
+        while True:
+            wait = self.try_acquire()
+            if wait == 0.0:
+                return True
+            if self._clock() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def slow_down(self) -> None:
+        """Halve the refill rate after an overload signal"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def speed_up(self) -> None:
+        """Recover the refill rate additively after a success"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker with half-open probing.
+
+    closed: requests flow; consecutive failures are counted.
+    open: requests fail fast until the cooldown (or the server's Retry-After delay) has passed.
+    half_open: a single probe request is let through; its success closes the
+    breaker and its failure opens it again for another cooldown.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+        max_retry_after: float = BREAKER_MAX_RETRY_AFTER,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_retry_after = max_retry_after
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.open_for = cooldown
+        self._probe_in_flight = False
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now"""
+        with self._lock:
+            if self.state == "open" and self._clock() - self.opened_at >= self.open_for:
+                self.state = "half_open"
+                self._probe_in_flight = False
+            if self.state == "closed":
+                return True
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot whose request was never sent"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request"""
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, open_for: Optional[float] = None) -> None:
+        """
+        Count a failure and open the breaker when the threshold is reached or a probe fails.
+
+        Args:
+            open_for: Seconds the server asked to wait (Retry-After); the breaker then opens
+                for that long (at most max_retry_after), and for the cooldown when it is not given
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold or open_for:
+                self.state = "open"
+                self.opened_at = self._clock()
+                # An absurd Retry-After must not silence a host for days
+                self.open_for = self.cooldown if open_for is None else min(open_for, self.max_retry_after)
+                self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current breaker state for monitoring"""
+        with self._lock:
+            snapshot = {"state": self.state, "failures": self.failures}
+            if self.state == "open":
+                snapshot["retry_in"] = round(max(0.0, self.opened_at + self.open_for - self._clock()), 1)
+            return snapshot
+
+
+class HostThrottle:
+    """Rate limiter and circuit breaker guarding requests to one host"""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.bucket = TokenBucket()
+        self.breaker = CircuitBreaker()
+
+    def before_request(self, timeout: float) -> None:
+        """
+        Wait for permission to send a request to the host.
+
+        Raises:
+            CircuitOpenError: If the host's breaker is open
+            RateLimitTimeout: If no token becomes available within timeout seconds
+        """
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for {self.host}")
+        if not self.bucket.acquire(timeout):
+            # The request is not sent, so a half-open probe slot is handed back unjudged
+            self.breaker.release_probe()
+            raise RateLimitTimeout(f"Rate limit wait for {self.host} exceeded {timeout}s")
+
+    def record_response(self, status: int, retry_after: Optional[float] = None) -> None:
+        """Update limiter and breaker from an HTTP status code"""
+        if status == 429 or status == 503:
+            self.bucket.slow_down()
+            self.record_failure(retry_after)
+        elif status >= 500:
+            self.record_failure()
+        else:
+            self.bucket.speed_up()
+            self.breaker.record_success()
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        """Count a failed request (transport error, timeout, overload or server error)"""
+        was_open = self.breaker.state == "open"
+        self.breaker.record_failure(retry_after)
+        if not was_open and self.breaker.state == "open":
+            logger.warning(f"Circuit breaker opened for {self.host} ({self.breaker.snapshot()})")
+
+
+# Per-host throttles shared by all scraper threads
+_throttles: Dict[str, HostThrottle] = {}
+_throttles_lock = threading.Lock()
+
+
+def get_host_throttle(host: str) -> HostThrottle:
+    """
+    Get or create the throttle for a host.
+
+    Args:
+        host: Host name (netloc) of the request URL
+
+    Returns:
+        Shared HostThrottle instance for the host
+    """
+    with _throttles_lock:
+        throttle = _throttles.get(host)
+        if throttle is None:
+            throttle = _throttles[host] = HostThrottle(host)
+        return throttle
+
+
+def get_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the circuit breaker and rate limiter state of every known host for monitoring.
+
+    Returns:
+        Dictionary mapping host to its breaker state, failure count and current rate
+    """
+    with _throttles_lock:
+        throttles = list(_throttles.values())
+    return {
+        throttle.host: {**throttle.breaker.snapshot(), "rate": round(throttle.bucket.rate, 2)} for throttle in throttles
+    }
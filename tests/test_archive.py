@@ -0,0 +1,70 @@
+import os
+
+from scrapers import archive, http_client
+
+
+def count_objects(root):
+    return sum(len(files) for _, _, files in os.walk(os.path.join(root, "objects")))
+
+
+def test_identical_bodies_are_stored_once(tmp_path):
+    store = archive.HtmlArchive(str(tmp_path))
+    body = "<html>테슬라</html>".encode("utf-8")
+
+    first = store.store("http://example.com/a", body, fetched_at=100)
+    second = store.store("http://example.com/b", body, fetched_at=200)
+    other = store.store("http://example.com/a", b"<html>changed</html>", fetched_at=300)
+
+    assert first == second != other
+    assert count_objects(str(tmp_path)) == 2
+    assert store.load(first) == body
+    store.close()
+
+
+def test_snapshots_are_indexed_by_url_and_time(tmp_path):
+    store = archive.HtmlArchive(str(tmp_path))
+    store.store("http://example.com/a", b"v1", fetched_at=100, headers={"etag": '"1"'})
+    store.store("http://example.com/b", b"other", fetched_at=150)
+    store.store("http://example.com/a", b"v2", fetched_at=200, final_url="http://example.com/a?r=1")
+
+    history = store.snapshots("http://example.com/a")
+    assert [record["fetched_at"] for record in history] == [100, 200]
+    assert history[0]["headers"] == {"etag": '"1"'}
+    assert history[1]["final_url"] == "http://example.com/a?r=1"
+    assert [record["url"] for record in store.snapshots(since=120, until=200)] == ["http://example.com/b"]
+    assert store.load(store.latest("http://example.com/a", before=200)["content_hash"]) == b"v1"
+    assert store.latest("http://example.com/missing") is None
+    store.close()
+
+
+def test_archive_response_is_disabled_without_directory(monkeypatch):
+    monkeypatch.setattr(archive, "HTML_ARCHIVE_DIR", "")
+
+    assert archive.get_archive() is None
+    archive.archive_response("http://example.com", http_client.Response("http://example.com", 200, {}, b"x", 0.1))
+
+
+def test_archive_response_skips_bodiless_responses(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "HTML_ARCHIVE_DIR", str(tmp_path))
+    try:
+        archive.archive_response(
+            "http://example.com/a", http_client.Response("http://example.com/a", 304, {}, b"", 0.1)
+        )
+        archive.archive_response(
+            "http://example.com/a", http_client.Response("http://example.com/a", 200, {}, b"ok", 0.1)
+        )
+
+        assert [record["status"] for record in archive.get_archive().snapshots()] == [200]
+    finally:
+        archive.close_archive()
+
+
+def test_bodies_are_gzip_compressed_without_zstandard(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "zstandard", None)
+    store = archive.HtmlArchive(str(tmp_path))
+
+    content_hash = store.store("http://example.com/a", b"<html>" * 100)
+
+    assert os.path.exists(os.path.join(str(tmp_path), "objects", content_hash[:2], content_hash + ".gz"))
+    assert store.load(content_hash) == b"<html>" * 100
+    store.close()
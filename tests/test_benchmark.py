@@ -0,0 +1,30 @@
+import benchmark
+
+
+def test_every_source_has_parsed_fixtures():
+    results = benchmark.run_benchmarks(rounds=1)
+
+    assert len({r["source"] for r in results}) == 14
+    assert {r["stage"] for r in results} == {"listing", "detail"}
+    # An empty parse would mean a fixture no longer matches its parser, making its timing meaningless
+    assert all(r["items"] > 0 for r in results), [r for r in results if not r["items"]]
+    assert all(r["peak_kib"] > 0 for r in results)
+
+
+def test_format_results_compares_against_baseline():
+    results = [
+        {
+            "source": "Clien",
+            "stage": "detail",
+            "items": 1,
+            "median_ms": 1.5,
+            "peak_kib": 20.0,
+            "items_per_second": 666.7,
+        }
+    ]
+    baseline = [dict(results[0], median_ms=2.0)]
+
+    table = benchmark.format_results(results, baseline)
+
+    assert "Clien" in table
+    assert "-25.0%" in table
@@ -0,0 +1,88 @@
+import hashlib
+
+from utils.bloom import BloomDedupBatch, BloomFilter
+from utils.cache import FallbackCache
+
+
+def digest(i):
+    return hashlib.sha256(str(i).encode("utf-8")).hexdigest()
+
+
+def run_batch(redis, items, bloom, now=0.0):
+    batch = BloomDedupBatch(items, [digest(item["id"]) for item in items], bloom, expire_seconds=100, now=now)
+    pipeline = redis.pipeline()
+    batch.queue_lookup(pipeline)
+    batch.read_lookup(pipeline.execute())
+    pipeline = redis.pipeline()
+    batch.queue_update(pipeline)
+    return batch.read_update(pipeline.execute())
+
+
+def test_bloom_filter_sizing():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+
+    # m = -n ln p / (ln 2)^2 and k = m / n ln 2
+    assert bloom.size == 9586
+    assert bloom.hashes == 7
+    positions = bloom.positions(digest(1))
+    assert len(positions) == 7
+    assert all(0 <= position < bloom.size for position in positions)
+    assert positions == bloom.positions(digest(1))
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    bits = set()
+    for i in range(1000):
+        bits.update(bloom.positions(digest(i)))
+
+    false_positives = sum(all(p in bits for p in bloom.positions(digest(i))) for i in range(1000, 11000))
+
+    assert false_positives / 10000 < 0.02
+
+
+def test_batch_dedups_and_rotates_daily():
+    redis = FallbackCache()
+    bloom = BloomFilter(capacity=100, error_rate=0.001)
+    items = [{"id": i} for i in range(5)]
+
+    assert run_batch(redis, items + [items[0]], bloom) == items
+    # Negatives get no exact key, so the first recurrence is confirmed (and reported) once
+    assert run_batch(redis, items, bloom, now=50) == items
+    assert run_batch(redis, items, bloom, now=60) == []
+    # Items are still known in the next bucket, and forgotten in the one after
+    assert run_batch(redis, items[:2], bloom, now=150) == []
+    assert run_batch(redis, items[:2], bloom, now=250) == items[:2]
+
+
+def test_batch_confirms_bloom_positives_with_exact_keys():
+    redis = FallbackCache()
+    # A single-bit filter reports every item as maybe seen once one item was added
+    bloom = BloomFilter(capacity=1, error_rate=0.5)
+    bloom.size, bloom.hashes = 1, 1
+
+    assert run_batch(redis, [{"id": 1}], bloom) == [{"id": 1}]
+    # Item 2 is a Bloom false positive; its exact key is missing, so it is still new
+    assert run_batch(redis, [{"id": 2}], bloom) == [{"id": 2}]
+    assert run_batch(redis, [{"id": 2}], bloom) == []
+    # Only the positive got an exact key
+    assert sorted(key for key in redis.cache if key.startswith("news:")) == [f"news:{digest(2)}"]
+
+
+def test_batch_sends_one_bitfield_per_filter():
+    redis = FallbackCache()
+    bloom = BloomFilter(capacity=100, error_rate=0.001)
+    items = [{"id": i} for i in range(20)]
+    batch = BloomDedupBatch(items, [digest(item["id"]) for item in items], bloom, expire_seconds=100, now=0)
+
+    pipeline = redis.pipeline()
+    batch.queue_lookup(pipeline)
+    assert len(pipeline._commands) == 1
+    batch.read_lookup(pipeline.execute())
+    pipeline = redis.pipeline()
+    batch.queue_update(pipeline)
+    # One BITFIELD and one EXPIRE per bucket; no item was a positive
+    assert len(pipeline._commands) == 4
+    assert batch.read_update(pipeline.execute()) == items
+    # Only the two filters are stored, however many new items were seen
+    assert sorted(redis.cache) == ["news_bloom:0", "news_bloom:1"]
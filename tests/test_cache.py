@@ -1,8 +1,10 @@
 import hashlib
+import threading
 
 import pytest
 
 from utils import cache
+from utils.local_cache import LocalCache
 
 
 class FakeRedis:
@@ -12,14 +14,46 @@ class FakeRedis:
     def exists(self, key):
         return key in self.store
 
+    def get(self, key):
+        return self.store.get(key)
+
     def setex(self, key, expire_seconds, value):
         self.store[key] = value
 
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    round_trips = 0
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((getattr(self.redis, name), args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        FakePipeline.round_trips += 1
+        return [method(*args, **kwargs) for method, args, kwargs in self.commands]
+
 
 @pytest.fixture(autouse=True)
 def patch_redis(monkeypatch):
     fake_r = FakeRedis()
     monkeypatch.setattr(cache, "get_redis_client", lambda: fake_r)
+    monkeypatch.setattr(cache, "_seen_cache", LocalCache(max_entries=100, ttl=3600))
 
 
 def test_generate_news_hash():
@@ -35,3 +69,237 @@ def test_is_duplicate():
     assert not cache.is_duplicate(news_item, expire_seconds=10)
     # Second call: should be identified as a duplicate
     assert cache.is_duplicate(news_item, expire_seconds=10)
+
+
+def test_filter_new_items_uses_one_round_trip():
+    items = [{"url": f"http://example.com/{i}", "title": "Test"} for i in range(3)]
+    cache.is_duplicate(items[0], expire_seconds=10)
+    FakePipeline.round_trips = 0
+
+    new_items = cache.filter_new_items(items + [items[1]], expire_seconds=10)
+
+    # Already processed and repeated items are dropped
+    assert new_items == items[1:]
+    assert FakePipeline.round_trips == 1
+    assert cache.filter_new_items(items, expire_seconds=10) == []
+
+
+def test_filter_new_items_with_fallback_cache(monkeypatch):
+    fallback = cache.FallbackCache()
+    monkeypatch.setattr(cache, "get_redis_client", lambda: fallback)
+    items = [{"url": "http://example.com/1", "title": "A"}, {"url": "http://example.com/2", "title": "B"}]
+
+    assert cache.filter_new_items(items) == items
+    assert cache.filter_new_items(items) == []
+    assert cache.is_duplicate(items[0])
+
+
+def test_http_validators_round_trip():
+    assert cache.get_http_validators("http://example.com/list") == {}
+    cache.store_http_validators("http://example.com/list", {"etag": '"abc"', "last_modified": "Mon"})
+    assert cache.get_http_validators("http://example.com/list") == {"etag": '"abc"', "last_modified": "Mon"}
+
+
+def test_filter_unseen_urls():
+    urls = ["http://example.com/1", "http://example.com/2"]
+    assert cache.filter_unseen_urls(urls) == urls
+    cache.mark_urls_seen(["http://example.com/1"], expire_seconds=10)
+    assert cache.filter_unseen_urls(urls) == ["http://example.com/2"]
+
+
+def test_high_water_mark_round_trip():
+    assert cache.get_high_water_mark("Clien", "테슬라") is None
+    cache.set_high_water_mark("Clien", "테슬라", "https://www.clien.net/service/board/cm_car/1")
+    assert cache.get_high_water_mark("Clien", "테슬라") == "https://www.clien.net/service/board/cm_car/1"
+    assert cache.get_high_water_mark("Clien", "tesla") is None
+
+
+@pytest.mark.asyncio
+async def test_async_functions_share_the_fallback_cache(monkeypatch):
+    fallback = cache.FallbackCache()
+    monkeypatch.setattr(cache, "_redis_client", fallback)
+    monkeypatch.setattr(cache, "_async_redis_client", None)
+    monkeypatch.setattr(cache, "get_redis_client", lambda: fallback)
+    items = [{"url": "http://example.com/1", "title": "A"}, {"url": "http://example.com/2", "title": "B"}]
+
+    assert await cache.filter_new_items_async(items) == items
+    assert await cache.filter_new_items_async(items) == []
+    await cache.store_channel_message_async("hello")
+    assert await cache.get_channel_messages_async() == ["hello"]
+    # The sync functions see the same data
+    assert cache.filter_new_items(items) == []
+
+    await cache.close_async_redis_client()
+    assert cache._async_redis_client is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_falls_back_when_redis_is_down(monkeypatch):
+    monkeypatch.setattr(cache, "_redis_client", None)
+    monkeypatch.setattr(cache, "_async_redis_client", None)
+    monkeypatch.setattr(cache, "_fallback_cache", None)
+    monkeypatch.setattr(cache, "REDIS_URL", "redis://127.0.0.1:1")
+    monkeypatch.setattr(cache, "REDIS_RETRIES", 0)
+
+    client = await cache.get_async_redis_client()
+
+    assert isinstance(client, cache.AsyncFallbackCache)
+    assert client.cache is cache.get_fallback_cache()
+    assert await cache.get_async_redis_client() is client
+
+
+def test_filter_new_items_in_bloom_mode(monkeypatch):
+    fallback = cache.FallbackCache()
+    monkeypatch.setattr(cache, "get_redis_client", lambda: fallback)
+    monkeypatch.setattr(cache, "NEWS_DEDUP_MODE", "bloom")
+    items = [{"url": f"http://example.com/{i}", "title": "Test"} for i in range(3)]
+
+    assert cache.filter_new_items(items[:2]) == items[:2]
+    assert cache.filter_new_items(items) == items[2:]
+    assert cache.is_duplicate(items[0])
+    assert not cache.is_duplicate({"url": "http://example.com/new", "title": "Test"})
+    # Two filters, and exact keys only for Bloom positives (none here)
+    assert len(fallback.cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_filter_new_items_async_in_bloom_mode(monkeypatch):
+    fallback = cache.FallbackCache()
+    monkeypatch.setattr(cache, "_async_redis_client", cache.AsyncFallbackCache(fallback))
+    monkeypatch.setattr(cache, "NEWS_DEDUP_MODE", "bloom")
+    items = [{"url": f"http://example.com/{i}", "title": "Test"} for i in range(3)]
+
+    assert await cache.filter_new_items_async(items[:2]) == items[:2]
+    assert await cache.filter_new_items_async(items) == items[2:]
+
+
+def test_seen_items_are_answered_from_memory():
+    FakePipeline.round_trips = 0
+    items = [{"url": f"http://example.com/{i}", "title": "Test"} for i in range(3)]
+
+    assert cache.filter_new_items(items[:2], expire_seconds=10) == items[:2]
+    assert cache.filter_new_items(items, expire_seconds=10) == items[2:]
+    assert cache.filter_new_items(items, expire_seconds=10) == []
+
+    # The third call needs no Redis round trip
+    assert FakePipeline.round_trips == 2
+    assert cache.get_cache_stats()["seen_l1"]["hits"] == 5
+
+
+def test_seen_urls_are_answered_from_memory():
+    FakePipeline.round_trips = 0
+    urls = ["http://example.com/1", "http://example.com/2"]
+    cache.mark_urls_seen(urls, expire_seconds=10)
+
+    assert cache.filter_unseen_urls(urls) == []
+    assert FakePipeline.round_trips == 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_fallback_cache_expires_keys():
+    clock = FakeClock()
+    fallback = cache.FallbackCache(clock=clock)
+    fallback.setex("a", 10, 1)
+    fallback.set("b", 1, ex=20, nx=True)
+    fallback.set("c", 1)
+    fallback.hset("d", "field", 1)
+    fallback.expire("d", 5)
+
+    clock.now = 10
+    assert not fallback.exists("a")
+    assert fallback.get("b") == 1
+    assert fallback.getbit("d", 0) == 0
+    # Expired keys can be set again with NX
+    assert fallback.set("a", 2, ex=10, nx=True)
+
+    clock.now = 30
+    fallback.setex("e", 10, 1)
+    # Writes purge every expired key, not only the ones read
+    assert set(fallback.cache) == {"c", "e"}
+    assert fallback.stats()["expired"] == 4
+
+
+def test_fallback_cache_evicts_least_recently_used_keys():
+    fallback = cache.FallbackCache(max_entries=2)
+    fallback.setex("a", 10, 1)
+    fallback.setex("b", 10, 1)
+    fallback.get("a")
+    fallback.setex("c", 10, 1)
+
+    assert fallback.exists("a") and fallback.exists("c")
+    assert not fallback.exists("b")
+    assert fallback.stats()["evicted"] == 1
+
+
+def test_fallback_cache_caps_lists():
+    fallback = cache.FallbackCache(max_list_length=3)
+    for i in range(5):
+        fallback.rpush("messages", i)
+
+    assert fallback.lrange("messages", 0, -1) == [2, 3, 4]
+
+
+def test_fallback_cache_expiry_heap_stays_bounded():
+    fallback = cache.FallbackCache()
+    fallback.setex("a", 10, 1)
+    for _ in range(1000):
+        fallback.expire("a", 10)
+
+    # Entries of replaced expiry times are dropped instead of piling up
+    assert len(fallback._expiry_heap) <= 2 * len(fallback._expires) + 65
+
+
+def test_fallback_cache_is_safe_across_threads():
+    fallback = cache.FallbackCache(max_entries=500)
+    errors = []
+
+    def write(worker):
+        try:
+            for i in range(2000):
+                fallback.setex(f"news:{worker}:{i}", 1 + i % 5, 1)
+                fallback.expire(f"news:{worker}:{i}", 10)
+        except Exception as e:
+            errors.append(e)
+
+    def read():
+        try:
+            for _ in range(200):
+                fallback.stats()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(8)]
+    threads.append(threading.Thread(target=read))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert fallback.stats()["keys"] == 500
+
+
+def test_fallback_cache_reports_memory(monkeypatch):
+    fallback = cache.FallbackCache()
+    monkeypatch.setattr(cache, "_fallback_cache", fallback)
+    empty = fallback.memory_usage()
+    for i in range(100):
+        fallback.setex(f"news:{i}", 10, 1)
+    fallback.rpush("messages", "hello")
+
+    stats = cache.get_cache_stats()["fallback"]
+
+    assert stats["keys"] == 100
+    assert stats["expiring_keys"] == 100
+    assert stats["list_values"] == 1
+    assert stats["memory_bytes"] > empty
+    monkeypatch.setattr(cache, "get_redis_client", lambda: fallback)
+    assert cache.clear_cache() == 101
+    assert fallback.stats()["keys"] == 0
@@ -1,26 +1,173 @@
-from scrapers import data_fetcher
+import asyncio
+import time
 
+import pytest
 
-def dummy_fetch():
-    return [{"title": "Dummy", "url": "http://dummy.com"}]
+from scrapers import checkpoint, data_fetcher
+from scrapers.checkpoint import record_seen_urls
+
+
+def make_dummy_fetch(name, delay=0.0):
+    def dummy_fetch(search_keyword="테슬라"):
+        time.sleep(delay)
+        return [{"title": f"Dummy {name}", "url": f"http://dummy.com/{name}"}]
+
+    return dummy_fetch
 
 
 def test_collect_domestic_news(monkeypatch):
-    # Mock all news sources
-    monkeypatch.setattr(data_fetcher, "fetch_naver_news", dummy_fetch)
-    monkeypatch.setattr(data_fetcher, "fetch_motorgraph_news", lambda: dummy_fetch())
-    monkeypatch.setattr(data_fetcher, "fetch_auto_danawa_news", lambda: dummy_fetch())
-    monkeypatch.setattr(data_fetcher, "fetch_etnews_news", lambda: dummy_fetch())
-    monkeypatch.setattr(data_fetcher, "fetch_heraldcorp_news", lambda: dummy_fetch())
-    monkeypatch.setattr(data_fetcher, "fetch_donga_news", lambda: dummy_fetch())
-    monkeypatch.setattr(data_fetcher, "fetch_edaily_news", lambda: dummy_fetch())
-    monkeypatch.setattr(data_fetcher, "fetch_chosunbiz_news", lambda: dummy_fetch())
-    monkeypatch.setattr(data_fetcher, "fetch_autodaily_news", lambda: dummy_fetch())
-    monkeypatch.setattr(data_fetcher, "fetch_itchosun_news", lambda: dummy_fetch())
+    # Mock the news source engine
+    def fetch_news_source(source, search_keyword="테슬라"):
+        return make_dummy_fetch(source["name"])(search_keyword)
+
+    monkeypatch.setattr(data_fetcher, "fetch_news_source", fetch_news_source)
 
     # Mock all info sources to return empty lists
     monkeypatch.setattr(data_fetcher, "collect_info_sources", lambda: [])
 
     news = data_fetcher.collect_domestic_news()
-    # 10개의 뉴스 함수가 모두 dummy_fetch를 호출하므로 총 10개의 아이템이 있어야 함.
+    # 10개의 뉴스 함수가 모두 키워드별로 같은 기사를 반환하므로 중복 제거 후 10개의 아이템이 있어야 함.
     assert len(news) == 10
+    assert all(item["source_type"] == "news" for item in news)
+
+
+@pytest.mark.asyncio
+async def test_run_scrape_tasks_runs_sources_concurrently():
+    tasks = [(f"source{i}", make_dummy_fetch(f"source{i}", delay=0.2), ("테슬라",)) for i in range(8)]
+
+    started = time.monotonic()
+    items = await data_fetcher.run_scrape_tasks(tasks, deadline=5)
+    elapsed = time.monotonic() - started
+
+    assert [item["title"] for item in items] == [f"Dummy source{i}" for i in range(8)]
+    # Eight 0.2s sources run side by side take about as long as one of them
+    assert elapsed < 0.2 * 8 / 2
+
+
+@pytest.mark.asyncio
+async def test_run_scrape_tasks_limits_per_source_concurrency():
+    tasks = [("same", make_dummy_fetch("same", delay=0.1), (keyword,)) for keyword in ("a", "b", "c", "d")]
+
+    started = time.monotonic()
+    await data_fetcher.run_scrape_tasks(tasks, deadline=5, source_concurrency=1)
+    elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.1 * 4
+
+
+@pytest.mark.asyncio
+async def test_run_scrape_tasks_drops_sources_past_deadline():
+    def failing_fetch(search_keyword):
+        raise Exception("boom")
+
+    tasks = [
+        ("fast", make_dummy_fetch("fast"), ("테슬라",)),
+        ("slow", make_dummy_fetch("slow", delay=1), ("테슬라",)),
+        ("broken", failing_fetch, ("테슬라",)),
+    ]
+
+    items = await data_fetcher.run_scrape_tasks(tasks, deadline=0.3)
+
+    assert [item["title"] for item in items] == ["Dummy fast"]
+
+
+def test_build_news_tasks_covers_every_configured_source():
+    tasks = data_fetcher.build_news_tasks(["테슬라", "tesla"])
+
+    assert len(tasks) == 2 * len(data_fetcher.NEWS_SOURCES)
+    assert {source for source, _, _ in tasks} == {source["name"] for source in data_fetcher.NEWS_SOURCES}
+    assert all(args[0]["name"] == source for source, _, args in tasks)
+
+
+def test_build_info_tasks_fetches_subsidy_once():
+    tasks = data_fetcher.build_info_tasks(["테슬라", "tesla"])
+    sources = [source for source, _, _ in tasks]
+    assert sources.count("Subsidy") == 1
+    assert sources.count("Clien") == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_scrape_tasks_yields_sources_as_they_finish():
+    tasks = [
+        ("slow", make_dummy_fetch("slow", delay=0.3), ("테슬라",)),
+        ("fast", make_dummy_fetch("fast", delay=0.05), ("테슬라",)),
+    ]
+
+    chunks = [chunk async for chunk in data_fetcher.stream_scrape_tasks(tasks, deadline=5)]
+
+    assert [[item["title"] for item in chunk] for chunk in chunks] == [["Dummy fast"], ["Dummy slow"]]
+
+
+@pytest.mark.asyncio
+async def test_stream_sources_deduplicates_across_chunks():
+    tasks = [(f"source{i}", make_dummy_fetch("same", delay=0.05 * i), ("테슬라",)) for i in range(3)]
+
+    chunks = [chunk async for chunk in data_fetcher.stream_sources(tasks, "info")]
+
+    assert chunks == [[{"title": "Dummy same", "url": "http://dummy.com/same", "source_type": "info"}]]
+
+
+def make_marking_fetch(name, delay=0.0):
+    def marking_fetch(search_keyword="테슬라"):
+        time.sleep(delay)
+        record_seen_urls([f"http://dummy.com/{name}"])
+        return [{"title": f"Dummy {name}", "url": f"http://dummy.com/{name}"}]
+
+    return marking_fetch
+
+
+@pytest.fixture
+def marked_urls(monkeypatch):
+    marked = []
+    monkeypatch.setattr(checkpoint, "mark_urls_seen", marked.extend)
+    return marked
+
+
+@pytest.mark.asyncio
+async def test_abandoned_tasks_leave_their_urls_unmarked(marked_urls):
+    tasks = [
+        ("fast", make_marking_fetch("fast"), ("테슬라",)),
+        ("slow", make_marking_fetch("slow", delay=0.6), ("테슬라",)),
+    ]
+
+    items = await data_fetcher.run_scrape_tasks(tasks, deadline=0.3)
+    await asyncio.sleep(0.5)
+
+    assert [item["title"] for item in items] == ["Dummy fast"]
+    # The slow task finished after the deadline: its article must be collected again next cycle
+    assert marked_urls == ["http://dummy.com/fast"]
+
+
+@pytest.mark.asyncio
+async def test_stream_marks_urls_only_after_items_are_taken(marked_urls):
+    tasks = [("fast", make_marking_fetch("fast"), ("테슬라",)), ("slow", make_marking_fetch("slow"), ("테슬라",))]
+
+    stream = data_fetcher.stream_scrape_tasks(tasks, deadline=5)
+    await stream.__anext__()
+    assert marked_urls == []
+    # The consumer stops before taking the second chunk
+    await stream.aclose()
+
+    assert len(marked_urls) == 0
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_sources_abandons_scrape_tasks(monkeypatch):
+    abandoned = []
+    abandon = data_fetcher.abandon_scrape_tasks
+
+    def record_abandon(futures, tasks, deadline):
+        abandoned.extend(tasks)
+        abandon(futures, tasks, deadline)
+
+    monkeypatch.setattr(data_fetcher, "abandon_scrape_tasks", record_abandon)
+    tasks = [
+        ("fast", make_dummy_fetch("fast"), ("테슬라",)),
+        ("slow", make_dummy_fetch("slow", delay=0.5), ("테슬라",)),
+    ]
+
+    stream = data_fetcher.stream_sources(tasks, "news")
+    await stream.__anext__()
+    await stream.aclose()
+
+    assert [source for source, _, _ in abandoned] == ["fast", "slow"]
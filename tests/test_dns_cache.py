@@ -0,0 +1,82 @@
+import socket
+
+import pytest
+
+from utils.dns_cache import DnsCache, interleave_families
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResolver:
+    def __init__(self, addresses):
+        self.addresses = addresses
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self, host, port, type=0):
+        self.calls += 1
+        if self.fail:
+            raise socket.gaierror("resolver down")
+        return [(family, socket.SOCK_STREAM, 6, "", (address, port)) for family, address in self.addresses]
+
+
+def test_resolve_caches_until_ttl_expires():
+    clock = FakeClock()
+    resolver = FakeResolver([(socket.AF_INET, "10.0.0.1")])
+    cache = DnsCache(ttl=60, resolver=resolver, clock=clock)
+
+    assert cache.resolve("news.test", 443) == [(socket.AF_INET, "10.0.0.1")]
+    assert cache.resolve("news.test", 443) == [(socket.AF_INET, "10.0.0.1")]
+    assert resolver.calls == 1
+
+    clock.now = 61
+    assert cache.lookup("news.test", 443) is None
+    cache.resolve("news.test", 443)
+    assert resolver.calls == 2
+
+
+def test_resolve_serves_stale_addresses_when_refresh_fails():
+    clock = FakeClock()
+    resolver = FakeResolver([(socket.AF_INET, "10.0.0.1")])
+    cache = DnsCache(ttl=60, resolver=resolver, clock=clock)
+    cache.resolve("news.test", 443)
+
+    clock.now = 61
+    resolver.fail = True
+
+    assert cache.resolve("news.test", 443) == [(socket.AF_INET, "10.0.0.1")]
+    with pytest.raises(socket.gaierror):
+        cache.resolve("other.test", 443)
+
+
+def test_interleave_families_alternates_starting_with_first_family():
+    addresses = [
+        (socket.AF_INET6, "2001:db8::1"),
+        (socket.AF_INET6, "2001:db8::2"),
+        (socket.AF_INET, "10.0.0.1"),
+        (socket.AF_INET, "10.0.0.2"),
+        (socket.AF_INET, "10.0.0.3"),
+    ]
+
+    assert [address for _, address in interleave_families(addresses)] == [
+        "2001:db8::1",
+        "10.0.0.1",
+        "2001:db8::2",
+        "10.0.0.2",
+        "10.0.0.3",
+    ]
+
+
+def test_preresolve_counts_resolved_hosts():
+    resolver = FakeResolver([(socket.AF_INET, "10.0.0.1")])
+    cache = DnsCache(ttl=60, resolver=resolver)
+
+    assert cache.preresolve([("a.test", 443), ("b.test", 443), ("a.test", 443)]) == 2
+    assert resolver.calls == 2
+    assert cache.lookup("b.test", 443) == [(socket.AF_INET, "10.0.0.1")]
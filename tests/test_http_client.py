@@ -0,0 +1,298 @@
+import gzip
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pycurl
+import pytest
+
+from scrapers import checkpoint, http_client, throttling
+from utils.dns_cache import DnsCache
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_GET(self):
+        KeepAliveHandler.connections.add(self.client_address)
+        if self.path == "/listing" and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        if self.path == "/compressed":
+            body = ("<p>테슬라</p>" * 1000).encode("utf-8")
+            self.send_response(200)
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        body = f"path={self.path}".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Test", "yes")
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    KeepAliveHandler.connections = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+    http_client.close_http_client()
+
+
+def test_get_returns_status_headers_and_body(server):
+    response = http_client.get(f"{server}/hello")
+
+    assert response.status == 200
+    assert response.text == "path=/hello"
+    assert response.headers["x-test"] == "yes"
+    assert response.url == f"{server}/hello"
+
+
+@pytest.fixture
+def backoffs(monkeypatch):
+    """Record the backoff delays fetch_all picks without waiting for them"""
+    delays = []
+    backoff_delay = http_client.backoff_delay
+
+    def record(retry, retry_after=None):
+        delays.append(backoff_delay(retry, retry_after))
+        return 0.0
+
+    monkeypatch.setattr(http_client, "backoff_delay", record)
+    http_client.reset_retry_budget()
+    return delays
+
+
+def scripted_get(monkeypatch, script):
+    """Serve each URL's requests from its script of statuses, (status, headers) pairs and exceptions"""
+    requests = []
+
+    def fake_get(url, headers=None, timeout=10, conditional=False):
+        requests.append(url)
+        step = script[url].pop(0)
+        if isinstance(step, Exception):
+            raise step
+        status, response_headers = step if isinstance(step, tuple) else (step, {})
+        return http_client.Response(url, status, response_headers, b"", 0.0, requested_url=url)
+
+    monkeypatch.setattr(http_client, "get", fake_get)
+    return requests
+
+
+def test_fetch_all_keeps_order_and_reports_failures(server, monkeypatch, backoffs):
+    real_get = http_client.get
+
+    def fake_get(url, headers=None, timeout=10, conditional=False):
+        if url.endswith("/down"):
+            raise ConnectionError("connection refused")
+        if url.endswith("/missing"):
+            return http_client.Response(url, 404, {}, b"", 0.0, requested_url=url)
+        return real_get(url, headers=headers, timeout=timeout, conditional=conditional)
+
+    monkeypatch.setattr(http_client, "get", fake_get)
+    urls = [f"{server}/{i}" for i in range(3)] + [f"{server}/down", f"{server}/missing"]
+
+    responses = http_client.fetch_all(urls)
+
+    assert [response.requested_url for response in responses] == urls
+    assert [response.text for response in responses[:3]] == ["path=/0", "path=/1", "path=/2"]
+    assert all(response.ok for response in responses[:3])
+    assert responses[3].status == 0
+    assert responses[3].error == "connection refused"
+    assert responses[4].status == 404
+    assert responses[4].error == "HTTP status 404"
+    assert not responses[3].ok and not responses[4].ok
+
+
+def test_fetch_all_retries_transient_errors_with_jittered_backoff(monkeypatch, backoffs):
+    url = "http://example.com/flaky"
+    requests = scripted_get(monkeypatch, {url: [503, ConnectionError("reset"), 200]})
+
+    (response,) = http_client.fetch_all([url], retries=3)
+
+    assert response.status == 200
+    assert len(requests) == 3
+    # Full jitter: each wait lies between zero and the exponential cap
+    assert 0 <= backoffs[0] <= http_client.HTTP_RETRY_BASE_DELAY
+    assert 0 <= backoffs[1] <= 2 * http_client.HTTP_RETRY_BASE_DELAY
+
+
+def test_fetch_all_does_not_retry_client_errors_or_refused_hosts(monkeypatch, backoffs):
+    script = {
+        "http://example.com/missing": [404],
+        "http://open.example.com/a": [throttling.CircuitOpenError("Circuit open for open.example.com")],
+    }
+    requests = scripted_get(monkeypatch, script)
+
+    responses = http_client.fetch_all(list(script), retries=3)
+
+    assert [response.status for response in responses] == [404, 0]
+    assert responses[1].error == "Circuit open for open.example.com"
+    assert len(requests) == 2
+    assert backoffs == []
+
+
+def test_fetch_all_honours_short_retry_after_only(monkeypatch, backoffs):
+    url = "http://example.com/limited"
+    requests = scripted_get(monkeypatch, {url: [(429, {"retry-after": "3"}), (429, {"retry-after": "3600"})]})
+
+    (response,) = http_client.fetch_all([url], retries=5)
+
+    assert response.status == 429
+    assert response.error == "HTTP status 429"
+    assert backoffs == [3.0]
+    assert len(requests) == 2
+
+
+def test_fetch_all_retry_budget_is_shared_by_requests(monkeypatch, backoffs):
+    monkeypatch.setattr(http_client, "_retry_budget", http_client.RetryBudget(limit=2))
+    urls = [f"http://example.com/down{i}" for i in range(3)]
+    requests = scripted_get(monkeypatch, {url: [500, 500, 500] for url in urls})
+
+    responses = http_client.fetch_all(urls)
+
+    assert [response.status for response in responses] == [500, 500, 500]
+    # Two retries in total instead of two per URL
+    assert len(backoffs) == 2
+    assert len(requests) == 5
+
+
+def test_pycurl_get_reuses_connections(server):
+    for i in range(5):
+        status, text = http_client.pycurl_get(f"{server}/{i}")
+        assert status == 200
+        assert text == f"path=/{i}"
+
+    # All sequential requests to the same host go over one kept-alive connection
+    assert len(KeepAliveHandler.connections) == 1
+
+
+def test_pool_caps_idle_handles():
+    pool = http_client.CurlPool(max_handles=1)
+    first, second = pool.acquire("a"), pool.acquire("b")
+    pool.release("a", first)
+    pool.release("b", second)
+
+    assert pool.acquire("b") is first
+    pool.close()
+
+
+def test_get_releases_probe_and_closes_handle_when_setup_fails(monkeypatch):
+    pool = http_client.CurlPool()
+    acquired = []
+    acquire = pool.acquire
+    monkeypatch.setattr(pool, "acquire", lambda host: acquired.append(acquire(host)) or acquired[-1])
+    monkeypatch.setattr(http_client, "get_pool", lambda: pool)
+
+    def broken_resolve(url):
+        raise ValueError("bad resolve entry")
+
+    monkeypatch.setattr(http_client, "resolve_option", broken_resolve)
+    breaker = throttling.get_host_throttle("setup-error.test").breaker
+    breaker.state = "half_open"
+
+    with pytest.raises(ValueError):
+        http_client.get("http://setup-error.test/a")
+
+    # The probe was never sent, so the next request may still probe the host
+    assert breaker.allow_request()
+    # The handle is neither kept idle nor left open
+    assert pool._idle_count == 0
+    with pytest.raises(pycurl.error):
+        acquired[0].setopt(pycurl.URL, "http://setup-error.test/a")
+
+
+def test_conditional_get_revalidates_with_stored_etag(server, monkeypatch):
+    validators = {}
+    monkeypatch.setattr(http_client, "get_http_validators", lambda url: validators.get(url, {}))
+    monkeypatch.setattr(checkpoint, "store_http_validators", lambda url, value: validators.__setitem__(url, value))
+
+    first = http_client.get(f"{server}/listing", conditional=True)
+    second = http_client.get(f"{server}/listing", conditional=True)
+    unconditional = http_client.get(f"{server}/listing")
+
+    assert first.status == 200
+    assert validators[f"{server}/listing"] == {"etag": '"v1"'}
+    assert second.status == 304
+    assert second.body == b""
+    assert unconditional.status == 200
+
+
+def test_fetch_all_defers_validators_to_the_task_checkpoint(server, monkeypatch):
+    validators = {}
+    monkeypatch.setattr(http_client, "get_http_validators", lambda url: validators.get(url, {}))
+    monkeypatch.setattr(checkpoint, "store_http_validators", lambda url, value: validators.__setitem__(url, value))
+
+    responses, task_checkpoint = checkpoint.run_with_checkpoint(
+        http_client.fetch_all, [f"{server}/a", f"{server}/b"], None, 10, True
+    )
+
+    assert [response.status for response in responses] == [200, 200]
+    assert validators == {}
+    task_checkpoint.commit()
+    assert validators == {f"{server}/a": {"etag": '"v1"'}, f"{server}/b": {"etag": '"v1"'}}
+
+
+def test_get_negotiates_compression_and_counts_saved_bytes(server):
+    http_client.get_transfer_stats(reset=True)
+
+    response = http_client.get(f"{server}/compressed")
+
+    assert response.text == "<p>테슬라</p>" * 1000
+    assert response.wire_size < len(response.body) / 10
+    stats = http_client.get_transfer_stats()[server.split("://")[1]]
+    assert stats["requests"] == 1
+    assert stats["bytes_saved"] == len(response.body) - response.wire_size
+
+
+def test_get_without_compression(server, monkeypatch):
+    monkeypatch.setattr(http_client, "HTTP_COMPRESSION", False)
+
+    response = http_client.get(f"{server}/compressed")
+
+    assert response.text == "<p>테슬라</p>" * 1000
+    assert response.wire_size == len(response.body)
+
+
+def test_resolve_option_uses_shared_dns_cache(monkeypatch):
+    cache = DnsCache(
+        resolver=lambda host, port, type=0: [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:db8::1", port, 0, 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", port)),
+        ]
+    )
+    monkeypatch.setattr(http_client, "get_dns_cache", lambda: cache)
+
+    assert http_client.resolve_option("https://news.test/a") == ["news.test:443:[2001:db8::1],10.0.0.1"]
+    assert http_client.resolve_option("http://127.0.0.1:8080/a") is None
+
+
+def test_get_connects_to_cached_address(server, monkeypatch):
+    port = int(server.rsplit(":", 1)[1])
+    cache = DnsCache(
+        resolver=lambda host, port, type=0: [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+    )
+    monkeypatch.setattr(http_client, "get_dns_cache", lambda: cache)
+
+    # scraper.test only exists in the DNS cache
+    response = http_client.get(f"http://scraper.test:{port}/hello")
+
+    assert response.status == 200
+    assert response.text == "path=/hello"
@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from utils.http_response import Response, detect_charset, parse_retry_after
+
+
+@pytest.mark.parametrize(
+    "headers, body, expected",
+    [
+        ({"content-type": "text/html; charset=EUC-KR"}, b"<html></html>", "cp949"),
+        ({"content-type": "text/html"}, b'<html><head><meta charset="euc-kr"></head>', "cp949"),
+        (
+            {},
+            b'<meta http-equiv="Content-Type" content="text/html; charset=ks_c_5601-1987">',
+            "cp949",
+        ),
+        # The header wins over a conflicting meta tag
+        ({"content-type": "text/html; charset=utf-8"}, b'<meta charset="euc-kr">', "utf-8"),
+        ({"content-type": "text/html; charset=bogus"}, b"<html></html>", "utf-8"),
+        ({}, b"<html></html>", "utf-8"),
+    ],
+)
+def test_detect_charset(headers, body, expected):
+    assert detect_charset(headers, body) == expected
+
+
+def test_response_decodes_declared_korean_charset_once():
+    # "똠" is only in CP949, not in strict EUC-KR
+    html = '<html><head><meta charset="euc-kr"></head><body><p>테슬라 똠</p></body></html>'
+    response = Response("http://example.com", 200, {}, html.encode("cp949"), 0.1)
+
+    assert response.text == html
+    assert response.markup == html
+    assert response.text is response.text
+
+
+def test_response_markup_keeps_utf8_bytes():
+    body = "<p>테슬라</p>".encode("utf-8")
+    response = Response("http://example.com", 200, {"content-type": "text/html"}, body, 0.1)
+
+    assert response.markup is body
+
+
+def test_failed_response_records_error():
+    response = Response.failed("http://example.com", TimeoutError(), 1.5)
+
+    assert response.status == 0
+    assert response.body == b""
+    assert response.error == "TimeoutError"
+    assert response.requested_url == "http://example.com"
+    assert not response.ok
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("120", 120.0),
+        ("Wed, 21 Oct 2015 07:28:30 GMT", 30.0),
+        ("Wed, 21 Oct 2015 07:27:00 GMT", 0.0),
+        ("soon", None),
+        (None, None),
+    ],
+)
+def test_retry_after(value, expected):
+    headers = {"retry-after": value} if value else {}
+    response = Response("http://example.com", 429, headers, b"", 0.1)
+
+    assert response.retry_after(now=datetime(2015, 10, 21, 7, 28, tzinfo=timezone.utc)) == expected
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("30") == 30
+    assert (
+        parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=datetime(2015, 10, 21, 7, 27, tzinfo=timezone.utc)) == 60
+    )
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after(None) is None
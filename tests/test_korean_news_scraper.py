@@ -0,0 +1,265 @@
+import threading
+import time
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scrapers import http_client, korean_news_scraper
+from scrapers.news_sources import get_news_source
+from utils.http_response import Response
+
+MOTORGRAPH_LISTING = """
+<section id="section-list"><ul class="type">
+  <li class="item"><div class="view-cont">
+    <h2 class="titles"><a href="/news/articleView.html?idxno=1">First</a></h2>
+    <p class="lead"><a class="read">First summary</a></p>
+    <em class="replace-date">2025.03.28 10:00</em>
+  </div></li>
+  <li class="item"><div class="view-cont">
+    <h2 class="titles"><a href="/news/articleView.html?idxno=2">Second</a></h2>
+    <p class="lead"><a class="read">Second summary</a></p>
+    <em class="replace-date">2025.03.28 11:00</em>
+  </div></li>
+</ul></section>
+"""
+
+
+def fetch_motorgraph(search_keyword):
+    return korean_news_scraper.fetch_news_source(get_news_source("Motorgraph"), search_keyword)
+
+
+@pytest.fixture(autouse=True)
+def seen_urls(monkeypatch):
+    seen = set()
+    monkeypatch.setattr(korean_news_scraper, "filter_unseen_urls", lambda urls: [u for u in urls if u not in seen])
+    monkeypatch.setattr(korean_news_scraper, "record_seen_urls", lambda urls: seen.update(urls))
+    return seen
+
+
+@pytest.fixture(autouse=True)
+def high_water_marks(monkeypatch):
+    marks = {}
+    monkeypatch.setattr(korean_news_scraper, "get_high_water_mark", lambda source, keyword: marks.get(source))
+    monkeypatch.setattr(
+        korean_news_scraper, "record_high_water_mark", lambda source, keyword, url: marks.update({source: url})
+    )
+    return marks
+
+
+def patch_get(monkeypatch, fake_get):
+    """Serve listing and detail requests from fake_get(url, ...) -> (status, html)"""
+
+    def fake_response(url, headers=None, timeout=10, conditional=False):
+        status, html = fake_get(url, headers=headers, timeout=timeout, conditional=conditional)
+        return Response(url, status, {}, html.encode("utf-8"), 0.0)
+
+    monkeypatch.setattr(http_client, "get", fake_response)
+
+
+def test_fetch_detail_contents_keeps_order_and_blanks_failures(monkeypatch):
+    def fake_get(url, headers=None, timeout=10, conditional=False):
+        time.sleep(0.1)
+        if url.endswith("/missing"):
+            return Response(url, 404, {}, b"", 0.1)
+        if url.endswith("/down"):
+            raise ConnectionError("connection refused")
+        return Response(url, 200, {}, f"<p>{url}</p>".encode("utf-8"), 0.1)
+
+    monkeypatch.setattr(http_client, "get", fake_get)
+    # Without retries the failed request takes one round trip like the others
+    monkeypatch.setattr(http_client, "_retry_budget", http_client.RetryBudget(limit=0))
+    urls = [f"http://example.com/{i}" for i in range(6)] + ["http://example.com/missing", "http://example.com/down"]
+
+    started = time.monotonic()
+    contents = korean_news_scraper.fetch_detail_contents(urls, korean_news_scraper.extract_article_content, "Test")
+    elapsed = time.monotonic() - started
+
+    assert contents == [f"http://example.com/{i}" for i in range(6)] + ["", ""]
+    # Detail pages are fetched together rather than one round trip at a time
+    assert elapsed < 0.1 * len(urls) / 2
+
+
+def test_fetch_news_source_falls_back_to_summary(monkeypatch):
+    def fake_get(url, headers=None, timeout=10, conditional=False):
+        if "articleList" in url:
+            return 200, MOTORGRAPH_LISTING
+        if url.endswith("idxno=1"):
+            return 200, '<div class="article-body"><p>Full body</p></div>'
+        return 500, ""
+
+    patch_get(monkeypatch, fake_get)
+
+    items = fetch_motorgraph("테슬라")
+
+    assert [item["title"] for item in items] == ["First", "Second"]
+    assert items[0]["url"] == "https://www.motorgraph.com/news/articleView.html?idxno=1"
+    assert items[0]["content"] == "Full body"
+    assert items[1]["content"] == "Second summary"
+
+
+def test_fetch_news_source_skips_unchanged_listing(monkeypatch):
+    requested = []
+
+    def fake_get(url, headers=None, timeout=10, conditional=False):
+        requested.append((url, conditional))
+        return 304, ""
+
+    patch_get(monkeypatch, fake_get)
+
+    assert fetch_motorgraph("테슬라") == []
+    # Only the revalidated listing page is requested; no detail pages are fetched
+    assert len(requested) == 1
+    assert requested[0][1] is True
+
+
+def test_fetch_news_source_skips_seen_articles(monkeypatch, seen_urls):
+    requested = []
+
+    def fake_get(url, headers=None, timeout=10, conditional=False):
+        requested.append(url)
+        if "articleList" in url:
+            return 200, MOTORGRAPH_LISTING
+        return 200, '<div class="article-body"><p>Full body</p></div>'
+
+    patch_get(monkeypatch, fake_get)
+    seen_urls.add("https://www.motorgraph.com/news/articleView.html?idxno=1")
+
+    items = fetch_motorgraph("테슬라")
+
+    assert [item["title"] for item in items] == ["Second"]
+    assert not any(url.endswith("idxno=1") for url in requested)
+    # The newly fetched article is remembered for the next cycle
+    assert "https://www.motorgraph.com/news/articleView.html?idxno=2" in seen_urls
+    assert fetch_motorgraph("테슬라") == []
+
+
+def listing_page(first, last):
+    return "".join(f'<li><a href="/post/{i}">Post {i}</a></li>' for i in range(last, first - 1, -1))
+
+
+def parse_test_listing(html):
+    return [{"title": a.get_text(), "url": a["href"]} for a in BeautifulSoup(html, "html.parser").select("li a")]
+
+
+def test_fetch_listing_pages_reads_first_page_without_mark(monkeypatch, high_water_marks):
+    requested = []
+
+    def fake_get(url, headers=None, timeout=10, conditional=False):
+        requested.append((url, threading.current_thread().name.startswith("fetch")))
+        return 200, listing_page(1, 3)
+
+    patch_get(monkeypatch, fake_get)
+
+    items = korean_news_scraper.fetch_listing_pages("Test", "테슬라", lambda page: f"list?p={page}", parse_test_listing)
+
+    assert [item["url"] for item in items] == ["/post/3", "/post/2", "/post/1"]
+    # Listing pages share the batch request threads (and their concurrency limit) with detail pages
+    assert requested == [("list?p=0", True)]
+    assert high_water_marks["Test"] == "/post/3"
+
+
+def test_fetch_listing_pages_pages_forward_to_high_water_mark(monkeypatch, high_water_marks):
+    # 7 new posts arrived since /post/3 was the newest; pages hold 4 posts each
+    pages = {"list?p=0": listing_page(7, 10), "list?p=1": listing_page(3, 6), "list?p=2": listing_page(1, 2)}
+    requested = []
+
+    def fake_get(url, headers=None, timeout=10, conditional=False):
+        requested.append((url, conditional))
+        return 200, pages[url]
+
+    patch_get(monkeypatch, fake_get)
+    high_water_marks["Test"] = "/post/3"
+
+    items = korean_news_scraper.fetch_listing_pages("Test", "테슬라", lambda page: f"list?p={page}", parse_test_listing)
+
+    assert [item["url"] for item in items] == [f"/post/{i}" for i in range(10, 3, -1)]
+    # Only the first page is revalidated and paging stops at the page holding the mark
+    assert requested == [("list?p=0", True), ("list?p=1", False)]
+    assert high_water_marks["Test"] == "/post/10"
+
+
+def test_fetch_listing_pages_stops_paging_when_seen_lookup_fails(monkeypatch, high_water_marks):
+    pages = {"list?p=0": listing_page(7, 10), "list?p=1": listing_page(3, 6)}
+    requested = []
+
+    def fake_get(url, headers=None, timeout=10, conditional=False):
+        requested.append(url)
+        return 200, pages[url]
+
+    def broken_filter(urls):
+        raise ConnectionError("redis down")
+
+    patch_get(monkeypatch, fake_get)
+    monkeypatch.setattr(korean_news_scraper, "SKIP_SEEN_URLS", True)
+    monkeypatch.setattr(korean_news_scraper, "filter_unseen_urls", broken_filter)
+    high_water_marks["Test"] = "/post/3"
+
+    items = korean_news_scraper.fetch_listing_pages("Test", "테슬라", lambda page: f"list?p={page}", parse_test_listing)
+
+    # The pages read so far are kept and paging ends instead of failing the source
+    assert [item["url"] for item in items] == [f"/post/{i}" for i in range(10, 6, -1)]
+    assert requested == ["list?p=0"]
+    assert high_water_marks["Test"] == "/post/10"
+
+
+def test_fetch_listing_pages_returns_none_when_unchanged(monkeypatch):
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: Response(url, 304, {}, b"", 0.0))
+
+    assert korean_news_scraper.fetch_listing_pages("Test", "테슬라", lambda page: "list", parse_test_listing) is None
+
+
+NAVER_LISTING = """
+<div class="group_news"><ul class="list_news">
+  <li class="bx">
+    <a class="info press">테슬라일보</a><span class="info">네이버뉴스</span><span class="info">1시간 전</span>
+    <a class="news_tit" href="https://example.com/1">Tesla <b>news</b></a>
+  </li>
+  <li class="bx"><span class="info">광고</span></li>
+</ul></div>
+"""
+
+DANAWA_LISTING = """
+<table class="newsTable"><tbody>
+  <tr>
+    <td class="image"><a href="/news/?Work=detail&no=1"><img></a></td>
+    <td class="contents">
+      <div class="title"><a href="/ignored">Danawa title</a></div><div class="summary"> Summary </div>
+      <div class="info"><span class="press"><a>Press</a></span><span>2025.03.28.</span></div>
+    </td>
+  </tr>
+</tbody></table>
+"""
+
+
+def test_parse_news_listing_applies_field_specs():
+    naver = korean_news_scraper.parse_news_listing(get_news_source("Naver"), NAVER_LISTING)
+    danawa = korean_news_scraper.parse_news_listing(get_news_source("AUTO.DANAWA"), DANAWA_LISTING)
+
+    assert naver == [
+        {
+            "title": "Teslanews",
+            "url": "https://example.com/1",
+            "source": "테슬라일보",
+            "content": "Teslanews",
+            "published": "1시간 전",
+            "news_type": "domestic",
+        }
+    ]
+    assert danawa == [
+        {
+            "title": "Danawa title",
+            "url": "https://auto.danawa.com/news/?Work=detail&no=1",
+            "source": "Press",
+            "content": "Summary",
+            "published": "2025.03.28.",
+            "news_type": "domestic",
+        }
+    ]
+
+
+def test_parse_news_listing_accepts_utf8_bytes():
+    source = get_news_source("Naver")
+
+    assert korean_news_scraper.parse_news_listing(source, NAVER_LISTING.encode("utf-8")) == (
+        korean_news_scraper.parse_news_listing(source, NAVER_LISTING)
+    )
@@ -0,0 +1,50 @@
+from utils.local_cache import LocalCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = LocalCache(max_entries=10, ttl=100, clock=clock)
+    cache.add_many(["a"])
+    cache.add_many(["b"], ttl=10)
+
+    clock.now = 50
+    assert cache.contains_many(["a", "b", "c"]) == [True, False, False]
+    # A per-key ttl never exceeds the cache's ttl
+    cache.add_many(["c"], ttl=1000)
+    clock.now = 151
+    assert cache.contains_many(["a", "c"]) == [False, False]
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = LocalCache(max_entries=2, ttl=100)
+    cache.add_many(["a", "b"])
+    cache.contains_many(["a"])
+    cache.add_many(["c"])
+
+    assert cache.contains_many(["a", "b", "c"]) == [True, False, True]
+    assert cache.snapshot()["evictions"] == 1
+
+
+def test_snapshot_counts_hits_and_misses():
+    cache = LocalCache(max_entries=10, ttl=100)
+    cache.add_many(["a"])
+    cache.contains_many(["a", "b", "a", "c"])
+
+    assert cache.snapshot(reset=True) == {"entries": 1, "hits": 2, "misses": 2, "evictions": 0, "hit_rate": 0.5}
+    assert cache.snapshot()["hits"] == 0
+
+
+def test_disabled_cache_keeps_nothing():
+    cache = LocalCache(max_entries=0, ttl=100)
+    cache.add_many(["a"])
+
+    assert cache.contains_many(["a"]) == [False]
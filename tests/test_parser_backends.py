@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scrapers import korean_news_scraper, parsing, tesla_extra_scraper
+from scrapers.news_sources import get_news_source
+
+FIXTURES = Path(__file__).parent / "fixtures" / "detail"
+
+# Saved detail page -> parser; the matching .txt file holds the html.parser output
+DETAIL_PARSERS = {
+    "naver": korean_news_scraper.get_detail_parser(get_news_source("Naver")),
+    "motorgraph": korean_news_scraper.get_detail_parser(get_news_source("Motorgraph")),
+    "auto_danawa": korean_news_scraper.get_detail_parser(get_news_source("AUTO.DANAWA")),
+    "etnews": korean_news_scraper.get_detail_parser(get_news_source("ET News")),
+    "heraldcorp": korean_news_scraper.get_detail_parser(get_news_source("Herald Economy")),
+    "donga": korean_news_scraper.get_detail_parser(get_news_source("Donga.com")),
+    "edaily": korean_news_scraper.get_detail_parser(get_news_source("Edaily")),
+    "chosunbiz": korean_news_scraper.get_detail_parser(get_news_source("ChosunBiz")),
+    "autodaily": korean_news_scraper.get_detail_parser(get_news_source("AutoDaily")),
+    "itchosun": korean_news_scraper.get_detail_parser(get_news_source("IT Chosun")),
+    "clien": tesla_extra_scraper.parse_clien_detail,
+    "dcinside": tesla_extra_scraper.parse_dcinside_detail,
+}
+
+
+@pytest.fixture(params=["html.parser", "lxml", "selectolax"])
+def backend(request, monkeypatch):
+    try:
+        backend = parsing.create_parser_backend(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+    monkeypatch.setattr(parsing, "get_parser_backend", lambda name=None: backend)
+    monkeypatch.setattr(korean_news_scraper, "get_parser_backend", lambda name=None: backend)
+    monkeypatch.setattr(tesla_extra_scraper, "get_parser_backend", lambda name=None: backend)
+    return backend
+
+
+@pytest.mark.parametrize("body_only", [True, False])
+@pytest.mark.parametrize("name", sorted(DETAIL_PARSERS))
+def test_detail_parser_matches_golden_output(backend, name, body_only, monkeypatch):
+    monkeypatch.setattr(parsing, "PARSE_BODY_ONLY", body_only)
+    html = (FIXTURES / f"{name}.html").read_text(encoding="utf-8")
+    expected = (FIXTURES / f"{name}.txt").read_text(encoding="utf-8")
+
+    assert DETAIL_PARSERS[name](html) == expected
+
+
+def test_missing_container_gives_empty_text(backend):
+    html = "<html><body><p>No article here</p></body></html>"
+
+    assert DETAIL_PARSERS["motorgraph"](html) == ""
+    assert tesla_extra_scraper.parse_clien_detail(html) == ""
+    assert tesla_extra_scraper.parse_dcinside_detail(html) == ""
+
+
+def test_container_filter_reduces_selectors_to_leading_compound():
+    rules = parsing.ContainerFilter.for_selectors(("div.post_content article div.post_article", "article#a.b.c"))
+
+    assert rules.rules == [("div", None, {"post_content"}), ("article", "a", {"b", "c"})]
+    # Selectors that may match outside the leading element's subtree need the whole document
+    assert parsing.ContainerFilter.for_selectors(("h1 + div.body",)) is None
+    assert parsing.ContainerFilter.for_selectors(("div:first-child",)) is None
+
+
+def test_body_only_parse_builds_just_the_container():
+    html = '<div class="nav"><a>menu</a></div><div class="article-body extra"><p>Body</p></div><p>footer</p>'
+    parse_only = parsing.ContainerFilter.for_selectors(("div.article-body",))
+
+    soup = BeautifulSoup(html, "html.parser", parse_only=parse_only)
+
+    assert str(soup) == '<div class="article-body extra"><p>Body</p></div>'
+
+
+def test_unknown_backend_falls_back_to_html_parser():
+    assert parsing.get_parser_backend("no-such-parser").name == "html.parser"
+
+
+@pytest.mark.parametrize("name", ["motorgraph", "clien", "dcinside"])
+def test_detail_parser_accepts_utf8_bytes(backend, name):
+    html = (FIXTURES / f"{name}.html").read_text(encoding="utf-8")
+
+    assert DETAIL_PARSERS[name](html.encode("utf-8")) == DETAIL_PARSERS[name](html)
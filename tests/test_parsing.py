@@ -0,0 +1,50 @@
+import os
+from unittest import mock
+
+import pytest
+
+from scrapers import parsing
+from scrapers.korean_news_scraper import extract_article_content
+
+ARTICLE = "<html><body><p>First paragraph</p><br/><p>Second paragraph</p></body></html>"
+
+
+def worker_pid(html):
+    return os.getpid()
+
+
+def broken_parser(html):
+    return html.missing_attribute
+
+
+@pytest.fixture
+def parse_pool(monkeypatch):
+    monkeypatch.setattr(parsing, "PARSE_PROCESSES", 1)
+    yield
+    parsing.close_parse_pool()
+
+
+def test_run_parser_parses_in_calling_thread_when_disabled(monkeypatch):
+    monkeypatch.setattr(parsing, "PARSE_PROCESSES", 0)
+
+    assert parsing.get_parse_pool() is None
+    assert parsing.run_parser(worker_pid, ARTICLE) == os.getpid()
+
+
+def test_run_parser_uses_worker_process(parse_pool):
+    assert parsing.run_parser(extract_article_content, ARTICLE) == extract_article_content(ARTICLE)
+    assert parsing.run_parser(worker_pid, ARTICLE) != os.getpid()
+
+
+def test_run_parser_falls_back_for_unpicklable_parsers(parse_pool):
+    assert parsing.run_parser(lambda html: len(html), ARTICLE) == len(ARTICLE)
+
+
+def test_run_parser_propagates_parser_errors_from_worker(parse_pool, monkeypatch):
+    logger = mock.Mock()
+    monkeypatch.setattr(parsing, "logger", logger)
+
+    with pytest.raises(AttributeError):
+        parsing.run_parser(broken_parser, ARTICLE)
+    # The parser's own error is not mistaken for an unpicklable parser
+    logger.warning.assert_not_called()
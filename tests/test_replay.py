@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+import replay
+from scrapers import http_client, korean_news_scraper
+from utils import cache
+
+
+def write_recording(path, count=4):
+    items = [
+        {
+            "title": f"Tesla news {i}",
+            "content": f"Body {i}",
+            "published": "2025.03.28",
+            "source": "Motorgraph" if i % 2 else "Naver",
+            "url": f"https://example.com/{i}",
+        }
+        for i in range(count)
+    ]
+    path.write_text(json.dumps({"news": items, "info": []}), encoding="utf-8")
+
+
+def test_load_recording_scales_with_distinct_urls(tmp_path):
+    path = tmp_path / "items.json"
+    write_recording(path, count=2)
+
+    recording = replay.load_recording(str(path), scale=3)
+
+    urls = [item["url"] for item in recording["news"]]
+    assert len(urls) == 6
+    assert len(set(urls)) == 6
+    assert recording["info"] == []
+
+
+@pytest.mark.asyncio
+async def test_replay_runs_pipeline_offline(tmp_path):
+    path = tmp_path / "items.json"
+    write_recording(path, count=4)
+
+    report = await replay.replay(str(path), scale=2, batch_size=3)
+
+    assert report["items"] == 8
+    assert report["analyzed_items"] == 8
+    # Items left over from one source are batched together with the next source's items
+    assert report["analysis_calls"] == 3
+    assert report["messages_sent"] == 8
+    assert report["first_send_seconds"] is not None
+
+
+@pytest.mark.asyncio
+async def test_record_leaves_redis_untouched(tmp_path, monkeypatch):
+    production = cache.FallbackCache()
+    monkeypatch.setattr(cache, "_redis_client", production)
+
+    async def collect_news():
+        assert not korean_news_scraper.SKIP_SEEN_URLS
+        assert not korean_news_scraper.INCREMENTAL_LISTING
+        assert not http_client.HTTP_CONDITIONAL_GET
+        cache.mark_urls_seen(["https://example.com/1"])
+        return [{"title": "Tesla news", "url": "https://example.com/1"}]
+
+    async def collect_info():
+        return []
+
+    monkeypatch.setattr(replay, "collect_news_sources_async", collect_news)
+    monkeypatch.setattr(replay, "collect_info_sources_async", collect_info)
+
+    recording = await replay.record(str(tmp_path / "items.json"))
+
+    assert recording["news"] == [{"title": "Tesla news", "url": "https://example.com/1"}]
+    assert production.stats()["keys"] == 0
@@ -1,3 +1,8 @@
+import asyncio
+
+import pytest
+
+import run
 from run import build_url_mapping
 
 
@@ -9,3 +14,101 @@ def test_build_url_mapping():
     ]
     mapping = build_url_mapping(news_items)
     assert mapping == {"Test": ["http://example.com/1", "http://example.com/2"], "Another": ["http://example.com/3"]}
+
+
+@pytest.mark.asyncio
+async def test_process_news_analyzes_and_sends_fast_sources_before_slow_ones(monkeypatch):
+    events = []
+
+    async def news_stream():
+        yield [{"title": "fast", "url": "http://example.com/fast"}]
+        await asyncio.sleep(0.3)
+        events.append("slow scraped")
+        yield [{"title": "slow", "url": "http://example.com/slow"}]
+
+    async def info_stream():
+        return
+        yield
+
+    async def fake_process_news_batch(batch, url_mapping, source_type):
+        events.append(f"analyzed {[item['title'] for item in batch]}")
+        return [f"message {item['title']}" for item in batch]
+
+    async def fake_send_messages(messages):
+        events.append(f"sent {messages}")
+        return len(messages)
+
+    monkeypatch.setattr(run, "stream_news_sources", news_stream)
+    monkeypatch.setattr(run, "stream_info_sources", info_stream)
+
+    async def no_duplicates(items):
+        return items
+
+    monkeypatch.setattr(run, "filter_new_items_async", no_duplicates)
+    monkeypatch.setattr(run, "estimate_optimal_batch_size", lambda items: 1)
+    monkeypatch.setattr(run, "process_news_batch", fake_process_news_batch)
+    monkeypatch.setattr(run, "send_messages", fake_send_messages)
+
+    await run.process_news()
+
+    assert events == [
+        "analyzed ['fast']",
+        "sent ['message fast']",
+        "slow scraped",
+        "analyzed ['slow']",
+        "sent ['message slow']",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_news_stops_every_stage_when_one_fails(monkeypatch):
+    closed = []
+
+    async def endless_stream(name):
+        try:
+            while True:
+                yield [{"title": name, "url": f"http://example.com/{name}"}]
+                await asyncio.sleep(0)
+        finally:
+            closed.append(name)
+
+    async def failing_filter(items):
+        raise RuntimeError("Redis down")
+
+    monkeypatch.setattr(run, "stream_news_sources", lambda: endless_stream("news"))
+    monkeypatch.setattr(run, "stream_info_sources", lambda: endless_stream("info"))
+    monkeypatch.setattr(run, "filter_new_items_async", failing_filter)
+
+    with pytest.raises(RuntimeError, match="Redis down"):
+        await asyncio.wait_for(run.process_news(), timeout=5)
+    # The feeders blocked on full queues were cancelled and their streams closed
+    assert sorted(closed) == ["info", "news"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_stream_flushes_partial_batch_when_idle(monkeypatch):
+    analyzed = []
+
+    async def fake_process_news_batch(batch, url_mapping, source_type):
+        analyzed.append([item["title"] for item in batch])
+        return []
+
+    async def drop_duplicates(items):
+        return [item for item in items if item["title"] != "dup"]
+
+    monkeypatch.setattr(run, "filter_new_items_async", drop_duplicates)
+    monkeypatch.setattr(run, "estimate_optimal_batch_size", lambda items: 3)
+    monkeypatch.setattr(run, "process_news_batch", fake_process_news_batch)
+
+    queue, messages = asyncio.Queue(), asyncio.Queue()
+    task = asyncio.create_task(run.analyze_stream(queue, "news", messages, flush_after=0.05))
+    await queue.put([{"title": "a"}, {"title": "dup"}, {"title": "b"}])
+    await asyncio.sleep(0.2)
+    # Fewer items than a full batch are analyzed once no more items arrive for a while
+    assert analyzed == [["a", "b"]]
+
+    await queue.put([{"title": "c"}, {"title": "d"}, {"title": "e"}, {"title": "f"}])
+    await queue.put(None)
+
+    assert await task == 6
+    assert analyzed == [["a", "b"], ["c", "d", "e"], ["f"]]
@@ -0,0 +1,93 @@
+import pytest
+
+from scrapers import throttling
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_and_adapts():
+    clock = FakeClock()
+    bucket = throttling.TokenBucket(rate=2, capacity=2, min_rate=0.5, clock=clock)
+
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.5
+    clock.now += 0.5
+    assert bucket.try_acquire() == 0.0
+
+    bucket.slow_down()
+    bucket.slow_down()
+    bucket.slow_down()
+    assert bucket.rate == 0.5
+    bucket.speed_up()
+    assert bucket.rate == 0.7
+
+
+def test_circuit_breaker_opens_and_probes_half_open():
+    clock = FakeClock()
+    breaker = throttling.CircuitBreaker(failure_threshold=2, cooldown=60, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.snapshot() == {"state": "open", "failures": 2, "retry_in": 60}
+    assert not breaker.allow_request()
+
+    # After the cooldown a single probe is let through
+    clock.now += 60
+    assert breaker.allow_request()
+    assert breaker.snapshot()["state"] == "half_open"
+    assert not breaker.allow_request()
+
+    # A failed probe opens the breaker again; a successful one closes it
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    clock.now += 60
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.snapshot() == {"state": "closed", "failures": 0}
+
+
+def test_host_throttle_fails_fast_after_retry_after():
+    throttle = throttling.get_host_throttle("throttled.example.com")
+    throttle.record_response(429, retry_after=120)
+
+    with pytest.raises(throttling.CircuitOpenError):
+        throttle.before_request(timeout=1)
+
+    state = throttling.get_breaker_states()["throttled.example.com"]
+    assert state["state"] == "open"
+    assert state["retry_in"] > 100
+    assert state["rate"] < throttle.bucket.max_rate
+
+
+def test_breaker_opens_for_retry_after_instead_of_cooldown():
+    clock = FakeClock()
+    breaker = throttling.CircuitBreaker(failure_threshold=3, cooldown=300, clock=clock)
+    breaker.record_failure(open_for=1)
+
+    assert not breaker.allow_request()
+    clock.now += 1
+    assert breaker.allow_request()
+    breaker.record_failure()
+    # A failed probe without Retry-After waits for the cooldown
+    clock.now += 299
+    assert not breaker.allow_request()
+    clock.now += 1
+    assert breaker.allow_request()
+
+
+def test_breaker_caps_retry_after():
+    clock = FakeClock()
+    breaker = throttling.CircuitBreaker(failure_threshold=3, cooldown=300, max_retry_after=600, clock=clock)
+    breaker.record_failure(open_for=86400)
+
+    assert breaker.snapshot()["retry_in"] == 600
+    clock.now += 600
+    assert breaker.allow_request()
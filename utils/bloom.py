@@ -0,0 +1,126 @@
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class BloomFilter:
+    """
+    Bit positions of a Bloom filter stored in a Redis bitmap.
+
+    Sized for `capacity` items at a false positive rate of `error_rate`; the
+    positions of an item are derived from its SHA-256 digest by double hashing,
+    so no further hashing is needed.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+
+    def positions(self, digest: str) -> List[int]:
+        """
+        Bit offsets of an item.
+
+        Args:
+            digest: Hex SHA-256 digest of the item (see utils.cache.generate_news_hash)
+
+        Returns:
+            `hashes` offsets below `size`
+        """
+        first = int(digest[:16], 16)
+        # An odd step never shares a factor of two with the size, spreading the offsets
+        step = int(digest[16:32], 16) | 1
+        return [(first + i * step) % self.size for i in range(self.hashes)]
+
+
+class BloomDedupBatch:
+    """
+    Two-round-trip dedup of a batch of items against daily rotating Bloom filters.
+
+    Time is split into buckets of `expire_seconds`. Items are added to the filter
+    of the current and the next bucket, and looked up in the current bucket only,
+    so an item is remembered for one to two bucket lengths.
+
+    The first round trip reads the bits of all items with one BITFIELD command.
+    Items with a bit not set are new for sure and only their bits are written.
+    Only the others (Bloom positives) are confirmed with a SET NX EX of the same
+    `news:<sha256>` key exact mode uses, so a false positive is still reported as
+    new and exact keys exist only for positives. The confirmations and the bit
+    writes (one BITFIELD per bucket) share the second round trip.
+    An item first recorded as a negative has no exact key yet, so its first
+    recurrence that the in-process seen cache no longer answers is reported
+    again; a repeated alert is preferred to a lost one.
+
+    The two round trips are not atomic the way a single SET NX is: two batches
+    running at the same time can both find an item new. Bloom mode assumes a
+    single consumer, which process_news is.
+    """
+
+    def __init__(
+        self,
+        items: Sequence[Dict[str, Any]],
+        digests: Sequence[str],
+        bloom: BloomFilter,
+        expire_seconds: int,
+        now: Optional[float] = None,
+    ):
+        bucket = int((time.time() if now is None else now) // expire_seconds)
+        self.bloom = bloom
+        self.expire_seconds = expire_seconds
+        self.filter_keys = (f"news_bloom:{bucket}", f"news_bloom:{bucket + 1}")
+        # First occurrence of each digest; repeats within the batch are never new
+        self.entries: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        for index, (item, digest) in enumerate(zip(items, digests)):
+            self.entries.setdefault(digest, (index, item))
+        self.maybe_seen: List[str] = []
+        self.new: List[str] = []
+
+    def queue_lookup(self, pipeline) -> None:
+        """Queue the bit reads of the first round trip"""
+        if not self.entries:
+            return
+        lookup = pipeline.bitfield(self.filter_keys[0])
+        for digest in self.entries:
+            for position in self.bloom.positions(digest):
+                lookup.get("u1", position)
+        lookup.execute()
+
+    def read_lookup(self, results: List[Any]) -> None:
+        """Split the items into certainly new and maybe seen from the bit reads"""
+        if not self.entries:
+            return
+        bits = results[0]
+        hashes = self.bloom.hashes
+        for i, digest in enumerate(self.entries):
+            if all(bits[i * hashes : (i + 1) * hashes]):
+                self.maybe_seen.append(digest)
+            else:
+                self.new.append(digest)
+
+    def queue_update(self, pipeline) -> None:
+        """Queue the exact confirmation of maybe-seen items and the insertion of new items into both buckets"""
+        for digest in self.maybe_seen:
+            pipeline.set(f"news:{digest}", 1, ex=self.expire_seconds, nx=True)
+        if not self.new:
+            return
+        for filter_key in self.filter_keys:
+            update = pipeline.bitfield(filter_key)
+            for digest in self.new:
+                for position in self.bloom.positions(digest):
+                    update.set("u1", position, 1)
+            update.execute()
+            # The next bucket's filter must outlive it; it is refreshed on every batch
+            pipeline.expire(filter_key, 2 * self.expire_seconds)
+
+    def read_update(self, results: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Collect the new items from the confirmation results.
+
+        Returns:
+            New items, in input order
+        """
+        # SET NX succeeds when the exact key was missing: a Bloom false positive
+        false_positives = [digest for digest, added in zip(self.maybe_seen, results) if added]
+        new = [self.entries[digest] for digest in self.new + false_positives]
+        return [item for _, item in sorted(new, key=lambda entry: entry[0])]
@@ -1,19 +1,82 @@
+import asyncio
 import hashlib
+import heapq
+import json
 import ssl
+import sys
+import threading
+import time
 import urllib.parse
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import redis
+import redis.asyncio
 from redis import Redis
-
-from config import REDIS_CHANNEL_MESSAGES_KEY, REDIS_MAX_MESSAGES, REDIS_NEWS_EXPIRE_SECONDS, REDIS_URL
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import ExponentialBackoff
+from redis.commands.core import BitFieldOperation
+from redis.retry import Retry
+
+from config import (
+    FALLBACK_CACHE_MAX_ENTRIES,
+    FALLBACK_CACHE_MAX_LIST_LENGTH,
+    HTTP_VALIDATOR_EXPIRE_SECONDS,
+    LOCAL_SEEN_CACHE_SIZE,
+    LOCAL_SEEN_CACHE_TTL,
+    NEWS_BLOOM_CAPACITY,
+    NEWS_BLOOM_ERROR_RATE,
+    NEWS_DEDUP_MODE,
+    REDIS_CHANNEL_MESSAGES_KEY,
+    REDIS_HEALTH_CHECK_INTERVAL,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_MAX_MESSAGES,
+    REDIS_NEWS_EXPIRE_SECONDS,
+    REDIS_RETRIES,
+    REDIS_SOCKET_TIMEOUT,
+    REDIS_URL,
+)
+from utils.bloom import BloomDedupBatch, BloomFilter
+from utils.local_cache import LocalCache
 from utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Errors after which a command is retried on a fresh connection
+RETRY_ON_ERRORS = [redis.exceptions.ConnectionError, redis.exceptions.TimeoutError]
+
 # Singleton Redis client
 _redis_client: Optional[Redis] = None
 
+# Singleton asyncio Redis client, used from the event loop
+_async_redis_client: Optional[Union[redis.asyncio.Redis, "AsyncFallbackCache"]] = None
+_async_redis_lock: Optional[asyncio.Lock] = None
+
+# In-memory cache used in place of Redis when it is unavailable
+_fallback_cache: Optional["FallbackCache"] = None
+
+# Bloom filter geometry of the "bloom" NEWS_DEDUP_MODE
+_news_bloom = BloomFilter(NEWS_BLOOM_CAPACITY, NEWS_BLOOM_ERROR_RATE)
+
+# In-process L1 tier of news item and article URL keys known to be in Redis (L2)
+_seen_cache = LocalCache(LOCAL_SEEN_CACHE_SIZE, LOCAL_SEEN_CACHE_TTL)
+
+
+def _client_options() -> Dict[str, Any]:
+    """Connection pool, timeout and health check options shared by the sync and asyncio clients"""
+    options = {
+        "max_connections": REDIS_MAX_CONNECTIONS,
+        "socket_timeout": REDIS_SOCKET_TIMEOUT,
+        "socket_connect_timeout": REDIS_SOCKET_TIMEOUT,
+        "socket_keepalive": True,
+        "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+        "retry_on_error": RETRY_ON_ERRORS,
+    }
+    if urllib.parse.urlparse(REDIS_URL).scheme == "rediss":
+        # Connect to Redis with SSL without certificate verification
+        options["ssl_cert_reqs"] = ssl.CERT_NONE
+    return options
+
 
 def get_redis_client() -> Redis:
     """
@@ -27,20 +90,17 @@ def get_redis_client() -> Redis:
     """
     global _redis_client
     if _redis_client is None:
-        parsed_url = urllib.parse.urlparse(REDIS_URL)
         try:
-            if parsed_url.scheme == "rediss":
-                # Connect to Redis with SSL without certificate verification
-                _redis_client = redis.Redis.from_url(REDIS_URL, ssl_cert_reqs=ssl.CERT_NONE)
-            else:
-                _redis_client = redis.Redis.from_url(REDIS_URL)
+            _redis_client = redis.Redis.from_url(
+                REDIS_URL, retry=Retry(ExponentialBackoff(), REDIS_RETRIES), **_client_options()
+            )
             # Test connection
             _redis_client.ping()
             logger.info("Connected to Redis server")
-        except redis.exceptions.ConnectionError as e:
+        except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError) as e:
             logger.error(f"Redis connection error: {e}")
             # Fallback to in-memory implementation if Redis is unavailable
-            _redis_client = FallbackCache()
+            _redis_client = get_fallback_cache()
             logger.warning("Redis connection failed. Using in-memory cache as fallback")
     return _redis_client
 
@@ -51,41 +111,408 @@ class FallbackCache:
 
     Implements the necessary Redis methods used by the application
     to provide graceful degradation when Redis is not accessible.
+
+    Like Redis, keys set with an expiration time disappear once it passes:
+    expiry times are kept in a min-heap and expired keys are purged on every
+    write, so an outage of any length holds about one expiry period of keys.
+    Beyond max_entries keys the least recently used ones are evicted, and lists
+    keep only their last max_list_length values.
+
+    Scraper threads and the event loop share one instance, so every method runs
+    under a lock, and a pipeline runs all its commands under it.
     """
 
-    def __init__(self):
-        self.cache = {}
-        self.lists = {}
+    def __init__(
+        self,
+        max_entries: int = FALLBACK_CACHE_MAX_ENTRIES,
+        max_list_length: int = FALLBACK_CACHE_MAX_LIST_LENGTH,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_list_length = max_list_length
+        self._clock = clock
+        self._lock = threading.RLock()
+        self.cache: "OrderedDict[str, Any]" = OrderedDict()
+        self.lists: Dict[str, List] = {}
+        # Expiry time of each key with one, and a heap of (expiry time, key) with stale entries left in place
+        self._expires: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self.expired = 0
+        self.evicted = 0
+
+    def _live(self, key: str) -> bool:
+        """Whether a key exists, deleting it if it has expired"""
+        if key not in self.cache:
+            return False
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= self._clock():
+            self._delete(key)
+            self.expired += 1
+            return False
+        self.cache.move_to_end(key)
+        return True
+
+    def _delete(self, key: str) -> None:
+        self.cache.pop(key, None)
+        self._expires.pop(key, None)
+
+    def _set_expiry(self, key: str, seconds: Optional[float]) -> None:
+        if seconds is None:
+            self._expires.pop(key, None)
+            return
+        expires_at = self._clock() + seconds
+        self._expires[key] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        if len(self._expiry_heap) > 2 * len(self._expires) + 64:
+            # Drop the entries of keys whose expiry was changed or removed since
+            self._expiry_heap = [(when, key) for key, when in self._expires.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _store(self, key: str, value: Any, seconds: Optional[float] = None) -> None:
+        """Write a key, purging expired keys and evicting beyond max_entries"""
+        self.purge_expired()
+        self.cache[key] = value
+        self.cache.move_to_end(key)
+        self._set_expiry(key, seconds)
+        while len(self.cache) > self.max_entries:
+            oldest = next(iter(self.cache))
+            self._delete(oldest)
+            self.evicted += 1
+
+    def _container(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Value of a key holding a mutable value (bitmap or hash), created if missing"""
+        if not self._live(key):
+            self._store(key, factory())
+        return self.cache[key]
+
+    def purge_expired(self) -> int:
+        """
+        Delete all keys whose expiration time has passed.
+
+        Returns:
+            Number of keys deleted
+        """
+        with self._lock:
+            now = self._clock()
+            purged = 0
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires_at, key = heapq.heappop(self._expiry_heap)
+                if self._expires.get(key) == expires_at:
+                    self._delete(key)
+                    purged += 1
+            self.expired += purged
+            return purged
 
     def exists(self, key: str) -> bool:
         """Check if a key exists in the cache"""
-        return key in self.cache
+        with self._lock:
+            return self._live(key)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get the value of a key (None if it doesn't exist)"""
+        with self._lock:
+            return self.cache[key] if self._live(key) else None
 
     def setex(self, key: str, time: int, value: Any) -> None:
-        """Set a key with an expiration time (time is ignored in this implementation)"""
-        self.cache[key] = value
+        """Set a key with an expiration time in seconds"""
+        with self._lock:
+            self._store(key, value, time)
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        """Set a key, expiring after ex seconds if given and only if it does not exist when nx is True"""
+        with self._lock:
+            if nx and self._live(key):
+                return None
+            self._store(key, value, ex)
+            return True
+
+    def getbit(self, key: str, offset: int) -> int:
+        """Get a bit of a bitmap"""
+        with self._lock:
+            bitmap = self.cache[key] if self._live(key) else bytearray()
+            byte, bit = divmod(offset, 8)
+            return (bitmap[byte] >> (7 - bit)) & 1 if byte < len(bitmap) else 0
+
+    def setbit(self, key: str, offset: int, value: int) -> int:
+        """Set a bit of a bitmap, returning its previous value"""
+        with self._lock:
+            bitmap = self._container(key, bytearray)
+            byte, bit = divmod(offset, 8)
+            if byte >= len(bitmap):
+                bitmap.extend(bytes(byte + 1 - len(bitmap)))
+            previous = (bitmap[byte] >> (7 - bit)) & 1
+            if value:
+                bitmap[byte] |= 1 << (7 - bit)
+            else:
+                bitmap[byte] &= ~(1 << (7 - bit)) & 0xFF
+            return previous
+
+    def bitfield(self, key: str) -> BitFieldOperation:
+        """Build a BITFIELD command; only single-bit (u1) GET and SET operations are supported"""
+        return BitFieldOperation(self, key)
+
+    def execute_command(self, *args) -> Any:
+        """Run a raw command; only BITFIELD (sent by BitFieldOperation.execute) is supported"""
+        command, key, *operations = args
+        if command != "BITFIELD":
+            raise ValueError(f"Unsupported command: {command}")
+        results = []
+        with self._lock:
+            while operations:
+                operation, encoding, offset = operations[:3]
+                if encoding != "u1":
+                    raise ValueError(f"Unsupported BITFIELD encoding: {encoding}")
+                if operation == "GET":
+                    results.append(self.getbit(key, offset))
+                    operations = operations[3:]
+                elif operation == "SET":
+                    results.append(self.setbit(key, offset, operations[3]))
+                    operations = operations[4:]
+                else:
+                    raise ValueError(f"Unsupported BITFIELD operation: {operation}")
+        return results
+
+    def hset(self, key: str, field: str, value: Any) -> int:
+        """Set a hash field, returning 1 if it was added"""
+        with self._lock:
+            fields = self._container(key, dict)
+            added = int(field not in fields)
+            fields[field] = value
+            return added
+
+    def expire(self, key: str, time: int) -> bool:
+        """Set a key's expiration time in seconds, returning False if it does not exist"""
+        with self._lock:
+            if not self._live(key):
+                return False
+            self._set_expiry(key, time)
+            return True
+
+    def pipeline(self, transaction: bool = True) -> "FallbackPipeline":
+        """Queue commands to run together, like a Redis pipeline"""
+        return FallbackPipeline(self)
 
     def rpush(self, key: str, value: Any) -> None:
-        """Append a value to a list"""
-        if key not in self.lists:
-            self.lists[key] = []
-        self.lists[key].append(value)
+        """Append a value to a list, dropping its oldest values beyond max_list_length"""
+        with self._lock:
+            if key not in self.lists:
+                self.lists[key] = []
+            values = self.lists[key]
+            values.append(value)
+            if len(values) > self.max_list_length:
+                del values[: len(values) - self.max_list_length]
 
     def ltrim(self, key: str, start: int, end: int) -> None:
         """Trim a list to the specified range"""
-        if key in self.lists:
-            self.lists[key] = self.lists[key][start : end + 1 if end >= 0 else None]
+        with self._lock:
+            if key in self.lists:
+                self.lists[key] = self.lists[key][start : end + 1 if end >= 0 else None]
 
     def lrange(self, key: str, start: int, end: int) -> List:
         """Return a range of elements from a list"""
-        if key not in self.lists:
-            return []
-        return self.lists[key][start : end + 1 if end >= 0 else None]
+        with self._lock:
+            if key not in self.lists:
+                return []
+            return self.lists[key][start : end + 1 if end >= 0 else None]
 
     def ping(self) -> bool:
         """Test connection (always returns True for in-memory implementation)"""
         return True
 
+    def flushall(self) -> int:
+        """
+        Delete all keys and lists.
+
+        Returns:
+            Number of keys and lists deleted
+        """
+        with self._lock:
+            count = len(self.cache) + len(self.lists)
+            self.cache.clear()
+            self.lists.clear()
+            self._expires.clear()
+            self._expiry_heap = []
+            return count
+
+    def memory_usage(self) -> int:
+        """Approximate memory held by keys, values, lists and expiry bookkeeping, in bytes"""
+        with self._lock:
+            size = sys.getsizeof(self.cache) + sys.getsizeof(self.lists) + sys.getsizeof(self._expires)
+            size += sys.getsizeof(self._expiry_heap) + len(self._expiry_heap) * 64
+            for key, value in self.cache.items():
+                size += sys.getsizeof(key) + sys.getsizeof(value)
+                if isinstance(value, dict):
+                    size += sum(sys.getsizeof(field) + sys.getsizeof(item) for field, item in value.items())
+            for key, values in self.lists.items():
+                size += sys.getsizeof(key) + sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+            return size
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Current size for monitoring.
+
+        Returns:
+            Dictionary with keys, expiring_keys, lists, list_values, expired, evicted and memory_bytes
+        """
+        with self._lock:
+            self.purge_expired()
+            return {
+                "keys": len(self.cache),
+                "expiring_keys": len(self._expires),
+                "lists": len(self.lists),
+                "list_values": sum(len(values) for values in self.lists.values()),
+                "expired": self.expired,
+                "evicted": self.evicted,
+                "memory_bytes": self.memory_usage(),
+            }
+
+
+class FallbackPipeline:
+    """Command queue of FallbackCache mirroring the redis-py pipeline interface"""
+
+    def __init__(self, cache: FallbackCache):
+        self._cache = cache
+        self._commands: List = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._cache, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def bitfield(self, key: str) -> BitFieldOperation:
+        """Build a BITFIELD command queued on this pipeline by its execute()"""
+        return BitFieldOperation(self, key)
+
+    def execute_command(self, *args) -> "FallbackPipeline":
+        """Queue a raw command (see FallbackCache.execute_command)"""
+        self._commands.append((self._cache.execute_command, args, {}))
+        return self
+
+    def execute(self) -> List:
+        """Run the queued commands and return their results in order"""
+        commands, self._commands = self._commands, []
+        with self._cache._lock:
+            return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._commands = []
+
+
+async def get_async_redis_client() -> Union[redis.asyncio.Redis, "AsyncFallbackCache"]:
+    """
+    Get the asyncio Redis client using singleton pattern.
+
+    Coroutines use this client so Redis round trips never block the event loop.
+    Its connection pool pings connections idle for longer than
+    REDIS_HEALTH_CHECK_INTERVAL before reusing them, and commands failing with a
+    connection error are retried on a new connection with exponential backoff.
+
+    Returns:
+        asyncio Redis client instance (or AsyncFallbackCache if Redis is unavailable)
+    """
+    global _async_redis_client, _async_redis_lock
+    if _async_redis_client is not None:
+        return _async_redis_client
+    if _async_redis_lock is None:
+        _async_redis_lock = asyncio.Lock()
+    async with _async_redis_lock:
+        if _async_redis_client is None:
+            if isinstance(_redis_client, FallbackCache):
+                # Share the in-memory data of the sync fallback
+                _async_redis_client = AsyncFallbackCache(_redis_client)
+                return _async_redis_client
+            client = redis.asyncio.Redis.from_url(
+                REDIS_URL, retry=AsyncRetry(ExponentialBackoff(), REDIS_RETRIES), **_client_options()
+            )
+            try:
+                await client.ping()
+                _async_redis_client = client
+                logger.info("Connected to Redis server (asyncio)")
+            except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError) as e:
+                logger.error(f"Redis connection error: {e}")
+                await client.aclose()
+                _async_redis_client = AsyncFallbackCache(get_fallback_cache())
+                logger.warning("Redis connection failed. Using in-memory cache as fallback")
+    return _async_redis_client
+
+
+async def close_async_redis_client() -> None:
+    """
+    Close the asyncio Redis client and its connection pool.
+
+    This should be called when shutting down the application to
+    properly clean up resources.
+    """
+    global _async_redis_client
+    if _async_redis_client is not None:
+        await _async_redis_client.aclose()
+        _async_redis_client = None
+
+
+def get_fallback_cache() -> "FallbackCache":
+    """In-memory cache shared by the sync and asyncio clients when Redis is unavailable"""
+    global _fallback_cache
+    if _fallback_cache is None:
+        _fallback_cache = FallbackCache()
+    return _fallback_cache
+
+
+class AsyncFallbackCache:
+    """Awaitable view of a FallbackCache with the redis.asyncio client interface"""
+
+    def __init__(self, cache: FallbackCache):
+        self.cache = cache
+
+    def __getattr__(self, name: str):
+        method = getattr(self.cache, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
+
+    def bitfield(self, key: str) -> BitFieldOperation:
+        """Build a BITFIELD command whose execute() is awaitable"""
+        return BitFieldOperation(self, key)
+
+    def pipeline(self, transaction: bool = True) -> "AsyncFallbackPipeline":
+        """Queue commands to run together, like a redis.asyncio pipeline"""
+        return AsyncFallbackPipeline(self.cache.pipeline(transaction))
+
+    async def aclose(self) -> None:
+        """Close the client (nothing to release for the in-memory implementation)"""
+
+
+class AsyncFallbackPipeline:
+    """Pipeline of AsyncFallbackCache: commands are queued synchronously and executed with await"""
+
+    def __init__(self, pipeline: "FallbackPipeline"):
+        self._pipeline = pipeline
+
+    def __getattr__(self, name: str):
+        queue = getattr(self._pipeline, name)
+
+        def call(*args, **kwargs):
+            queue(*args, **kwargs)
+            return self
+
+        return call
+
+    def bitfield(self, key: str) -> BitFieldOperation:
+        """Build a BITFIELD command queued on this pipeline by its execute()"""
+        return BitFieldOperation(self._pipeline, key)
+
+    async def execute(self) -> List:
+        """Run the queued commands and return their results in order"""
+        return self._pipeline.execute()
+
 
 def generate_news_hash(news_item: Dict[str, Any]) -> str:
     """
@@ -101,6 +528,16 @@ def generate_news_hash(news_item: Dict[str, Any]) -> str:
     return hashlib.sha256(unique_str.encode("utf-8")).hexdigest()
 
 
+def _news_key(news_item: Dict[str, Any]) -> str:
+    """Redis key marking a news item as processed"""
+    return f"news:{generate_news_hash(news_item)}"
+
+
+def _bloom_batch(news_items: List[Dict[str, Any]], expire_seconds: int) -> BloomDedupBatch:
+    """Bloom filter dedup state of a batch of news items"""
+    return BloomDedupBatch(news_items, [generate_news_hash(item) for item in news_items], _news_bloom, expire_seconds)
+
+
 def is_duplicate(news_item: Dict[str, Any], expire_seconds: int = REDIS_NEWS_EXPIRE_SECONDS) -> bool:
     """
     Check if a news item has been processed before.
@@ -112,12 +549,245 @@ def is_duplicate(news_item: Dict[str, Any], expire_seconds: int = REDIS_NEWS_EXP
     Returns:
         True if the news item is a duplicate, False otherwise
     """
+    return not filter_new_items([news_item], expire_seconds)
+
+
+def _unseen_locally(news_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Items whose keys the in-process seen cache does not know, which need a Redis lookup"""
+    known = _seen_cache.contains_many(_news_key(news_item) for news_item in news_items)
+    return [news_item for news_item, seen in zip(news_items, known) if not seen]
+
+
+def filter_new_items(
+    news_items: List[Dict[str, Any]], expire_seconds: int = REDIS_NEWS_EXPIRE_SECONDS
+) -> List[Dict[str, Any]]:
+    """
+    Return the news items that have not been processed before, marking them as processed.
+
+    Items found in the in-process seen cache are duplicates without asking Redis.
+    For the others one SET NX EX per item is sent in a single pipeline, so a whole
+    chunk of items costs at most one Redis round trip. Items repeated within the
+    chunk are kept once. With NEWS_DEDUP_MODE "bloom" the items are checked
+    against daily rotating Bloom filters instead (two round trips: a BITFIELD
+    lookup, then a SET NX EX per Bloom positive plus a BITFIELD and an EXPIRE
+    for each of the two buckets; see utils.bloom.BloomDedupBatch).
+
+    Args:
+        news_items: Dictionaries containing the news data
+        expire_seconds: Time in seconds before a news item is considered new again
+
+    Returns:
+        New items, in input order
+    """
+    news_items = _unseen_locally(news_items)
+    if not news_items:
+        return []
     redis_client = get_redis_client()
-    key = f"news:{generate_news_hash(news_item)}"
-    if redis_client.exists(key):
-        return True
-    redis_client.setex(key, expire_seconds, 1)
-    return False
+    if NEWS_DEDUP_MODE == "bloom":
+        batch = _bloom_batch(news_items, expire_seconds)
+        pipeline = redis_client.pipeline(transaction=False)
+        batch.queue_lookup(pipeline)
+        batch.read_lookup(pipeline.execute())
+        pipeline = redis_client.pipeline(transaction=False)
+        batch.queue_update(pipeline)
+        new_items = batch.read_update(pipeline.execute())
+    else:
+        pipeline = redis_client.pipeline(transaction=False)
+        for news_item in news_items:
+            pipeline.set(_news_key(news_item), 1, ex=expire_seconds, nx=True)
+        results = pipeline.execute()
+        new_items = [news_item for news_item, is_new in zip(news_items, results) if is_new]
+    # Every looked up item is now marked in Redis, whether it was new or not
+    _seen_cache.add_many((_news_key(news_item) for news_item in news_items), expire_seconds)
+    return new_items
+
+
+async def filter_new_items_async(
+    news_items: List[Dict[str, Any]], expire_seconds: int = REDIS_NEWS_EXPIRE_SECONDS
+) -> List[Dict[str, Any]]:
+    """
+    Asynchronous filter_new_items() for coroutines, using the asyncio Redis client.
+
+    Args:
+        news_items: Dictionaries containing the news data
+        expire_seconds: Time in seconds before a news item is considered new again
+
+    Returns:
+        New items, in input order
+    """
+    news_items = _unseen_locally(news_items)
+    if not news_items:
+        return []
+    redis_client = await get_async_redis_client()
+    if NEWS_DEDUP_MODE == "bloom":
+        batch = _bloom_batch(news_items, expire_seconds)
+        pipeline = redis_client.pipeline(transaction=False)
+        batch.queue_lookup(pipeline)
+        batch.read_lookup(await pipeline.execute())
+        pipeline = redis_client.pipeline(transaction=False)
+        batch.queue_update(pipeline)
+        new_items = batch.read_update(await pipeline.execute())
+    else:
+        pipeline = redis_client.pipeline(transaction=False)
+        for news_item in news_items:
+            pipeline.set(_news_key(news_item), 1, ex=expire_seconds, nx=True)
+        results = await pipeline.execute()
+        new_items = [news_item for news_item, is_new in zip(news_items, results) if is_new]
+    _seen_cache.add_many((_news_key(news_item) for news_item in news_items), expire_seconds)
+    return new_items
+
+
+def _seen_url_key(url: str) -> str:
+    """Redis key marking an article URL as already collected"""
+    return f"seen_url:{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
+
+
+def filter_unseen_urls(urls: List[str]) -> List[str]:
+    """
+    Return the URLs that have not been collected before.
+
+    Scrapers call this after parsing a listing page so that detail pages of
+    known articles are never downloaded again. URLs in the in-process seen
+    cache are answered without asking Redis.
+
+    Args:
+        urls: Article URLs found on a listing page
+
+    Returns:
+        URLs not marked as seen, in input order
+    """
+    keys = [_seen_url_key(url) for url in urls]
+    known = _seen_cache.contains_many(keys)
+    lookups = [(url, key) for url, key, seen in zip(urls, keys, known) if not seen]
+    if not lookups:
+        return []
+    pipeline = get_redis_client().pipeline(transaction=False)
+    for _, key in lookups:
+        pipeline.exists(key)
+    results = pipeline.execute()
+    _seen_cache.add_many(key for (_, key), seen in zip(lookups, results) if seen)
+    return [url for (url, _), seen in zip(lookups, results) if not seen]
+
+
+def mark_urls_seen(urls: List[str], expire_seconds: int = REDIS_NEWS_EXPIRE_SECONDS) -> None:
+    """
+    Mark article URLs as collected.
+
+    Args:
+        urls: Article URLs whose detail pages have been fetched
+        expire_seconds: Time in seconds before a URL is considered new again
+    """
+    if not urls:
+        return
+    keys = [_seen_url_key(url) for url in urls]
+    pipeline = get_redis_client().pipeline(transaction=False)
+    for key in keys:
+        pipeline.setex(key, expire_seconds, 1)
+    pipeline.execute()
+    _seen_cache.add_many(keys, expire_seconds)
+
+
+def get_seen_cache() -> LocalCache:
+    """Get the in-process seen cache in front of Redis"""
+    return _seen_cache
+
+
+def get_cache_stats(reset: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Get cache statistics for monitoring.
+
+    Args:
+        reset: Start counting from zero afterwards (e.g. once per collection cycle)
+
+    Returns:
+        Dictionary with the "seen_l1" entries, hits, misses, evictions and hit rate,
+        and the "fallback" cache size and memory while Redis is unavailable
+    """
+    stats = {"seen_l1": _seen_cache.snapshot(reset)}
+    if _fallback_cache is not None:
+        stats["fallback"] = _fallback_cache.stats()
+    return stats
+
+
+def log_cache_stats() -> None:
+    """Log the cache statistics since the last call, then reset the counters"""
+    stats = get_cache_stats(reset=True)
+    logger.info(f"Seen cache: {stats['seen_l1']}")
+    if "fallback" in stats:
+        logger.warning(f"Redis unavailable, in-memory fallback cache: {stats['fallback']}")
+
+
+def get_high_water_mark(source: str, keyword: str) -> Optional[str]:
+    """
+    Get the newest listing URL recorded for a source and keyword.
+
+    Args:
+        source: Source name
+        keyword: Search keyword
+
+    Returns:
+        URL of the newest item seen on the source's listing, or None if unknown
+    """
+    redis_client = get_redis_client()
+    value = redis_client.get(f"hwm:{source}:{keyword}")
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+    return value or None
+
+
+def set_high_water_mark(
+    source: str, keyword: str, url: str, expire_seconds: int = HTTP_VALIDATOR_EXPIRE_SECONDS
+) -> None:
+    """
+    Record the newest listing URL for a source and keyword.
+
+    Args:
+        source: Source name
+        keyword: Search keyword
+        url: URL of the newest item on the listing
+        expire_seconds: Time in seconds before the mark is forgotten
+    """
+    redis_client = get_redis_client()
+    redis_client.setex(f"hwm:{source}:{keyword}", expire_seconds, url)
+
+
+def _http_validators_key(url: str) -> str:
+    """Redis key holding the HTTP cache validators of a URL"""
+    return f"http:validators:{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
+
+
+def get_http_validators(url: str) -> Dict[str, str]:
+    """
+    Get the HTTP cache validators stored for a URL.
+
+    Args:
+        url: URL of a previously fetched page
+
+    Returns:
+        Dictionary with optional "etag" and "last_modified" entries
+    """
+    redis_client = get_redis_client()
+    raw = redis_client.get(_http_validators_key(url))
+    if not raw:
+        return {}
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    return json.loads(raw)
+
+
+def store_http_validators(
+    url: str, validators: Dict[str, str], expire_seconds: int = HTTP_VALIDATOR_EXPIRE_SECONDS
+) -> None:
+    """
+    Store the HTTP cache validators (ETag / Last-Modified) returned for a URL.
+
+    Args:
+        url: URL of the fetched page
+        validators: Dictionary with optional "etag" and "last_modified" entries
+        expire_seconds: Time in seconds before the validators are forgotten
+    """
+    redis_client = get_redis_client()
+    redis_client.setex(_http_validators_key(url), expire_seconds, json.dumps(validators))
 
 
 def store_channel_message(message: str) -> None:
@@ -136,6 +806,20 @@ def store_channel_message(message: str) -> None:
     redis_client.ltrim(REDIS_CHANNEL_MESSAGES_KEY, -REDIS_MAX_MESSAGES, -1)
 
 
+async def store_channel_message_async(message: str) -> None:
+    """
+    Asynchronous store_channel_message() for coroutines, using the asyncio Redis client.
+
+    Args:
+        message: The message content to store
+    """
+    redis_client = await get_async_redis_client()
+    pipeline = redis_client.pipeline(transaction=False)
+    pipeline.rpush(REDIS_CHANNEL_MESSAGES_KEY, message)
+    pipeline.ltrim(REDIS_CHANNEL_MESSAGES_KEY, -REDIS_MAX_MESSAGES, -1)
+    await pipeline.execute()
+
+
 def get_channel_messages() -> List[str]:
     """
     Retrieve all stored channel messages from Redis.
@@ -148,6 +832,18 @@ def get_channel_messages() -> List[str]:
     return [msg.decode("utf-8") if isinstance(msg, bytes) else msg for msg in messages]
 
 
+async def get_channel_messages_async() -> List[str]:
+    """
+    Asynchronous get_channel_messages() for coroutines, using the asyncio Redis client.
+
+    Returns:
+        List of previously sent messages
+    """
+    redis_client = await get_async_redis_client()
+    messages = await redis_client.lrange(REDIS_CHANNEL_MESSAGES_KEY, 0, -1)
+    return [msg.decode("utf-8") if isinstance(msg, bytes) else msg for msg in messages]
+
+
 def clear_cache(pattern: str = "*") -> int:
     """
     Clear all cache entries matching the specified pattern.
@@ -162,10 +858,7 @@ def clear_cache(pattern: str = "*") -> int:
     if isinstance(redis_client, FallbackCache):
         # Handle in-memory implementation
         if pattern == "*":
-            count = len(redis_client.cache) + len(redis_client.lists)
-            redis_client.cache = {}
-            redis_client.lists = {}
-            return count
+            return redis_client.flushall()
         return 0
 
     # Handle Redis implementation
@@ -0,0 +1,149 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import DNS_CACHE_TTL
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+# (family, address) pairs as returned by getaddrinfo
+Addresses = List[Tuple[int, str]]
+
+
+def interleave_families(addresses: Addresses) -> Addresses:
+    """
+    Order addresses for happy eyeballs, alternating between IPv6 and IPv4.
+
+    The family of the first resolved address goes first (RFC 8305 section 4),
+    so a connection attempt to the other family starts after a short delay
+    instead of only after every address of the first family has timed out.
+
+    Args:
+        addresses: Resolved (family, address) pairs in resolver order
+
+    Returns:
+        Reordered (family, address) pairs
+    """
+    if not addresses:
+        return []
+    first_family = addresses[0][0]
+    first = [entry for entry in addresses if entry[0] == first_family]
+    other = [entry for entry in addresses if entry[0] != first_family]
+    ordered = []
+    for i in range(max(len(first), len(other))):
+        ordered.extend(group[i] for group in (first, other) if i < len(group))
+    return ordered
+
+
+class DnsCache:
+    """
+    Thread-safe DNS cache shared by all pycurl handles of the scraper client.
+
+    Resolved addresses are reused for `ttl` seconds. When a refresh fails the
+    expired addresses are served instead of failing the request, since news
+    sites rarely move and a resolver hiccup should not drop a collection cycle.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DNS_CACHE_TTL,
+        resolver: Callable[..., list] = socket.getaddrinfo,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self._resolver = resolver
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, int], Tuple[float, Addresses]] = {}
+
+    def lookup(self, host: str, port: int) -> Optional[Addresses]:
+        """Cached addresses of a host that have not expired, without resolving"""
+        with self._lock:
+            entry = self._entries.get((host, port))
+        if entry and entry[0] > self._clock():
+            return entry[1]
+        return None
+
+    def resolve(self, host: str, port: int) -> Addresses:
+        """
+        Resolve a host, using the cache while its entry is fresh.
+
+        Args:
+            host: Host name
+            port: TCP port
+
+        Returns:
+            (family, address) pairs ordered for happy eyeballs
+
+        Raises:
+            socket.gaierror: If resolution fails and nothing was cached before
+        """
+        addresses = self.lookup(host, port)
+        if addresses is not None:
+            return addresses
+        try:
+            infos = self._resolver(host, port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            with self._lock:
+                stale = self._entries.get((host, port))
+            if stale:
+                logger.warning(f"DNS refresh for {host} failed, using cached addresses: {e}")
+                return stale[1]
+            raise
+        addresses = []
+        for family, _, _, _, sockaddr in infos:
+            if family in (socket.AF_INET, socket.AF_INET6) and (family, sockaddr[0]) not in addresses:
+                addresses.append((family, sockaddr[0]))
+        addresses = interleave_families(addresses)
+        with self._lock:
+            self._entries[(host, port)] = (self._clock() + self.ttl, addresses)
+        return addresses
+
+    def preresolve(self, hosts: Iterable[Tuple[str, int]], max_workers: int = 8) -> int:
+        """
+        Resolve hosts concurrently so the first requests find them cached.
+
+        Args:
+            hosts: (host, port) pairs
+            max_workers: Number of concurrent lookups
+
+        Returns:
+            Number of hosts resolved
+        """
+        hosts = list(dict.fromkeys(hosts))
+
+        def resolve(host_port):
+            try:
+                self.resolve(*host_port)
+                return True
+            except OSError as e:
+                logger.warning(f"DNS preresolution of {host_port[0]} failed: {e}")
+                return False
+
+        if not hosts:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(hosts)), thread_name_prefix="dns") as executor:
+            return sum(executor.map(resolve, hosts))
+
+
+# Singleton DNS cache shared by all HTTP clients
+_dns_cache: Optional[DnsCache] = None
+_dns_cache_lock = threading.Lock()
+
+
+def get_dns_cache() -> DnsCache:
+    """
+    Get or create the shared DNS cache.
+
+    Returns:
+        Shared DnsCache instance
+    """
+    global _dns_cache
+    if _dns_cache is None:
+        with _dns_cache_lock:
+            if _dns_cache is None:
+                _dns_cache = DnsCache()
+    return _dns_cache
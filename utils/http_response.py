@@ -0,0 +1,168 @@
+import codecs
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import cached_property
+from typing import Dict, Optional, Union
+
+# Charset declared in a <meta charset=...> or <meta http-equiv="Content-Type" content="...; charset=..."> tag
+META_CHARSET = re.compile(rb"""<meta[^>]+?charset\s*=\s*["']?\s*([\w:.-]+)""", re.IGNORECASE)
+
+# Bytes at the start of a page searched for a <meta> charset declaration
+META_SCAN_BYTES = 4096
+
+# Korean portals label CP949 pages as EUC-KR; CP949 is a superset that also decodes the extended Hangul syllables
+CHARSET_ALIASES = {"euc_kr": "cp949", "windows-949": "cp949", "x-windows-949": "cp949"}
+
+
+def normalize_charset(label: Optional[str]) -> Optional[str]:
+    """
+    Map a declared charset label to a Python codec name.
+
+    Args:
+        label: Charset label from a header or meta tag (e.g. "EUC-KR")
+
+    Returns:
+        Codec name, or None if the label is empty or unknown
+    """
+    if not label:
+        return None
+    label = label.strip().strip("\"'").lower()
+    if label in CHARSET_ALIASES:
+        return CHARSET_ALIASES[label]
+    try:
+        name = codecs.lookup(label).name
+    except LookupError:
+        return None
+    return CHARSET_ALIASES.get(name, name)
+
+
+def detect_charset(headers: Dict[str, str], body: bytes) -> str:
+    """
+    Determine the character encoding of a response body.
+
+    The Content-Type header takes precedence, then a byte order mark, then a
+    <meta> declaration near the start of the page. Undeclared pages are UTF-8.
+
+    Args:
+        headers: Response headers (lower-cased names)
+        body: Raw response body
+
+    Returns:
+        Python codec name
+    """
+    for param in headers.get("content-type", "").split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            charset = normalize_charset(value)
+            if charset:
+                return charset
+    if body.startswith(codecs.BOM_UTF8):
+        return "utf-8"
+    match = META_CHARSET.search(body, 0, META_SCAN_BYTES)
+    if match:
+        charset = normalize_charset(match.group(1).decode("ascii", errors="ignore"))
+        if charset:
+            return charset
+    return "utf-8"
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP-date.
+
+    Args:
+        value: Header value
+        now: Current time for HTTP-date values (defaults to the current UTC time)
+
+    Returns:
+        Seconds to wait (0 for a date in the past), or None if absent or malformed
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class Response:
+    """
+    Result of one HTTP GET request made by the pycurl scraper client.
+
+    Holds the raw body bytes together with the status code, response headers
+    (lower-cased names), the requested and final URL, the elapsed time, the number
+    of body bytes received on the wire (smaller than the body when it was
+    compressed) and, for failed requests, the error. A request that failed in
+    transport has status 0 and an empty body.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        elapsed: float,
+        wire_size: Optional[int] = None,
+        requested_url: Optional[str] = None,
+        error: Optional[str] = None,
+    ):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.elapsed = elapsed
+        self.wire_size = len(body) if wire_size is None else wire_size
+        self.requested_url = requested_url or url
+        self.error = error
+
+    @classmethod
+    def failed(cls, url: str, error: Exception, elapsed: float = 0.0) -> "Response":
+        """Result of a request that raised before a response arrived"""
+        return cls(url, 0, {}, b"", elapsed, error=str(error) or error.__class__.__name__)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request completed without error and with a status below 400"""
+        return self.error is None and 0 < self.status < 400
+
+    def retry_after(self, now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Delay requested by the Retry-After header.
+
+        Args:
+            now: Current time for HTTP-date values (defaults to the current UTC time)
+
+        Returns:
+            Seconds to wait (0 for a date in the past), or None if absent or malformed
+        """
+        return parse_retry_after(self.headers.get("retry-after"), now)
+
+    @cached_property
+    def encoding(self) -> str:
+        """Character encoding of the body, from the headers or the page's <meta> tag"""
+        return detect_charset(self.headers, self.body)
+
+    @cached_property
+    def text(self) -> str:
+        """Response body decoded once with its detected encoding"""
+        return self.body.decode(self.encoding, errors="replace")
+
+    @property
+    def markup(self) -> Union[str, bytes]:
+        """
+        Body in the form parsers take it with the least copying.
+
+        UTF-8 bodies are returned as the raw bytes, which the parser backends read
+        directly; other encodings are decoded to text first.
+        """
+        if self.encoding == "utf-8":
+            return self.body
+        return self.text
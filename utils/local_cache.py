@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class LocalCache:
+    """
+    Thread-safe in-process LRU set of keys with a per-key expiry.
+
+    Holds at most `max_entries` keys; adding one more evicts the least recently
+    used. Used as the L1 tier in front of Redis for keys known to exist there
+    (seen news items and article URLs), so it only ever answers "seen" and a
+    miss falls through to Redis.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def contains_many(self, keys: Iterable[str]) -> List[bool]:
+        """
+        Check which keys are cached, refreshing their recency.
+
+        Args:
+            keys: Keys to look up
+
+        Returns:
+            True for each key that is cached and not expired, in input order
+        """
+        now = self._clock()
+        found = []
+        with self._lock:
+            for key in keys:
+                expires_at = self._entries.get(key)
+                if expires_at is not None and expires_at <= now:
+                    del self._entries[key]
+                    expires_at = None
+                if expires_at is None:
+                    self.misses += 1
+                    found.append(False)
+                else:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    found.append(True)
+        return found
+
+    def add_many(self, keys: Iterable[str], ttl: Optional[float] = None) -> None:
+        """
+        Cache keys, evicting the least recently used ones beyond max_entries.
+
+        Args:
+            keys: Keys to cache
+            ttl: Seconds to keep them (capped at the cache's ttl)
+        """
+        if self.max_entries <= 0:
+            return
+        expires_at = self._clock() + min(self.ttl, self.ttl if ttl is None else ttl)
+        with self._lock:
+            for key in keys:
+                self._entries[key] = expires_at
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all keys"""
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        """
+        Current size and counters.
+
+        Args:
+            reset: Start counting hits, misses and evictions from zero afterwards
+
+        Returns:
+            Dictionary with entries, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            snapshot = {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+            if reset:
+                self.hits = self.misses = self.evictions = 0
+        return snapshot